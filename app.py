@@ -9,16 +9,62 @@ import uuid
 from werkzeug.utils import secure_filename
 from pathlib import Path
 import json
+import threading
+import time
 import traceback
 
+from screening_jobs import ScreeningJobManager, DONE, FAILED
+from extractors import RESUME_EXTENSIONS
+import metrics
+
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
 # Configuration
 # Use /tmp for Vercel (serverless) or 'uploads' for local development
 UPLOAD_FOLDER = '/tmp/uploads' if os.environ.get('VERCEL') else 'uploads'
-ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt'}
+ALLOWED_EXTENSIONS = {ext.lstrip('.') for ext in RESUME_EXTENSIONS}
 MAX_FILE_SIZE = 4 * 1024 * 1024  # 4MB (Vercel limit is 4.5MB for serverless)
+# Bulk uploads: whole request body, and resumes accepted per request
+MAX_BULK_UPLOAD_SIZE = int(os.environ.get('MAX_BULK_UPLOAD_SIZE', 512 * 1024 * 1024))
+MAX_BULK_FILES = int(os.environ.get('MAX_BULK_FILES', 2000))
+# Threads parsing uploaded resumes in the background
+UPLOAD_PARSE_WORKERS = int(os.environ.get('UPLOAD_PARSE_WORKERS', 2))
+# Parsed resumes are cached by content hash so re-screening skips parsing
+PARSE_CACHE_PATH = os.environ.get(
+    'PARSE_CACHE_PATH',
+    os.path.join(UPLOAD_FOLDER, '.cache', 'parse_cache.sqlite')
+)
+# Compiled job profiles, reusable by ID across requests
+JOB_PROFILE_DIR = os.environ.get(
+    'JOB_PROFILE_DIR',
+    os.path.join(UPLOAD_FOLDER, '.cache', 'job_profiles')
+)
+# Optional JSON skill taxonomy (skill -> aliases) replacing the built-in list
+SKILL_TAXONOMY_PATH = os.environ.get('SKILL_TAXONOMY_PATH')
+# TF-IDF vectorizer saved by `main.py --fit-vectorizer`; scores reuse its vocabulary
+TFIDF_VECTORIZER_PATH = os.environ.get('TFIDF_VECTORIZER_PATH')
+# Optional per-resume extraction budgets so very long CVs cannot dominate latency
+MAX_RESUME_PAGES = int(os.environ['MAX_RESUME_PAGES']) if os.environ.get('MAX_RESUME_PAGES') else None
+MAX_RESUME_CHARS = int(os.environ['MAX_RESUME_CHARS']) if os.environ.get('MAX_RESUME_CHARS') else None
+# Dense semantic scorer replacing TF-IDF, e.g. "spacy:en_core_web_md" or
+# "onnx:/models/minilm-int8" (see embeddings.create_encoder)
+SEMANTIC_ENCODER = os.environ.get('SEMANTIC_ENCODER')
+# Keep candidate embeddings int8-quantized (4x less memory)
+EMBEDDING_QUANTIZE = os.environ.get('EMBEDDING_QUANTIZE', '').lower() in ('1', 'true', 'yes')
+# Candidate embeddings kept in memory before the oldest are evicted
+EMBEDDING_CACHE_SIZE = int(os.environ.get('EMBEDDING_CACHE_SIZE', 50000))
+# Match results are kept server-side for paging/export; idle sessions expire
+RESULT_SESSION_TTL = int(os.environ.get('RESULT_SESSION_TTL', 1800))
+MAX_RESULT_SESSIONS = int(os.environ.get('MAX_RESULT_SESSIONS', 200))
+# Background screening jobs processed concurrently
+SCREENING_WORKERS = int(os.environ.get('SCREENING_WORKERS', 2))
+# Add a Server-Timing header with per-stage durations to every API response
+# (otherwise only when a request passes ?timing=1)
+SERVER_TIMING = os.environ.get('SERVER_TIMING', '').lower() in ('1', 'true', 'yes')
+# Load NLP/ML backends at import time, e.g. in the gunicorn master with
+# --preload so forked workers share them instead of loading on first request
+PRELOAD_MODELS = os.environ.get('PRELOAD_MODELS', '').lower() in ('1', 'true', 'yes')
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
@@ -28,19 +74,302 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Initialize matcher (lazy loading)
 matcher = None
+_matcher_lock = threading.Lock()
+screening_jobs = None
+upload_store = None
+parse_pipeline = None
+result_sessions = None
 
 def get_matcher():
     """Lazy load matcher to avoid loading on startup."""
     global matcher
-    if matcher is None:
+    if matcher is not None:
+        return matcher
+    with _matcher_lock:
+        if matcher is not None:
+            return matcher
         try:
             from resume_matcher import ResumeMatcher
-            matcher = ResumeMatcher()
+            from parse_cache import ParseCache
+            from job_profiles import JobProfileStore
+            from skill_taxonomy import SkillTaxonomy
+            taxonomy = None
+            if SKILL_TAXONOMY_PATH:
+                taxonomy = SkillTaxonomy.from_file(SKILL_TAXONOMY_PATH)
+            semantic_scorer = None
+            if SEMANTIC_ENCODER:
+                from embeddings import EmbeddingScorer, create_encoder
+                semantic_scorer = EmbeddingScorer(
+                    create_encoder(SEMANTIC_ENCODER),
+                    quantize=EMBEDDING_QUANTIZE,
+                    max_entries=EMBEDDING_CACHE_SIZE
+                )
+            instance = ResumeMatcher(
+                parse_cache=ParseCache(PARSE_CACHE_PATH),
+                job_profiles=JobProfileStore(JOB_PROFILE_DIR),
+                taxonomy=taxonomy,
+                max_pages=MAX_RESUME_PAGES,
+                max_chars=MAX_RESUME_CHARS,
+                semantic_scorer=semantic_scorer
+            )
+            if TFIDF_VECTORIZER_PATH:
+                instance.load_vectorizer(TFIDF_VECTORIZER_PATH)
+            matcher = instance
         except Exception as e:
             app.logger.error(f'Error initializing matcher: {str(e)}')
             raise
     return matcher
 
+def preload_models():
+    """Import heavy backends and load the shared spaCy model (fork-safe)."""
+    from resume_matcher import warmup
+    timings = warmup()
+    print("Preloaded models: " + ', '.join(f"{k}={v:.2f}s" for k, v in timings.items()))
+
+if PRELOAD_MODELS:
+    preload_models()
+
+def get_screening_jobs():
+    """Lazy create the background screening job manager."""
+    global screening_jobs
+    with _matcher_lock:
+        if screening_jobs is None:
+            screening_jobs = ScreeningJobManager(
+                matcher_factory=get_matcher,
+                format_result=format_match_result,
+                load_candidates=load_candidates,
+                workers=SCREENING_WORKERS,
+                # Serverless instances freeze after the response is sent
+                synchronous=bool(os.environ.get('VERCEL'))
+            )
+    return screening_jobs
+
+def get_result_sessions():
+    """Lazy create the store of server-side result sessions."""
+    global result_sessions
+    with _matcher_lock:
+        if result_sessions is None:
+            from result_sessions import ResultSessionStore
+            result_sessions = ResultSessionStore(
+                ttl=RESULT_SESSION_TTL,
+                max_sessions=MAX_RESULT_SESSIONS
+            )
+    return result_sessions
+
+def get_upload_store():
+    """Lazy create the content-addressed store used by bulk uploads."""
+    global upload_store
+    with _matcher_lock:
+        if upload_store is None:
+            from bulk_upload import ContentStore
+            upload_store = ContentStore(app.config['UPLOAD_FOLDER'])
+    return upload_store
+
+def get_parse_pipeline():
+    """Lazy create the pipeline that parses uploads in the background."""
+    global parse_pipeline
+    if parse_pipeline is not None:
+        return parse_pipeline
+    instance = get_matcher()
+    with _matcher_lock:
+        if parse_pipeline is None:
+            from upload_pipeline import ParsePipeline
+            
+            def embed(records):
+                # Embed each upload once, right after it is parsed
+                instance.semantic_scorer.precompute(record['raw_text'] for record in records)
+            
+            parse_pipeline = ParsePipeline(
+                instance.parser,
+                workers=UPLOAD_PARSE_WORKERS,
+                # Serverless instances freeze after the response is sent
+                background=not os.environ.get('VERCEL'),
+                on_parsed=embed if instance.semantic_scorer is not None else None
+            )
+    return parse_pipeline
+
+def load_candidates(resume_paths):
+    """Precomputed candidate records for uploaded resumes, skipping failures."""
+    records = get_parse_pipeline().records([str(p) for p in resume_paths])
+    return [record for record in records if record is not None]
+
+def format_match_result(result):
+    """Format a ResumeMatcher result for the frontend."""
+    candidate_data = result.get('candidate_data', {})
+    return {
+        'name': result.get('name', 'Unknown'),
+        'email': result.get('email', ''),
+        'match_score': result.get('match_score', 0),
+        'skills_match': round(result.get('skills_match', 0) * 100, 1),
+        'skills': candidate_data.get('skills', []),
+        'experience': candidate_data.get('experience', '')[:300],
+        'education': candidate_data.get('education', '')[:200],
+        'filename': os.path.basename(result.get('file_path', ''))
+    }
+
+def parse_page_request(source):
+    """
+    Validate paging, sorting and filter options (query args or JSON body).
+    
+    Returns:
+        (options, None) on success or (None, (error_response, status)) on failure
+    """
+    from result_sessions import DEFAULT_PAGE_SIZE, SORT_KEYS
+    try:
+        options = {
+            'page': int(source.get('page', 1)),
+            'page_size': int(source.get('page_size', DEFAULT_PAGE_SIZE)),
+            'search': str(source.get('q', '') or ''),
+            'min_score': float(source.get('min_score', 0) or 0)
+        }
+    except (TypeError, ValueError):
+        return None, (jsonify({'error': 'page, page_size and min_score must be numbers'}), 400)
+    sort = source.get('sort', 'score') or 'score'
+    if sort not in SORT_KEYS:
+        return None, (jsonify({'error': f"sort must be one of {', '.join(SORT_KEYS)}"}), 400)
+    options['sort'] = sort
+    order = source.get('order')
+    if order not in (None, '', 'asc', 'desc'):
+        return None, (jsonify({'error': 'order must be asc or desc'}), 400)
+    options['descending'] = None if not order else order == 'desc'
+    return options, None
+
+def session_page(session, options):
+    """Response body for one page of a result session."""
+    page = session.page(**options)
+    return {
+        'result_session_id': session.id,
+        'results': page['results'],
+        'page': page['page'],
+        'page_size': page['page_size'],
+        'pages': page['pages'],
+        'total': page['total'],
+        'total_matched': len(session.results),
+        'stats': session.stats()
+    }
+
+# Default export layout of the web app (column -> CSV header)
+EXPORT_COLUMN_LABELS = {
+    'rank': 'Rank',
+    'name': 'Name',
+    'email': 'Email',
+    'match_score': 'Match Score (%)',
+    'skills_match': 'Skills Match (%)',
+    'skills_count': 'Skills Count',
+    'skills': 'Skills',
+    'experience_preview': 'Experience Preview',
+    'education_preview': 'Education Preview'
+}
+EXPORT_MIMETYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson', 'json': 'application/json'}
+
+def parse_export_request(source):
+    """
+    Validate export options: format (csv, jsonl or json) and columns.
+    
+    Returns:
+        ((format, columns), None) on success or (None, (error_response, status))
+    """
+    from exporters import parse_columns
+    fmt = source.get('format', 'csv') or 'csv'
+    if fmt not in EXPORT_MIMETYPES:
+        return None, (jsonify({'error': f"format must be one of {', '.join(EXPORT_MIMETYPES)}"}), 400)
+    columns = source.get('columns')
+    if isinstance(columns, list):
+        columns = ','.join(map(str, columns))
+    if not columns:
+        return (fmt, list(EXPORT_COLUMN_LABELS)), None
+    try:
+        return (fmt, parse_columns(columns)), None
+    except ValueError as e:
+        return None, (jsonify({'error': str(e)}), 400)
+
+def export_download(results, fmt, columns):
+    """Streaming export attachment, written row by row."""
+    from exporters import iter_csv, iter_export
+    filename = f'resume_matches_{uuid.uuid4().hex[:8]}.{fmt}'
+    if fmt == 'csv':
+        chunks = iter_csv(results, columns, labels=EXPORT_COLUMN_LABELS)
+    else:
+        chunks = iter_export(results, fmt, columns)
+    return Response(
+        chunks,
+        mimetype=EXPORT_MIMETYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+def parse_match_request(data):
+    """
+    Validate a match request body.
+    
+    Returns:
+        (params, None) on success or (None, (error_response, status)) on failure
+    """
+    job_description = data.get('job_description', '')
+    job_profile_id = data.get('job_profile_id')
+    filenames = data.get('filenames', [])
+    top_n = data.get('top_n', 10)
+    min_score = data.get('min_score', 0) / 100.0  # Convert to 0-1
+    
+    if not job_description and not job_profile_id:
+        return None, (jsonify({'error': 'Job description required'}), 400)
+    
+    weights, error = parse_weights(data)
+    if error:
+        return None, error
+    
+    if not filenames:
+        return None, (jsonify({'error': 'At least one resume required'}), 400)
+    
+    # Build full file paths
+    resume_paths = [
+        os.path.join(app.config['UPLOAD_FOLDER'], fname)
+        for fname in filenames
+        if os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], fname))
+    ]
+    
+    if not resume_paths:
+        return None, (jsonify({'error': 'No valid resume files found'}), 400)
+    
+    if job_profile_id:
+        job_description = get_matcher().get_job_profile(job_profile_id)
+        if job_description is None:
+            return None, (jsonify({'error': 'Job profile not found'}), 404)
+    
+    # Weights apply to this request only; stored profiles keep their own
+    return {
+        'job_description': job_description,
+        'resume_paths': resume_paths,
+        'top_n': top_n,
+        'min_score': min_score,
+        'weights': weights
+    }, None
+
+def parse_weights(data):
+    """
+    Validate optional score weights, e.g. {"skills": 0.5, "semantic": 0.5}.
+    
+    Keys are score component names (scoring.SCORERS); weights are relative.
+    
+    Returns:
+        (weights or None, None) on success or (None, (error_response, status))
+    """
+    from scoring import SCORERS, resolve_weights
+    weights = data.get('weights')
+    if weights is None:
+        return None, None
+    if not isinstance(weights, dict) or not all(
+        key in SCORERS and isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+        for key, value in weights.items()
+    ):
+        allowed = ', '.join(sorted(SCORERS))
+        return None, (jsonify({'error': f'weights must map {allowed} to non-negative numbers'}), 400)
+    weights = {key: float(value) for key, value in weights.items()}
+    try:
+        resolve_weights(weights)
+    except ValueError as e:
+        return None, (jsonify({'error': str(e)}), 400)
+    return weights, None
+
 def allowed_file(filename):
     """Check if file extension is allowed."""
     return '.' in filename and \
@@ -74,14 +403,73 @@ def upload_file():
         filename = f"{uuid.uuid4()}_{secure_filename(file.filename)}"
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
         file.save(filepath)
+        get_parse_pipeline().submit(filepath)
+        
+        # Quick preview from the top of the file; the full parse runs in the background
+        try:
+            contact = get_matcher().parser.parse_contact(filepath)
+            contact.pop('file_path', None)
+        except Exception as e:
+            app.logger.warning(f'Contact preview failed for {filename}: {str(e)}')
+            contact = None
         
         return jsonify({
             'success': True,
             'filename': filename,
+            'contact': contact,
             'message': 'File uploaded successfully'
         })
     
-    return jsonify({'error': 'Invalid file type. Allowed: PDF, DOCX, DOC, TXT'}), 400
+    allowed = ', '.join(sorted(ext.upper() for ext in ALLOWED_EXTENSIONS))
+    return jsonify({'error': f'Invalid file type. Allowed: {allowed}'}), 400
+
+@app.route('/api/upload/bulk', methods=['POST'])
+def upload_bulk():
+    """
+    Upload many resumes in one multipart request.
+    
+    Any number of "files" parts, each a resume or a ZIP/tar archive of
+    resumes. Parts are streamed to disk and deduplicated by content hash,
+    and each new resume is queued for parsing as soon as it is stored
+    (pass ?parse=0 to skip that).
+    """
+    from werkzeug.http import parse_options_header
+    from bulk_upload import BulkIngestor
+    
+    # Allow a larger body than single uploads (read incrementally, never buffered)
+    request.max_content_length = MAX_BULK_UPLOAD_SIZE
+    content_type, options = parse_options_header(request.headers.get('Content-Type', ''))
+    if content_type != 'multipart/form-data' or not options.get('boundary'):
+        return jsonify({'error': 'Content-Type must be multipart/form-data'}), 400
+    
+    parse_uploads = request.args.get('parse', '1').lower() not in ('0', 'false', 'no')
+    ingestor = BulkIngestor(
+        get_upload_store(),
+        ALLOWED_EXTENSIONS,
+        max_file_size=MAX_FILE_SIZE,
+        max_files=MAX_BULK_FILES,
+        on_stored=get_parse_pipeline().submit if parse_uploads else None
+    )
+    try:
+        report = ingestor.ingest_multipart(request.stream, options['boundary'])
+    except ValueError as e:
+        return jsonify({'error': f'Malformed upload: {str(e)}'}), 400
+    
+    if not report['files']:
+        return jsonify({
+            'error': 'No valid resume files found',
+            'skipped': report['skipped'],
+            'skipped_count': report['skipped_count']
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'files': report['files'],
+        'skipped': report['skipped'],
+        'skipped_count': report['skipped_count'],
+        'duplicates': sum(1 for f in report['files'] if f['duplicate']),
+        'parsing': parse_uploads
+    })
 
 @app.route('/api/parse-resume', methods=['POST'])
 def parse_resume():
@@ -105,9 +493,13 @@ def parse_resume():
             return jsonify({'error': 'File not found'}), 404
         
         try:
-            from resume_matcher import ResumeMatcher
-            matcher = get_matcher()
-            candidate = matcher.parser.parse_resume(filepath)
+            # Usually already parsed in the background after upload
+            pipeline = get_parse_pipeline()
+            candidate = pipeline.get(filepath)
+            if candidate is None:
+                error = pipeline.error(filepath)
+                message = f'Could not parse resume: {error}' if error else 'Could not parse resume'
+                return jsonify({'error': message}), 500
             
             # Return structured data
             return jsonify({
@@ -141,58 +533,46 @@ def match_candidates():
         data = request.get_json()
         if not data:
             return jsonify({'error': 'Invalid JSON data'}), 400
-            
-        job_description = data.get('job_description', '')
-        filenames = data.get('filenames', [])
-        top_n = data.get('top_n', 10)
-        min_score = data.get('min_score', 0) / 100.0  # Convert to 0-1
-        
-        if not job_description:
-            return jsonify({'error': 'Job description required'}), 400
         
-        if not filenames:
-            return jsonify({'error': 'At least one resume required'}), 400
-        
-        # Build full file paths
-        resume_paths = [
-            os.path.join(app.config['UPLOAD_FOLDER'], fname)
-            for fname in filenames
-            if os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], fname))
-        ]
-        
-        if not resume_paths:
-            return jsonify({'error': 'No valid resume files found'}), 400
+        params, error = parse_match_request(data)
+        if error:
+            return error
+        page_options, error = parse_page_request(data)
+        if error:
+            return error
         
         try:
-            from resume_matcher import ResumeMatcher
             matcher = get_matcher()
-            results = matcher.match_candidates(
-                job_description=job_description,
-                resume_paths=resume_paths,
-                top_n=top_n,
-                min_score=min_score
-            )
+            # Resumes were parsed on upload, so matching is scoring only
+            profile = matcher.compile_job(params['job_description'])
+            with metrics.timed('load_candidates'):
+                records = get_parse_pipeline().records(params['resume_paths'])
+            candidates = [record for record in records if record is not None]
+            # Resumes that could not be parsed are reported, not silently dropped
+            unparsed = [
+                os.path.basename(path)
+                for path, record in zip(params['resume_paths'], records)
+                if record is None
+            ]
+            with metrics.timed('rank'):
+                results = matcher.rank_candidates(
+                    profile,
+                    candidates,
+                    top_n=params['top_n'],
+                    min_score=params['min_score'],
+                    weights=params['weights']
+                )
             
-            # Format results for frontend
-            formatted_results = []
-            for result in results:
-                candidate_data = result.get('candidate_data', {})
-                formatted_results.append({
-                    'name': result.get('name', 'Unknown'),
-                    'email': result.get('email', ''),
-                    'match_score': result.get('match_score', 0),
-                    'skills_match': round(result.get('skills_match', 0) * 100, 1),
-                    'skills': candidate_data.get('skills', []),
-                    'experience': candidate_data.get('experience', '')[:300],
-                    'education': candidate_data.get('education', '')[:200],
-                    'filename': os.path.basename(result.get('file_path', ''))
+            # Keep the full ranking server-side and return the first page
+            with metrics.timed('serialize'):
+                session = get_result_sessions().create(
+                    [format_match_result(result) for result in results]
+                )
+                return jsonify({
+                    'success': True,
+                    **session_page(session, page_options),
+                    'unparsed': unparsed
                 })
-            
-            return jsonify({
-                'success': True,
-                'results': formatted_results,
-                'total_matched': len(formatted_results)
-            })
         except ImportError as e:
             return jsonify({'error': f'Module import error: {str(e)}'}), 500
         except Exception as e:
@@ -202,6 +582,136 @@ def match_candidates():
         app.logger.error(f'Request error: {str(e)}\n{traceback.format_exc()}')
         return jsonify({'error': f'Request error: {str(e)}'}), 500
 
+@app.route('/api/jobs', methods=['POST'])
+def create_screening_job():
+    """Queue an asynchronous match job; returns its ID immediately."""
+    try:
+        if not request.is_json:
+            return jsonify({'error': 'Content-Type must be application/json'}), 400
+        
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Invalid JSON data'}), 400
+        
+        params, error = parse_match_request(data)
+        if error:
+            return error
+        page_options, error = parse_page_request(data)
+        if error:
+            return error
+        
+        job = get_screening_jobs().submit(**params)
+        if job.status == DONE:
+            # Finished inline (serverless): return the first page right away
+            body = job_results_page(job, page_options)
+        else:
+            body = job.snapshot()
+        return jsonify({
+            'success': True,
+            **body,
+            'status_url': f'/api/jobs/{job.id}',
+            'results_url': f'/api/jobs/{job.id}/results',
+            'events_url': f'/api/jobs/{job.id}/events'
+        }), 202
+    except Exception as e:
+        app.logger.error(f'Job submit error: {str(e)}\n{traceback.format_exc()}')
+        return jsonify({'error': f'Error creating job: {str(e)}'}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_screening_job(job_id):
+    """Job status, progress and provisional top-N results."""
+    job = get_screening_jobs().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, **job.snapshot()})
+
+@app.route('/api/jobs/<job_id>/results', methods=['GET'])
+def get_screening_job_results(job_id):
+    """Final results of a finished job."""
+    job = get_screening_jobs().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if job.status == FAILED:
+        return jsonify({'error': f'Job failed: {job.error}'}), 500
+    if job.status != DONE:
+        return jsonify({'error': 'Job not finished', **job.snapshot()}), 409
+    page_options, error = parse_page_request(request.args)
+    if error:
+        return error
+    return jsonify({'success': True, **job_results_page(job, page_options)})
+
+def job_results_page(job, page_options):
+    """Status plus a page of a finished job's results, stored as a result session."""
+    # The job ID doubles as the result session ID
+    session = get_result_sessions().get_or_create(job.id, lambda: job.results)
+    body = job.snapshot()
+    # Superseded by the final results
+    body.pop('partial_results', None)
+    body.update(session_page(session, page_options))
+    return body
+
+@app.route('/api/results/<session_id>', methods=['GET'])
+def get_result_page(session_id):
+    """A page of stored results, e.g. ?page=2&page_size=50&sort=name&q=python&min_score=60."""
+    session = get_result_sessions().get(session_id)
+    if session is None:
+        return jsonify({'error': 'Result session not found or expired'}), 404
+    page_options, error = parse_page_request(request.args)
+    if error:
+        return error
+    try:
+        return jsonify({'success': True, **session_page(session, page_options)})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/results/<session_id>/export', methods=['GET'])
+def export_result_session(session_id):
+    """
+    Stream a stored result session, e.g. ?format=jsonl&columns=rank,name,email
+    (same q/min_score/sort options as paging).
+    """
+    session = get_result_sessions().get(session_id)
+    if session is None:
+        return jsonify({'error': 'Result session not found or expired'}), 404
+    return export_session(session, request.args)
+
+def export_session(session, source):
+    """Streamed export of a session's (filtered, sorted) results."""
+    page_options, error = parse_page_request(source)
+    if error:
+        return error
+    export_options, error = parse_export_request(source)
+    if error:
+        return error
+    page_options.pop('page')
+    page_options.pop('page_size')
+    return export_download(session.query(**page_options), *export_options)
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def stream_screening_job(job_id):
+    """Server-Sent Events stream of job snapshots until the job finishes."""
+    job = get_screening_jobs().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    def events():
+        revision = -1
+        while True:
+            finished = job.finished
+            if job.revision != revision:
+                revision = job.revision
+                payload = job.snapshot(include_results=finished)
+                yield f"event: {'done' if finished else 'progress'}\ndata: {json.dumps(payload)}\n\n"
+            if finished:
+                break
+            time.sleep(0.5)
+    
+    return Response(
+        events(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/delete-file', methods=['POST'])
 def delete_file():
     """Delete uploaded file."""
@@ -223,6 +733,8 @@ def delete_file():
         if os.path.exists(filepath):
             try:
                 os.remove(filepath)
+                if parse_pipeline is not None:
+                    parse_pipeline.discard(filepath)
                 return jsonify({'success': True, 'message': 'File deleted'})
             except Exception as e:
                 app.logger.error(f'Delete error: {str(e)}')
@@ -235,7 +747,13 @@ def delete_file():
 
 @app.route('/api/export', methods=['POST'])
 def export_results():
-    """Export results to CSV format."""
+    """
+    Export results to CSV format.
+    
+    With a result_session_id the export (CSV, or JSONL/JSON via 'format')
+    is streamed from the stored results; a posted 'results' list is still
+    accepted and returned as CSV inside JSON.
+    """
     try:
         if not request.is_json:
             return jsonify({'error': 'Content-Type must be application/json'}), 400
@@ -244,50 +762,103 @@ def export_results():
         if not data:
             return jsonify({'error': 'Invalid JSON data'}), 400
         
+        session_id = data.get('result_session_id')
+        if session_id:
+            session = get_result_sessions().get(session_id)
+            if session is None:
+                return jsonify({'error': 'Result session not found or expired'}), 404
+            return export_session(session, data)
+        
         results = data.get('results', [])
         
         if not results:
             return jsonify({'error': 'No results to export'}), 400
         
-        # Generate CSV
-        import csv
-        import io
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            'Rank', 'Name', 'Email', 'Match Score (%)', 'Skills Match (%)', 
-            'Skills Count', 'Skills', 'Experience Preview', 'Education Preview'
-        ])
-        
-        # Data rows
-        for i, result in enumerate(results, 1):
-            writer.writerow([
-                i,
-                result.get('name', 'Unknown'),
-                result.get('email', ''),
-                result.get('match_score', 0),
-                result.get('skills_match', 0),
-                len(result.get('skills', [])),
-                ', '.join(result.get('skills', [])),
-                result.get('experience', '')[:100],
-                result.get('education', '')[:100]
-            ])
-        
-        csv_string = output.getvalue()
-        output.close()
-        
+        from exporters import iter_csv
         return jsonify({
             'success': True,
-            'csv': csv_string,
+            'csv': ''.join(iter_csv(results, list(EXPORT_COLUMN_LABELS), labels=EXPORT_COLUMN_LABELS)),
             'filename': f'resume_matches_{uuid.uuid4().hex[:8]}.csv'
         })
     except Exception as e:
         app.logger.error(f'Export error: {str(e)}\n{traceback.format_exc()}')
         return jsonify({'error': f'Export error: {str(e)}'}), 500
 
+@app.route('/api/job-profiles', methods=['POST'])
+def create_job_profile():
+    """Compile a job description into a reusable profile."""
+    try:
+        if not request.is_json:
+            return jsonify({'error': 'Content-Type must be application/json'}), 400
+        
+        data = request.get_json()
+        if not data or not data.get('job_description'):
+            return jsonify({'error': 'Job description required'}), 400
+        
+        weights, error = parse_weights(data)
+        if error:
+            return error
+        
+        profile = get_matcher().compile_job(data['job_description'], weights=weights)
+        return jsonify({'success': True, **profile.summary()}), 201
+    except Exception as e:
+        app.logger.error(f'Job profile error: {str(e)}\n{traceback.format_exc()}')
+        return jsonify({'error': f'Error compiling job profile: {str(e)}'}), 500
+
+@app.route('/api/job-profiles/<profile_id>', methods=['GET'])
+def get_job_profile(profile_id):
+    """Return a compiled job profile's requirements and weights."""
+    profile = get_matcher().get_job_profile(profile_id)
+    if profile is None:
+        return jsonify({'error': 'Job profile not found'}), 404
+    return jsonify({'success': True, **profile.summary()})
+
+@app.before_request
+def start_timing():
+    """Start collecting stage timings for this request."""
+    request.start_time = time.perf_counter()
+    metrics.start_request_timing()
+
+@app.after_request
+def record_timing(response):
+    """Record request latency and optionally expose stage timings."""
+    timings = metrics.finish_request_timing()
+    start = getattr(request, 'start_time', None)
+    if start is not None and request.path.startswith('/api/'):
+        metrics.REGISTRY.observe(
+            'resume_matcher_http_request_seconds',
+            time.perf_counter() - start,
+            endpoint=request.endpoint or 'unknown',
+            method=request.method,
+            status=str(response.status_code)
+        )
+        if timings and (SERVER_TIMING or request.args.get('timing') == '1'):
+            response.headers['Server-Timing'] = metrics.server_timing_header(timings)
+    return response
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus metrics for this worker process."""
+    return Response(
+        metrics.REGISTRY.render_prometheus(),
+        mimetype='text/plain; version=0.0.4'
+    )
+
+@app.route('/api/warmup', methods=['GET', 'POST'])
+def warmup():
+    """Load models and run a tiny match so later requests skip cold-start work."""
+    try:
+        start = time.perf_counter()
+        timings = get_matcher().warmup()
+        return jsonify({
+            'success': True,
+            'timings_ms': {k: round(v * 1000, 1) for k, v in timings.items()},
+            'total_ms': round((time.perf_counter() - start) * 1000, 1)
+        })
+    except Exception as e:
+        app.logger.error(f'Warmup error: {str(e)}\n{traceback.format_exc()}')
+        return jsonify({'error': f'Warmup failed: {str(e)}'}), 500
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint."""
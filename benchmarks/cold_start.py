@@ -0,0 +1,158 @@
+"""
+Cold-start benchmark for the web app.
+
+Each sample runs in a fresh Python process (as on a new serverless
+instance or gunicorn worker) and measures module import time, the first
+and second /api/match requests, and the same first request after an
+explicit /api/warmup. Results are written as JSON so runs from different
+commits can be compared.
+
+Usage:
+    python benchmarks/cold_start.py --output cold.json
+    python benchmarks/cold_start.py --compare cold.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from corpus import JOB_DESCRIPTION, generate_corpus
+from run_benchmarks import ROOT_DIR, git_commit
+
+# Absolute changes below this (seconds) are process-startup noise
+NOISE_FLOOR_S = 0.05
+
+CHILD = r'''
+import json, os, sys, time
+sys.path.insert(0, os.environ['ROOT_DIR'])
+timings = {}
+
+start = time.perf_counter()
+import resume_matcher
+timings['import_resume_matcher_s'] = time.perf_counter() - start
+
+start = time.perf_counter()
+import app as web
+timings['import_app_s'] = time.perf_counter() - start
+
+web.app.config['UPLOAD_FOLDER'] = os.environ['CORPUS_DIR']
+client = web.app.test_client()
+body = {
+    'job_description': os.environ['JOB_DESCRIPTION'],
+    'filenames': json.loads(os.environ['FILENAMES'])
+}
+
+if os.environ.get('WARMUP'):
+    start = time.perf_counter()
+    assert client.post('/api/warmup').status_code == 200
+    timings['warmup_s'] = time.perf_counter() - start
+
+for label in ('first_request_s', 'second_request_s'):
+    start = time.perf_counter()
+    response = client.post('/api/match', json=body)
+    assert response.status_code == 200, response.get_json()
+    timings[label] = time.perf_counter() - start
+
+print(json.dumps(timings))
+'''
+
+
+def run_child(corpus_dir: str, filenames: List[str], warmup: bool) -> Dict[str, float]:
+    """Run one fresh-process sample and return its timings."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(
+            os.environ,
+            ROOT_DIR=ROOT_DIR,
+            CORPUS_DIR=corpus_dir,
+            FILENAMES=json.dumps(filenames),
+            JOB_DESCRIPTION=JOB_DESCRIPTION,
+            # Cold parse cache so every sample does the same work
+            PARSE_CACHE_PATH=os.path.join(cache_dir, 'parse_cache.sqlite')
+        )
+        env.pop('PRELOAD_MODELS', None)
+        if warmup:
+            env['WARMUP'] = '1'
+        start = time.perf_counter()
+        output = subprocess.check_output([sys.executable, '-c', CHILD], env=env, cwd=ROOT_DIR)
+        timings = json.loads(output.decode().strip().splitlines()[-1])
+        timings['process_total_s'] = time.perf_counter() - start
+        return timings
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Min and median of every measurement across samples."""
+    return {
+        key: {
+            'min_s': round(min(s[key] for s in samples), 4),
+            'median_s': round(statistics.median(s[key] for s in samples), 4)
+        }
+        for key in samples[0]
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> bool:
+    """Print relative changes of median timings; False if any regressed."""
+    ok = True
+    print(f"\nComparison with {baseline.get('commit', 'baseline')} (threshold {threshold}%)")
+    for mode in ('cold', 'warmed'):
+        for key, stats in current[mode].items():
+            old = baseline.get(mode, {}).get(key, {}).get('median_s')
+            if not old:
+                continue
+            new = stats['median_s']
+            change = 100.0 * (new - old) / old
+            regressed = change > threshold and new - old >= NOISE_FLOOR_S
+            ok = ok and not regressed
+            flag = '  REGRESSION' if regressed else ''
+            print(f"  {mode + '.' + key:<40} {old:>10} -> {new:<10} {change:+7.1f}%{flag}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold-start import and first-request time')
+    parser.add_argument('--count', type=int, default=20, help='Resumes matched per request (default: 20)')
+    parser.add_argument('--samples', type=int, default=3, help='Fresh processes per mode (default: 3)')
+    parser.add_argument('--output', type=str, help='Write results as JSON to this file')
+    parser.add_argument('--compare', type=str, help='Baseline JSON file to compare against')
+    parser.add_argument(
+        '--fail-threshold',
+        type=float,
+        default=20.0,
+        help='Percent slowdown versus the baseline treated as a regression (default: 20)'
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = generate_corpus(corpus_dir, args.count)
+        filenames = [os.path.basename(p) for p in paths]
+        print(f"Measuring cold start over {args.samples} fresh processes...")
+        results = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'resumes_per_request': len(filenames),
+            'cold': summarize([run_child(corpus_dir, filenames, False) for _ in range(args.samples)]),
+            'warmed': summarize([run_child(corpus_dir, filenames, True) for _ in range(args.samples)])
+        }
+
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.fail_threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+"""
+Synthetic resume corpus generator for benchmarks.
+
+Generates N resumes as TXT, DOCX and PDF (optionally RTF, HTML and ODT) with a realistic spread of sizes:
+most resumes are one or two pages, with a long tail of multi-page CVs.
+Generation is deterministic for a given seed.
+
+Usage:
+    python benchmarks/corpus.py --count 1000 --out bench_corpus/
+"""
+
+import argparse
+import os
+import random
+from typing import Dict, List
+
+FIRST_NAMES = [
+    'Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery',
+    'Priya', 'Wei', 'Carlos', 'Fatima', 'Olga', 'Kenji', 'Amara', 'Lucas'
+]
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Chen', 'Garcia', 'Patel', 'Kim', 'Nguyen', 'Silva',
+    'Müller', 'Okafor', 'Rossi', 'Kowalski', 'Haddad', 'Tanaka', 'Brown', 'Lee'
+]
+SKILLS = [
+    'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Django', 'Flask', 'SQL',
+    'PostgreSQL', 'MySQL', 'MongoDB', 'AWS', 'Docker', 'Kubernetes', 'Git',
+    'Linux', 'HTML', 'CSS', 'TypeScript', 'Angular', 'Vue', 'Machine Learning',
+    'Deep Learning', 'TensorFlow', 'PyTorch', 'Agile', 'Scrum', 'CI/CD',
+    'REST API', 'GraphQL', 'Microservices', 'Spark', 'Kafka', 'Terraform'
+]
+COMPANIES = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries',
+    'Wayne Enterprises', 'Hooli', 'Pied Piper', 'Vandelay Imports', 'Soylent'
+]
+TITLES = [
+    'Software Engineer', 'Senior Python Developer', 'Data Scientist',
+    'Backend Developer', 'Full Stack Developer', 'DevOps Engineer',
+    'Machine Learning Engineer', 'Platform Engineer'
+]
+DUTIES = [
+    'Designed and maintained {skill} services handling millions of requests per day',
+    'Led migration of legacy systems to {skill} with zero downtime',
+    'Built data pipelines using {skill} and improved throughput by {pct}%',
+    'Mentored junior engineers and introduced {skill} best practices',
+    'Optimized {skill} queries, reducing latency by {pct}%',
+    'Implemented automated testing and {skill} workflows across teams',
+    'Collaborated with product managers to deliver {skill} features on schedule'
+]
+DEGREES = [
+    'Bachelor of Science in Computer Science',
+    'Master of Science in Software Engineering',
+    'PhD in Machine Learning',
+    'Bachelor of Engineering in Electrical Engineering'
+]
+PUBLICATION_TOPICS = [
+    'scalable inference', 'distributed training', 'query optimization',
+    'graph neural networks', 'information retrieval', 'program synthesis'
+]
+
+JOB_DESCRIPTION = """
+Senior Python Developer
+
+We are looking for an experienced Python Developer to join our platform team.
+
+Requirements:
+- 5+ years of Python development experience
+- Experience with Django or Flask frameworks
+- Knowledge of REST APIs and microservices
+- Database experience (PostgreSQL preferred)
+- Docker, Kubernetes and AWS in production
+- Familiarity with Git, CI/CD and Agile practices
+
+Education: Bachelor's degree in Computer Science or related field
+"""
+
+
+def resume_size(rng: random.Random) -> int:
+    """Number of past positions; log-normal so a few CVs are very long."""
+    return max(1, min(60, int(rng.lognormvariate(1.1, 0.7))))
+
+
+def generate_resume(rng: random.Random, index: int) -> Dict:
+    """Generate one synthetic resume as a title plus list of lines."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = rng.sample(SKILLS, rng.randint(4, 14))
+    positions = resume_size(rng)
+    years = rng.randint(1, 25)
+
+    lines = [
+        name,
+        f"Email: {name.lower().replace(' ', '.')}{index}@example.com",
+        f"Phone: ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        '',
+        'PROFESSIONAL SUMMARY',
+        f"Software professional with {years} years of experience in {', '.join(skills[:3])}.",
+        '',
+        'TECHNICAL SKILLS',
+        ', '.join(skills),
+        '',
+        'WORK EXPERIENCE',
+    ]
+    end_year = 2026
+    for _ in range(positions):
+        start_year = end_year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(TITLES)} | {rng.choice(COMPANIES)} | {start_year} - {end_year}")
+        for _ in range(rng.randint(2, 6)):
+            lines.append('- ' + rng.choice(DUTIES).format(
+                skill=rng.choice(skills), pct=rng.randint(10, 80)
+            ))
+        lines.append('')
+        end_year = start_year
+
+    lines += ['EDUCATION', rng.choice(DEGREES), f"University of Example | {end_year}", '']
+
+    # Academic CVs: long publication lists
+    if positions > 12:
+        lines.append('PUBLICATIONS')
+        for i in range(positions * 3):
+            lines.append(
+                f"[{i + 1}] {name.split()[-1]} et al. On {rng.choice(PUBLICATION_TOPICS)}. "
+                f"Proceedings of Example Conference, {rng.randint(2000, 2026)}."
+            )
+
+    return {'name': name, 'lines': lines}
+
+
+def write_txt(path: str, lines: List[str]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+
+def write_docx(path: str, lines: List[str]) -> None:
+    from docx import Document
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def write_pdf(path: str, lines: List[str], lines_per_page: int = 48) -> None:
+    """Write a minimal text-only PDF (Helvetica, one text object per page)."""
+
+    def escape(line: str) -> str:
+        line = line.encode('latin-1', 'replace').decode('latin-1')
+        return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        (
+            '<< /Type /Pages /Kids [' +
+            ' '.join(f'{4 + 2 * i} 0 R' for i in range(len(pages))) +
+            f'] /Count {len(pages)} >>'
+        ).encode(),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, page in enumerate(pages):
+        content = (
+            'BT /F1 10 Tf 14 TL 50 780 Td ' +
+            ' '.join(f'({escape(line)}) Tj T*' for line in page) +
+            ' ET'
+        ).encode('latin-1')
+        objects.append((
+            '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>'
+        ).encode())
+        objects.append(
+            f'<< /Length {len(content)} >>\nstream\n'.encode() + content + b'\nendstream'
+        )
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n'.encode() + body + b'\nendobj\n'
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    for offset in offsets:
+        out += f'{offset:010d} 00000 n \n'.encode()
+    out += (
+        f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+        f'startxref\n{xref}\n%%EOF\n'
+    ).encode()
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+def write_rtf(path: str, lines: List[str]) -> None:
+    def escape(line: str) -> str:
+        line = line.replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}')
+        return ''.join(c if ord(c) < 128 else f'\\u{ord(c)}?' for c in line)
+
+    body = ''.join(f'{escape(line)}\\par\n' for line in lines)
+    with open(path, 'w', encoding='ascii') as f:
+        f.write('{\\rtf1\\ansi\\ansicpg1252\\deff0{\\fonttbl{\\f0 Helvetica;}}\\f0\\fs20\n' + body + '}')
+
+
+def write_html(path: str, lines: List[str]) -> None:
+    from html import escape
+    body = '\n'.join(f'<p>{escape(line)}</p>' for line in lines)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Resume</title>'
+            '<style>p { margin: 0; }</style></head>\n'
+            f'<body>\n{body}\n</body></html>\n'
+        )
+
+
+def write_odt(path: str, lines: List[str]) -> None:
+    """Write a minimal OpenDocument text file (one paragraph per line)."""
+    import zipfile
+    from xml.sax.saxutils import escape
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<office:document-content '
+        'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+        'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" office:version="1.2">'
+        '<office:body><office:text>' +
+        ''.join(f'<text:p>{escape(line)}</text:p>' for line in lines) +
+        '</office:text></office:body></office:document-content>'
+    )
+    manifest = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" '
+        'manifest:version="1.2">'
+        '<manifest:file-entry manifest:full-path="/" '
+        'manifest:media-type="application/vnd.oasis.opendocument.text"/>'
+        '<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>'
+        '</manifest:manifest>'
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        # The mimetype entry must come first, uncompressed
+        archive.writestr('mimetype', 'application/vnd.oasis.opendocument.text', zipfile.ZIP_STORED)
+        archive.writestr('META-INF/manifest.xml', manifest)
+        archive.writestr('content.xml', content)
+
+
+WRITERS = {
+    'txt': write_txt,
+    'docx': write_docx,
+    'pdf': write_pdf,
+    'rtf': write_rtf,
+    'html': write_html,
+    'odt': write_odt
+}
+
+
+def generate_corpus(
+    out_dir: str,
+    count: int,
+    formats: List[str] = ('txt', 'docx', 'pdf'),
+    seed: int = 42
+) -> List[str]:
+    """
+    Write count resumes to out_dir, cycling through formats.
+
+    Returns:
+        Paths of the generated files
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        resume = generate_resume(rng, i)
+        path = os.path.join(out_dir, f'resume_{i:06d}.{fmt}')
+        WRITERS[fmt](path, resume['lines'])
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic resume corpus')
+    parser.add_argument('--count', type=int, default=300, help='Number of resumes (default: 300)')
+    parser.add_argument('--out', type=str, required=True, help='Output directory')
+    parser.add_argument(
+        '--formats',
+        type=str,
+        default='txt,docx,pdf',
+        help='Comma-separated formats to cycle through: txt, docx, pdf, rtf, html, odt '
+             '(default: txt,docx,pdf)'
+    )
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.out, args.count, args.formats.split(','), args.seed)
+    with open(os.path.join(args.out, 'job_description.txt'), 'w', encoding='utf-8') as f:
+        f.write(JOB_DESCRIPTION)
+    print(f"Generated {len(paths)} resumes in {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+"""
+Benchmark suite for the resume matching pipeline.
+
+Times each stage of ResumeParser, JobAnalyzer and ResumeMatcher on a
+synthetic corpus (see corpus.py) and reports throughput, p50/p95 latency
+and peak RSS. Results are written as JSON so runs from different commits
+can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py --count 300 --output bench.json
+    python benchmarks/run_benchmarks.py --corpus bench_corpus/ --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# Make the project root importable when run as a script
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from corpus import JOB_DESCRIPTION, generate_corpus  # noqa: E402
+from extractors import RESUME_EXTENSIONS, backends_for, detect_format  # noqa: E402
+from resume_matcher import ResumeMatcher, ResumeSections  # noqa: E402
+
+# Per-resume latencies below this (ms) are timer noise, never regressions
+NOISE_FLOOR_MS = 0.05
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float]) -> Dict:
+    """Latency summary in milliseconds for per-resume samples (seconds)."""
+    total = sum(samples)
+    return {
+        'count': len(samples),
+        'total_s': round(total, 4),
+        'mean_ms': round(1000 * total / len(samples), 3) if samples else 0.0,
+        'p50_ms': round(1000 * percentile(samples, 50), 3),
+        'p95_ms': round(1000 * percentile(samples, 95), 3),
+        'throughput_per_s': round(len(samples) / total, 2) if total else None
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT_DIR,
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def bench_parsing(matcher: ResumeMatcher, paths: List[str]) -> Dict:
+    """Per-resume timings for extraction, NLP, skills and other fields."""
+    parser = matcher.parser
+    stages = {'extraction': [], 'nlp': [], 'skills': [], 'fields': [], 'parse_total': []}
+    by_format: Dict[str, List[float]] = {}
+
+    for path in paths:
+        start = time.perf_counter()
+        text, stream = parser._extract(path)
+        t_extract = time.perf_counter()
+        doc = parser.analyze_text(text)
+        t_nlp = time.perf_counter()
+        parser._extract_skills(text, doc)
+        t_skills = time.perf_counter()
+        sections = ResumeSections(text)
+        parser._extract_name(text, sections)
+        parser._extract_email(text, sections)
+        parser._extract_phone(text, sections)
+        parser._extract_experience(text, sections)
+        parser._extract_education(text, sections)
+        parser._extract_keywords(text, doc)
+        end = time.perf_counter()
+
+        stages['extraction'].append(t_extract - start)
+        stages['nlp'].append(t_nlp - t_extract)
+        stages['skills'].append(t_skills - t_nlp)
+        stages['fields'].append(end - t_skills)
+        stages['parse_total'].append(end - start)
+        by_format.setdefault(f'{stream.format}/{stream.backend}', []).append(t_extract - start)
+
+    result = {name: summarize(samples) for name, samples in stages.items()}
+    # Keyed by detected format and the backend that read it
+    result['extraction_by_format'] = {
+        key: summarize(samples) for key, samples in sorted(by_format.items())
+    }
+    return result
+
+
+def bench_extraction_backends(paths: List[str]) -> Dict:
+    """Full-document extraction time of every installed backend, per format."""
+    samples: Dict[str, List[float]] = {}
+    failures: Dict[str, int] = {}
+    for path in paths:
+        fmt = detect_format(path)
+        for backend in backends_for(fmt):
+            key = f'{fmt}/{backend.name}'
+            start = time.perf_counter()
+            try:
+                for _ in backend.extract(path, None):
+                    pass
+            except Exception:
+                failures[key] = failures.get(key, 0) + 1
+                continue
+            samples.setdefault(key, []).append(time.perf_counter() - start)
+    return {
+        key: dict(summarize(samples.get(key, [])), failures=failures.get(key, 0))
+        for key in sorted(set(samples) | set(failures))
+    }
+
+
+def bench_matching(matcher: ResumeMatcher, paths: List[str], repeats: int) -> Dict:
+    """Pool-level timings: job analysis, vectorization, scoring, end to end."""
+    job_times, vector_times, scoring_times, e2e_times = [], [], [], []
+    candidates = matcher.parse_resumes(paths)
+    texts = [JOB_DESCRIPTION] + [c['raw_text'] for c in candidates]
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        job_data = matcher.job_analyzer.analyze_job(JOB_DESCRIPTION)
+        job_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matcher._build_vectorizer().fit_transform(texts)
+        vector_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matcher.rank_candidates(job_data, candidates, top_n=10)
+        scoring_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matcher.match_candidates(JOB_DESCRIPTION, paths, top_n=10)
+        e2e_times.append(time.perf_counter() - start)
+
+    e2e = min(e2e_times)
+    return {
+        'pool_size': len(candidates),
+        'job_analysis_ms': round(1000 * min(job_times), 3),
+        'vectorization_s': round(min(vector_times), 4),
+        'scoring_s': round(min(scoring_times), 4),
+        'end_to_end_s': round(e2e, 4),
+        'end_to_end_resumes_per_s': round(len(paths) / e2e, 2) if e2e else None
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> bool:
+    """Print relative changes versus a baseline; False if any regressed."""
+    ok = True
+    print(f"\nComparison with {baseline.get('commit', 'baseline')} (threshold {threshold}%)")
+
+    def check(label: str, new, old, higher_is_better: bool = False, floor: float = 0.0):
+        nonlocal ok
+        if not old or new is None:
+            return
+        change = 100.0 * (new - old) / old
+        regressed = change < -threshold if higher_is_better else change > threshold
+        regressed = regressed and max(new, old) >= floor
+        ok = ok and not regressed
+        flag = '  REGRESSION' if regressed else ''
+        print(f"  {label:<40} {old:>12} -> {new:<12} {change:+7.1f}%{flag}")
+
+    for stage, stats in current['parsing'].items():
+        old = baseline.get('parsing', {}).get(stage)
+        if old and 'p50_ms' in stats:
+            check(f'parsing.{stage}.p50_ms', stats['p50_ms'], old.get('p50_ms'), floor=NOISE_FLOOR_MS)
+            check(f'parsing.{stage}.p95_ms', stats['p95_ms'], old.get('p95_ms'), floor=NOISE_FLOOR_MS)
+    for key, stats in current.get('extraction_backends', {}).items():
+        old = baseline.get('extraction_backends', {}).get(key)
+        if old:
+            check(f'extraction.{key}.p50_ms', stats['p50_ms'], old.get('p50_ms'), floor=NOISE_FLOOR_MS)
+    for key, value in current['matching'].items():
+        old = baseline.get('matching', {}).get(key)
+        if key != 'pool_size':
+            check(f'matching.{key}', value, old, higher_is_better=key.endswith('per_s'))
+    check('peak_rss_mb', current['peak_rss_mb'], baseline.get('peak_rss_mb'))
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the resume matching pipeline')
+    parser.add_argument('--corpus', type=str, help='Existing directory of resumes to benchmark')
+    parser.add_argument('--count', type=int, default=300, help='Synthetic resumes to generate (default: 300)')
+    parser.add_argument('--formats', type=str, default='txt,docx,pdf', help='Formats for generated resumes')
+    parser.add_argument('--seed', type=int, default=42, help='Corpus random seed (default: 42)')
+    parser.add_argument('--repeats', type=int, default=3, help='Repeats for pool-level timings (default: 3)')
+    parser.add_argument('--output', type=str, help='Write results as JSON to this file')
+    parser.add_argument('--compare', type=str, help='Baseline JSON file to compare against')
+    parser.add_argument(
+        '--fail-threshold',
+        type=float,
+        default=20.0,
+        help='Percent slowdown versus the baseline treated as a regression (default: 20)'
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.corpus:
+            paths = sorted(
+                os.path.join(args.corpus, name)
+                for name in os.listdir(args.corpus)
+                if name.lower().endswith(RESUME_EXTENSIONS)
+            )
+        else:
+            print(f"Generating {args.count} synthetic resumes...")
+            paths = generate_corpus(tmp_dir, args.count, args.formats.split(','), args.seed)
+
+        start = time.perf_counter()
+        matcher = ResumeMatcher()
+        init_s = time.perf_counter() - start
+
+        print(f"Benchmarking {len(paths)} resumes...")
+        results = {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'spacy_model': matcher.parser.nlp is not None,
+            'corpus': {
+                'source': args.corpus or 'synthetic',
+                'count': len(paths),
+                'bytes': sum(os.path.getsize(p) for p in paths),
+                'seed': None if args.corpus else args.seed
+            },
+            'matcher_init_s': round(init_s, 4),
+            'parsing': bench_parsing(matcher, paths),
+            'extraction_backends': bench_extraction_backends(paths),
+            'matching': bench_matching(matcher, paths, args.repeats),
+            'peak_rss_mb': peak_rss_mb()
+        }
+
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.fail_threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
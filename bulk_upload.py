@@ -0,0 +1,346 @@
+"""
+Bulk resume ingestion.
+
+Accepts many resumes in one multipart request, including ZIP and tar
+archives of resumes. The request body is decoded incrementally, so each
+part is streamed straight to disk (hashing as it goes) instead of being
+buffered in memory. Files are stored content-addressed, so the same resume
+uploaded twice is kept once.
+"""
+
+import hashlib
+import os
+import re
+import tarfile
+import tempfile
+import threading
+import zipfile
+from typing import Callable, Dict, List, Optional, Tuple
+
+from werkzeug.sansio.multipart import Data, Epilogue, File, MultipartDecoder, NeedData
+from werkzeug.utils import secure_filename
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2')
+READ_BLOCK_SIZE = 64 * 1024
+# Stored names are "<first 32 hex chars of the SHA-256>_<original name>"
+HASH_PREFIX_LENGTH = 32
+STORED_NAME_PATTERN = re.compile(r'^([0-9a-f]{%d})_' % HASH_PREFIX_LENGTH)
+# Skipped files listed in a report; the rest are only counted
+MAX_SKIPPED_LISTED = 100
+
+
+class FileTooLarge(ValueError):
+    """A single uploaded (or extracted) file exceeded the size limit."""
+
+
+class _ExtractionLimit(Exception):
+    """An archive (or the request) reached its uncompressed size limit."""
+
+
+def is_archive(filename: str) -> bool:
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+class ContentStore:
+    """Content-addressed resume files in the upload folder."""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self._lock = threading.Lock()
+        self._by_hash: Optional[Dict[str, str]] = None
+        os.makedirs(folder, exist_ok=True)
+
+    def begin(self, original_name: str, max_size: Optional[int] = None) -> 'StoredUpload':
+        """Start writing one file; call write() then commit() or abort()."""
+        return StoredUpload(self, original_name, max_size)
+
+    def lookup(self, digest: str) -> Optional[str]:
+        """Stored filename for a content hash, if it is still on disk."""
+        with self._lock:
+            if self._by_hash is None:
+                self._by_hash = {}
+                for name in os.listdir(self.folder):
+                    match = STORED_NAME_PATTERN.match(name)
+                    if match:
+                        self._by_hash[match.group(1)] = name
+            name = self._by_hash.get(digest[:HASH_PREFIX_LENGTH])
+            if name is not None and not os.path.exists(os.path.join(self.folder, name)):
+                # Deleted since it was indexed
+                del self._by_hash[digest[:HASH_PREFIX_LENGTH]]
+                name = None
+            return name
+
+    def _commit(self, tmp_path: str, digest: str, original_name: str) -> Tuple[str, bool]:
+        existing = self.lookup(digest)
+        if existing is not None:
+            os.remove(tmp_path)
+            return existing, True
+        safe_name = secure_filename(os.path.basename(original_name)) or 'resume'
+        name = f"{digest[:HASH_PREFIX_LENGTH]}_{safe_name}"
+        os.replace(tmp_path, os.path.join(self.folder, name))
+        with self._lock:
+            self._by_hash[digest[:HASH_PREFIX_LENGTH]] = name
+        return name, False
+
+
+class StoredUpload:
+    """One file being streamed into a ContentStore."""
+
+    def __init__(self, store: ContentStore, original_name: str, max_size: Optional[int]):
+        self.store = store
+        self.original_name = original_name
+        self.max_size = max_size
+        self.size = 0
+        self._digest = hashlib.sha256()
+        fd, self._tmp_path = tempfile.mkstemp(prefix='.upload-', dir=store.folder)
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            self.abort()
+            raise FileTooLarge(f"{self.original_name} exceeds {self.max_size} bytes")
+        self._digest.update(data)
+        self._file.write(data)
+
+    def commit(self) -> Dict:
+        """Finish the file and return its upload record."""
+        self._file.close()
+        digest = self._digest.hexdigest()
+        filename, duplicate = self.store._commit(self._tmp_path, digest, self.original_name)
+        return {
+            'filename': filename,
+            'original_name': self.original_name,
+            'size': self.size,
+            'sha256': digest,
+            'duplicate': duplicate
+        }
+
+    def abort(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class BulkIngestor:
+    """Streams multipart uploads and archives of resumes into a ContentStore."""
+
+    def __init__(
+        self,
+        store: ContentStore,
+        allowed_extensions,
+        max_file_size: int,
+        max_files: int = 2000,
+        max_extracted_bytes: int = 512 * 1024 * 1024,
+        max_archive_bytes: int = 256 * 1024 * 1024,
+        on_stored: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Args:
+            store: Where resumes are written
+            allowed_extensions: Resume extensions accepted (without dots)
+            max_file_size: Size limit for each resume
+            max_files: Maximum resumes accepted per request
+            max_extracted_bytes: Total bytes extracted from archives per
+                request (guards against ZIP bombs)
+            max_archive_bytes: Bytes extracted from any one archive; each
+                member is also limited to max_file_size, checked against its
+                declared size before it is decompressed
+            on_stored: Called with the path of each newly stored resume,
+                e.g. to start parsing it right away
+        """
+        self.store = store
+        self.allowed_extensions = {ext.lower() for ext in allowed_extensions}
+        self.max_file_size = max_file_size
+        self.max_files = max_files
+        self.max_extracted_bytes = max_extracted_bytes
+        self.max_archive_bytes = max_archive_bytes
+        self.on_stored = on_stored
+        self.files: List[Dict] = []
+        # The first MAX_SKIPPED_LISTED skipped files; skipped_count has them all
+        self.skipped: List[Dict] = []
+        self.skipped_count = 0
+        self._extracted = 0
+        self._archive_extracted = 0
+
+    def ingest_multipart(self, stream, boundary: str) -> Dict:
+        """
+        Decode a multipart/form-data body from a stream, storing every file part.
+
+        Returns:
+            {'files': [...], 'skipped': [...], 'skipped_count': n}, where
+            skipped lists at most MAX_SKIPPED_LISTED of the skipped files
+        """
+        decoder = MultipartDecoder(boundary.encode('latin-1'), max_parts=self.max_files + 100)
+        current = None
+        archive = None
+        skip_part = False
+        done = False
+
+        while not done:
+            chunk = stream.read(READ_BLOCK_SIZE)
+            decoder.receive_data(chunk or None)
+            event = decoder.next_event()
+            while not isinstance(event, NeedData):
+                if isinstance(event, File):
+                    current, archive, skip_part = self._start_part(event.filename)
+                elif isinstance(event, Data) and (current is not None or archive is not None):
+                    try:
+                        (current or archive).write(event.data)
+                    except FileTooLarge as e:
+                        self._skip(_part_name(current, archive), str(e))
+                        current = archive = None
+                        skip_part = True
+                    if not event.more_data and not skip_part:
+                        if current is not None:
+                            self._stored(current.commit())
+                        else:
+                            self._ingest_archive_file(archive)
+                        current = archive = None
+                elif isinstance(event, Epilogue):
+                    done = True
+                    break
+                event = decoder.next_event()
+            if not chunk:
+                break
+
+        for pending in (current, archive):
+            if pending is not None:
+                pending.abort()
+        return {'files': self.files, 'skipped': self.skipped, 'skipped_count': self.skipped_count}
+
+    def _start_part(self, filename: str):
+        """Return (resume writer, archive writer, skip) for a new file part."""
+        name = os.path.basename(filename or '')
+        if not name:
+            return None, None, True
+        if is_archive(name):
+            return None, _TempArchive(name, self.store.folder), False
+        if not self._accept(name):
+            return None, None, True
+        return self.store.begin(name, self.max_file_size), None, False
+
+    def _accept(self, name: str) -> bool:
+        ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+        if ext not in self.allowed_extensions:
+            self._skip(name, 'unsupported file type')
+            return False
+        if len(self.files) >= self.max_files:
+            self._skip(name, f'more than {self.max_files} files')
+            return False
+        return True
+
+    def _skip(self, name: str, reason: str) -> None:
+        self.skipped_count += 1
+        if len(self.skipped) < MAX_SKIPPED_LISTED:
+            self.skipped.append({'name': name, 'reason': reason})
+
+    def _stored(self, record: Dict) -> None:
+        self.files.append(record)
+        if self.on_stored is not None and not record['duplicate']:
+            self.on_stored(os.path.join(self.store.folder, record['filename']))
+
+    def _ingest_archive_file(self, archive: '_TempArchive') -> None:
+        try:
+            archive.close()
+            self.ingest_archive(archive.path, archive.name)
+        finally:
+            archive.abort()
+
+    def ingest_archive(self, path: str, name: str) -> None:
+        """
+        Store every resume inside a ZIP or tar archive, streaming each member.
+        
+        Extraction stops at the first member that would take the archive
+        past max_archive_bytes (or the request past max_extracted_bytes);
+        the rest of the archive is skipped.
+        """
+        self._archive_extracted = 0
+        try:
+            if zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as zf:
+                    for info in zf.infolist():
+                        if not info.is_dir():
+                            self._ingest_member(info.filename, info.file_size, lambda info=info: zf.open(info))
+            else:
+                with tarfile.open(path, 'r:*') as tf:
+                    for member in tf:
+                        if member.isfile():
+                            self._ingest_member(
+                                member.name, member.size, lambda member=member: tf.extractfile(member)
+                            )
+        except _ExtractionLimit as e:
+            self._skip(name, str(e))
+        except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+            print(f"Error reading archive {name}: {e}")
+            self._skip(name, 'unreadable archive')
+
+    def _ingest_member(self, member_name: str, declared_size: int, open_member: Callable) -> None:
+        name = os.path.basename(member_name)
+        # Skip macOS resource forks and hidden files
+        if not name or name.startswith('.') or '__MACOSX' in member_name:
+            return
+        if not self._accept(name):
+            return
+        if declared_size > self.max_file_size:
+            self._skip(name, f"{name} exceeds {self.max_file_size} bytes")
+            return
+        self._check_extraction_limits(declared_size)
+        upload = self.store.begin(name, self.max_file_size)
+        try:
+            with open_member() as member:
+                for block in iter(lambda: member.read(READ_BLOCK_SIZE), b''):
+                    # Declared sizes can lie, so the actual bytes are counted too
+                    try:
+                        self._check_extraction_limits(len(block))
+                    except _ExtractionLimit:
+                        upload.abort()
+                        raise
+                    self._extracted += len(block)
+                    self._archive_extracted += len(block)
+                    upload.write(block)
+        except FileTooLarge as e:
+            self._skip(name, str(e))
+            return
+        except _ExtractionLimit:
+            raise
+        except Exception as e:
+            upload.abort()
+            self._skip(name, f'could not extract: {e}')
+            return
+        self._stored(upload.commit())
+
+    def _check_extraction_limits(self, size: int) -> None:
+        """Raise _ExtractionLimit if extracting size more bytes would exceed a limit."""
+        if self._archive_extracted + size > self.max_archive_bytes:
+            raise _ExtractionLimit(f'archive extraction limit of {self.max_archive_bytes} bytes reached')
+        if self._extracted + size > self.max_extracted_bytes:
+            raise _ExtractionLimit(f'extraction limit of {self.max_extracted_bytes} bytes per request reached')
+
+
+class _TempArchive:
+    """An uploaded archive spooled to a temporary file before extraction."""
+
+    def __init__(self, name: str, folder: str):
+        self.name = name
+        fd, self.path = tempfile.mkstemp(prefix='.archive-', dir=folder)
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def abort(self) -> None:
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _part_name(current: Optional[StoredUpload], archive: Optional[_TempArchive]) -> str:
+    if current is not None:
+        return current.original_name
+    return archive.name if archive is not None else ''
@@ -0,0 +1,188 @@
+"""
+Persistent candidate index for sub-linear job-to-candidate retrieval.
+
+Parsed resumes are indexed by their normalized skills and TF-IDF terms.
+Both are kept as sparse candidate-by-feature matrices in CSC layout, whose
+columns are exactly the postings lists of an inverted index: looking up a
+job's terms only touches the candidates that contain them. Retrieval picks
+the best few thousand candidate IDs by weighted term/skill overlap, which
+are then reranked with the full ResumeMatcher scoring (see
+ResumeMatcher.match_store). Only the postings are kept; the records
+themselves stay wherever the IDs point (e.g. CandidateStore rows).
+"""
+
+import json
+import os
+from typing import Dict, Hashable, Iterable, List
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+INDEX_FILE = 'index.json'
+CANDIDATES_FILE = 'candidates.jsonl'
+
+
+class CandidateIndex:
+    """Inverted index from skills and terms to candidate IDs."""
+
+    def __init__(self):
+        self.term_vocabulary: Dict[str, int] = {}
+        self.skill_vocabulary: Dict[str, int] = {}
+        self._doc_terms: Dict[Hashable, List[int]] = {}
+        self._doc_skills: Dict[Hashable, List[int]] = {}
+        self._analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+        self._ids: List[Hashable] = []
+        self._terms = None
+        self._skills = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, candidate_id: Hashable) -> bool:
+        return candidate_id in self._doc_terms
+
+    def add(self, candidate_id: Hashable, record: Dict) -> None:
+        """Index (or re-index) a parsed resume's raw_text and skills under candidate_id."""
+        self._doc_terms[candidate_id] = self._ids_for(
+            self.term_vocabulary, set(self._analyzer(record.get('raw_text', '')))
+        )
+        self._doc_skills[candidate_id] = self._ids_for(
+            self.skill_vocabulary, {s.lower() for s in record.get('skills', [])}
+        )
+        self._invalidate()
+
+    def remove(self, candidate_id: Hashable) -> None:
+        """Drop a candidate from the index (no-op if absent)."""
+        if self._doc_terms.pop(candidate_id, None) is not None:
+            del self._doc_skills[candidate_id]
+            self._invalidate()
+
+    def remap(self, mapping: Dict[Hashable, Hashable]) -> None:
+        """Rename candidates (old ID -> new ID); IDs not in mapping are dropped."""
+        self._doc_terms = {mapping[c]: t for c, t in self._doc_terms.items() if c in mapping}
+        self._doc_skills = {mapping[c]: s for c, s in self._doc_skills.items() if c in mapping}
+        self._invalidate()
+
+    def candidates_with_skill(self, skill: str) -> List[Hashable]:
+        """Postings list for a normalized skill."""
+        self._build()
+        column = self.skill_vocabulary.get(skill.lower())
+        if column is None:
+            return []
+        start, end = self._skills.indptr[column], self._skills.indptr[column + 1]
+        return [self._ids[row] for row in self._skills.indices[start:end]]
+
+    def retrieve(self, job_data: Dict, limit: int = 2000) -> List[Hashable]:
+        """
+        Candidate generation: the IDs with the highest term/skill overlap.
+
+        Term overlap is IDF-weighted and normalized by the job's total term
+        weight; skill overlap is the fraction of required skills present.
+        Scores are accumulated over the job's postings only, so the cost
+        depends on how many candidates share a term with the job rather
+        than on the index size. Candidates sharing nothing with the job are
+        never returned.
+        """
+        self._build()
+        if not self._ids:
+            return []
+
+        term_cols = sorted({
+            self.term_vocabulary[t]
+            for t in self._analyzer(job_data.get('raw_text', ''))
+            if t in self.term_vocabulary
+        })
+        skill_cols = sorted({
+            self.skill_vocabulary[s.lower()]
+            for s in job_data.get('required_skills', [])
+            if s.lower() in self.skill_vocabulary
+        })
+
+        hit_rows = []
+        hit_weights = []
+        if term_cols:
+            postings = self._terms[:, term_cols]
+            df = np.diff(postings.indptr)
+            idf = np.log((len(self._ids) + 1) / (df + 1)) + 1
+            hit_rows.append(postings.indices)
+            hit_weights.append(np.repeat(idf / idf.sum(), df))
+        if skill_cols:
+            postings = self._skills[:, skill_cols]
+            hit_rows.append(postings.indices)
+            hit_weights.append(np.full(len(postings.indices), 1.0 / len(job_data['required_skills'])))
+        if not hit_rows:
+            return []
+
+        # One score per distinct candidate on the postings, in row order
+        rows, inverse = np.unique(np.concatenate(hit_rows), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(hit_weights))
+        hits = np.arange(len(rows))
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores, limit - 1)[:limit]]
+        hits = hits[np.argsort(-scores[hits], kind='stable')]
+        return [self._ids[row] for row in rows[hits]]
+
+    def save(self, directory: str) -> None:
+        """Write the index to a directory (vocabularies + JSONL postings per candidate)."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, INDEX_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'terms': self.term_vocabulary,
+                'skills': self.skill_vocabulary
+            }, f)
+        with open(os.path.join(directory, CANDIDATES_FILE), 'w', encoding='utf-8') as f:
+            for candidate_id, terms in self._doc_terms.items():
+                f.write(json.dumps({
+                    'id': candidate_id,
+                    'terms': terms,
+                    'skills': self._doc_skills[candidate_id]
+                }, separators=(',', ':')) + '\n')
+
+    @classmethod
+    def load(cls, directory: str) -> 'CandidateIndex':
+        """Load an index written by save()."""
+        index = cls()
+        with open(os.path.join(directory, INDEX_FILE), 'r', encoding='utf-8') as f:
+            vocabularies = json.load(f)
+        index.term_vocabulary = vocabularies['terms']
+        index.skill_vocabulary = vocabularies['skills']
+        with open(os.path.join(directory, CANDIDATES_FILE), 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                index._doc_terms[entry['id']] = entry['terms']
+                index._doc_skills[entry['id']] = entry['skills']
+        return index
+
+    @staticmethod
+    def _ids_for(vocabulary: Dict[str, int], features: Iterable[str]) -> List[int]:
+        """Map features to column ids, growing the vocabulary as needed."""
+        return sorted(vocabulary.setdefault(f, len(vocabulary)) for f in features)
+
+    def _invalidate(self) -> None:
+        self._terms = None
+        self._skills = None
+
+    def _build(self) -> None:
+        """(Re)build the binary CSC matrices after the index changed."""
+        if self._terms is not None:
+            return
+        self._ids = list(self._doc_terms)
+        self._terms = self._binary_matrix(self._doc_terms, len(self.term_vocabulary))
+        self._skills = self._binary_matrix(self._doc_skills, len(self.skill_vocabulary))
+
+    def _binary_matrix(self, rows: Dict[Hashable, List[int]], n_columns: int) -> sparse.csc_matrix:
+        indptr = np.zeros(len(self._ids) + 1, dtype=np.int64)
+        lengths = [len(rows[candidate_id]) for candidate_id in self._ids]
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.fromiter(
+            (col for candidate_id in self._ids for col in rows[candidate_id]),
+            dtype=np.int32,
+            count=int(indptr[-1])
+        )
+        data = np.ones(len(indices), dtype=np.float32)
+        matrix = sparse.csr_matrix(
+            (data, indices, indptr),
+            shape=(len(self._ids), n_columns)
+        )
+        return matrix.tocsc()
@@ -0,0 +1,381 @@
+"""
+Memory-mapped, columnar store of parsed candidates.
+
+Holding large talent pools as dicts (each with its full raw_text) costs
+gigabytes per worker. This store keeps parsed records on disk instead:
+
+- text fields of every record are appended to one blob file, read through
+  mmap, with per-record field offsets in a fixed-width int64 column
+- skills and keywords are interned to integer IDs and stored as flat ID
+  arrays plus per-record end pointers (CSR layout)
+- numeric columns (e.g. added_at, deleted, and the scoring features
+  experience_years and education_level) are fixed-width arrays
+
+All arrays are opened with numpy.memmap in read-only mode, so several
+processes (e.g. gunicorn workers) reading the same store share its pages
+through the OS page cache. CandidateView objects load text fields lazily.
+
+Records are append-only; deletions set a flag and compact() rewrites the
+store without them. A single writer is assumed.
+"""
+
+import json
+import mmap
+import os
+import shutil
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+FORMAT_VERSION = 1
+META_FILE = 'meta.json'
+VOCAB_FILE = 'vocab.json'
+BLOB_FILE = 'text.blob'
+OFFSETS_FILE = 'text_offsets.i64'
+
+# Text fields in blob order; any other record keys are kept as JSON in 'extra'
+TEXT_FIELDS = ('file_path', 'name', 'email', 'phone', 'experience', 'education', 'raw_text', 'extra')
+LIST_FIELDS = ('skills', 'keywords')
+# Numeric record fields read by scoring.FeatureScorer.encode_store; stores
+# written before a column existed read it as zeros
+FEATURE_COLUMNS = {'experience_years': np.float32, 'education_level': np.uint8}
+NUMERIC_COLUMNS = dict({'added_at': np.float64, 'deleted': np.uint8}, **FEATURE_COLUMNS)
+
+
+class CandidateView:
+    """Read-only, dict-like view of one stored candidate; text loads lazily."""
+
+    __slots__ = ('_store', 'index', '_skills', '_keywords', '_extra')
+
+    def __init__(self, store: 'CandidateStore', index: int):
+        self._store = store
+        self.index = index
+        self._skills = None
+        self._keywords = None
+        self._extra = None
+
+    def _text(self, field: str) -> str:
+        return self._store._read_text(self.index, TEXT_FIELDS.index(field))
+
+    @property
+    def skills(self) -> List[str]:
+        if self._skills is None:
+            self._skills = self._store._read_list('skills', self.index)
+        return self._skills
+
+    @property
+    def keywords(self) -> List[str]:
+        if self._keywords is None:
+            self._keywords = self._store._read_list('keywords', self.index)
+        return self._keywords
+
+    @property
+    def extra(self) -> Dict:
+        if self._extra is None:
+            text = self._text('extra')
+            self._extra = json.loads(text) if text else {}
+        return self._extra
+
+    def __getitem__(self, key: str):
+        if key in LIST_FIELDS:
+            return getattr(self, key)
+        if key in TEXT_FIELDS and key != 'extra':
+            return self._text(key)
+        if key in FEATURE_COLUMNS:
+            return self._store.column(key)[self.index].item()
+        if key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict:
+        """Materialize the full record (as ResumeParser produced it)."""
+        record = {field: self._text(field) for field in TEXT_FIELDS if field != 'extra'}
+        record['skills'] = list(self.skills)
+        record['keywords'] = list(self.keywords)
+        for name in FEATURE_COLUMNS:
+            record[name] = self[name]
+        record.update(self.extra)
+        return record
+
+
+class CandidateStore:
+    """Append-only columnar candidate store backed by memory-mapped files."""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Store location (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.count = 0
+        self.skill_vocabulary: List[str] = []
+        self.keyword_vocabulary: List[str] = []
+        self._skill_ids: Dict[str, int] = {}
+        self._keyword_ids: Dict[str, int] = {}
+        self._blob = None
+        self._blob_file = None
+        self._columns: Dict[str, np.ndarray] = {}
+        self._writers = None
+        self.refresh()
+
+    # Reading
+
+    def refresh(self) -> None:
+        """(Re)map the files, picking up records appended by another process."""
+        meta = self._read_json(META_FILE, {'count': 0})
+        if meta.get('format_version', FORMAT_VERSION) != FORMAT_VERSION:
+            raise ValueError(f"Unsupported candidate store format in {self.directory}")
+        vocab = self._read_json(VOCAB_FILE, {'skills': [], 'keywords': []})
+        self.count = meta['count']
+        self.skill_vocabulary = vocab['skills']
+        self.keyword_vocabulary = vocab['keywords']
+        self._skill_ids = {s: i for i, s in enumerate(self.skill_vocabulary)}
+        self._keyword_ids = {k: i for i, k in enumerate(self.keyword_vocabulary)}
+
+        self._close_maps()
+        columns = {'offsets': self._map(OFFSETS_FILE, np.int64, (self.count, len(TEXT_FIELDS) + 1))}
+        for field in LIST_FIELDS:
+            ptr = self._map(f'{field}_ptr.i64', np.int64, (self.count,))
+            columns[f'{field}_ptr'] = ptr
+            columns[f'{field}_ids'] = self._map(
+                f'{field}.i64', np.int64, (int(ptr[-1]) if self.count else 0,)
+            )
+        for name, dtype in NUMERIC_COLUMNS.items():
+            columns[name] = self._map(f'col_{name}.bin', dtype, (self.count,))
+        self._columns = columns
+
+        blob_path = self._path(BLOB_FILE)
+        if self.count and os.path.getsize(blob_path):
+            self._blob_file = open(blob_path, 'rb')
+            self._blob = mmap.mmap(self._blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> CandidateView:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return CandidateView(self, index)
+
+    def __iter__(self) -> Iterator[CandidateView]:
+        """Live (not deleted) candidates."""
+        deleted = self.column('deleted')
+        for i in range(self.count):
+            if not deleted[i]:
+                yield CandidateView(self, i)
+
+    def column(self, name: str) -> np.ndarray:
+        """A numeric column as a read-only array (memory-mapped)."""
+        return self._columns[name]
+
+    def live_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.column('deleted') == 0)
+
+    def texts(self, indices: Iterable[int], field: str = 'raw_text') -> Iterator[str]:
+        """Lazily decode one text field for the given records."""
+        position = TEXT_FIELDS.index(field)
+        for i in indices:
+            yield self._read_text(int(i), position)
+
+    def list_matrix(self, field: str):
+        """
+        Binary candidate-by-ID matrix for 'skills' or 'keywords' (CSR).
+
+        Built directly on the memory-mapped ID arrays.
+        """
+        from scipy import sparse
+        ptr = self._columns[f'{field}_ptr']
+        ids = self._columns[f'{field}_ids']
+        vocabulary = self.skill_vocabulary if field == 'skills' else self.keyword_vocabulary
+        indptr = np.zeros(self.count + 1, dtype=np.int64)
+        indptr[1:] = ptr
+        data = np.ones(len(ids), dtype=np.float32)
+        return sparse.csr_matrix((data, ids, indptr), shape=(self.count, len(vocabulary)))
+
+    # Writing
+
+    def append(self, record: Dict) -> int:
+        """Append one parsed record; returns its index. Call flush() to publish."""
+        writers = self._open_writers()
+        start = writers['blob_size']
+        offsets = [start]
+        extra = {
+            k: v for k, v in record.items()
+            if k not in TEXT_FIELDS and k not in LIST_FIELDS and k not in NUMERIC_COLUMNS
+        }
+        for field in TEXT_FIELDS:
+            if field == 'extra':
+                value = json.dumps(extra, separators=(',', ':'), default=str) if extra else ''
+            else:
+                value = str(record.get(field) or '')
+            data = value.encode('utf-8')
+            writers['blob'].write(data)
+            start += len(data)
+            offsets.append(start)
+        writers['blob_size'] = start
+        writers['offsets'].write(np.asarray(offsets, dtype=np.int64).tobytes())
+
+        for field, interned, vocabulary in (
+            ('skills', self._skill_ids, self.skill_vocabulary),
+            ('keywords', self._keyword_ids, self.keyword_vocabulary)
+        ):
+            ids = []
+            for item in dict.fromkeys(record.get(field, [])):
+                if item not in interned:
+                    interned[item] = len(vocabulary)
+                    vocabulary.append(item)
+                ids.append(interned[item])
+            writers[f'{field}_total'] += len(ids)
+            writers[field].write(np.asarray(ids, dtype=np.int64).tobytes())
+            writers[f'{field}_ptr'].write(np.int64(writers[f'{field}_total']).tobytes())
+
+        writers['col_added_at'].write(np.float64(record.get('added_at', time.time())).tobytes())
+        writers['col_deleted'].write(np.uint8(0).tobytes())
+        for name, dtype in FEATURE_COLUMNS.items():
+            writers[f'col_{name}'].write(dtype(record.get(name) or 0).tobytes())
+        writers['count'] += 1
+        return writers['count'] - 1
+
+    def extend(self, records: Iterable[Dict]) -> List[int]:
+        indices = [self.append(record) for record in records]
+        self.flush()
+        return indices
+
+    def delete(self, index: int) -> None:
+        """Mark a record as deleted (takes effect immediately)."""
+        # Readers map the column shared, so they see the flag without a refresh
+        with open(self._path('col_deleted.bin'), 'r+b') as f:
+            f.seek(index)
+            f.write(b'\x01')
+
+    def flush(self) -> None:
+        """Publish appended records to readers."""
+        if self._writers is None:
+            return
+        for handle in self._writers.values():
+            if hasattr(handle, 'close'):
+                handle.close()
+        count = self._writers['count']
+        self._writers = None
+        # Vocabulary first: readers only see records counted in meta.json
+        self._write_json(VOCAB_FILE, {'skills': self.skill_vocabulary, 'keywords': self.keyword_vocabulary})
+        self._write_json(META_FILE, {'format_version': FORMAT_VERSION, 'count': count})
+        self.refresh()
+
+    def compact(self) -> Dict[int, int]:
+        """
+        Rewrite the store without deleted records.
+
+        Returns:
+            Mapping of old to new record indices
+        """
+        self.flush()
+        live = self.live_indices()
+        tmp_dir = self.directory.rstrip(os.sep) + '.compact'
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        compacted = CandidateStore(tmp_dir)
+        mapping = {}
+        for old in live:
+            view = self[int(old)]
+            record = view.to_dict()
+            record['added_at'] = float(self.column('added_at')[old])
+            mapping[int(old)] = compacted.append(record)
+        compacted.flush()
+        compacted.close()
+        self.close()
+        for name in os.listdir(tmp_dir):
+            os.replace(os.path.join(tmp_dir, name), os.path.join(self.directory, name))
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.refresh()
+        return mapping
+
+    def close(self) -> None:
+        self.flush()
+        self._close_maps()
+
+    # Internals
+
+    def _read_text(self, index: int, position: int) -> str:
+        offsets = self._columns['offsets']
+        start, end = int(offsets[index, position]), int(offsets[index, position + 1])
+        return self._blob[start:end].decode('utf-8') if end > start else ''
+
+    def _read_list(self, field: str, index: int) -> List[str]:
+        ptr = self._columns[f'{field}_ptr']
+        start = int(ptr[index - 1]) if index else 0
+        ids = self._columns[f'{field}_ids'][start:int(ptr[index])]
+        vocabulary = self.skill_vocabulary if field == 'skills' else self.keyword_vocabulary
+        return [vocabulary[i] for i in ids]
+
+    def _open_writers(self) -> Dict:
+        if self._writers is not None:
+            return self._writers
+        # Sizes as of the last flush; anything beyond (e.g. left by a crashed
+        # writer) is truncated away
+        blob_size = int(self._columns['offsets'][-1, -1]) if self.count else 0
+        writers = {'blob_size': blob_size, 'count': self.count}
+        sizes = {
+            BLOB_FILE: blob_size,
+            OFFSETS_FILE: self.count * (len(TEXT_FIELDS) + 1) * 8
+        }
+        for name, dtype in NUMERIC_COLUMNS.items():
+            sizes[f'col_{name}.bin'] = self.count * np.dtype(dtype).itemsize
+        for field in LIST_FIELDS:
+            total = int(self._columns[f'{field}_ptr'][-1]) if self.count else 0
+            writers[f'{field}_total'] = total
+            sizes[f'{field}.i64'] = total * 8
+            sizes[f'{field}_ptr.i64'] = self.count * 8
+        self._close_maps()
+
+        for name, size in sizes.items():
+            with open(self._path(name), 'ab') as f:
+                f.truncate(size)
+        writers['blob'] = open(self._path(BLOB_FILE), 'ab')
+        writers['offsets'] = open(self._path(OFFSETS_FILE), 'ab')
+        for field in LIST_FIELDS:
+            writers[field] = open(self._path(f'{field}.i64'), 'ab')
+            writers[f'{field}_ptr'] = open(self._path(f'{field}_ptr.i64'), 'ab')
+        for name in NUMERIC_COLUMNS:
+            writers[f'col_{name}'] = open(self._path(f'col_{name}.bin'), 'ab')
+        self._writers = writers
+        return writers
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _map(self, name: str, dtype, shape) -> np.ndarray:
+        path = self._path(name)
+        if not shape[0] or not os.path.exists(path):
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=shape)
+
+    def _close_maps(self) -> None:
+        self._columns = {}
+        if self._blob is not None:
+            self._blob.close()
+            self._blob = None
+        if self._blob_file is not None:
+            self._blob_file.close()
+            self._blob_file = None
+
+    def _read_json(self, name: str, default: Dict) -> Dict:
+        path = self._path(name)
+        if not os.path.exists(path):
+            return default
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_json(self, name: str, data: Dict) -> None:
+        path = self._path(name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
@@ -0,0 +1,355 @@
+"""
+Dense semantic scoring with precomputed candidate embeddings.
+
+An alternative to the TF-IDF semantic score. A text encoder maps resumes
+and jobs to dense vectors; each candidate is encoded once (at parse time,
+see ResumeMatcher.parse_resumes) into a contiguous float32 (or
+int8-quantized) EmbeddingIndex keyed by a hash of the resume text, so a
+match costs one job encoding plus a matrix-vector product.
+
+Encoders, all CPU-only:
+
+- SpacyVectorEncoder: averaged word vectors of a spaCy model that ships
+  vectors (en_core_web_md / en_core_web_lg)
+- OnnxSentenceEncoder: a local (optionally quantized) ONNX sentence
+  transformer, mean-pooled; needs onnxruntime and tokenizers
+- LsaEncoder: TF-IDF + truncated SVD fitted on the talent pool; needs no
+  model download
+
+Encoders and their backends are optional and imported lazily.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+ENCODE_BATCH_SIZE = 64
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so dot products are cosine similarities."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def text_key(text: str) -> str:
+    """Index key of a resume text."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class SpacyVectorEncoder:
+    """Averaged static word vectors from a spaCy model."""
+
+    def __init__(self, model: str = 'en_core_web_md', batch_size: int = ENCODE_BATCH_SIZE):
+        import spacy
+        # Only the tokenizer and the vector table are needed
+        self.nlp = spacy.load(model, exclude=['tagger', 'parser', 'ner', 'lemmatizer',
+                                              'attribute_ruler', 'senter', 'tok2vec'])
+        if not self.nlp.vocab.vectors_length:
+            raise ValueError(f"spaCy model {model} has no word vectors (use en_core_web_md or _lg)")
+        self.name = f"spacy:{model}"
+        self.dimensions = self.nlp.vocab.vectors_length
+        self.batch_size = batch_size
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = [doc.vector for doc in self.nlp.pipe(texts, batch_size=self.batch_size)]
+        return _normalize(np.vstack(vectors) if vectors else np.zeros((0, self.dimensions)))
+
+
+class OnnxSentenceEncoder:
+    """
+    Mean-pooled sentence embeddings from a local ONNX transformer.
+
+    model_dir must contain model.onnx (e.g. an exported, int8-quantized
+    all-MiniLM-L6-v2) and its tokenizer.json.
+    """
+
+    def __init__(self, model_dir: str, max_length: int = 256, batch_size: int = 32):
+        import onnxruntime
+        from tokenizers import Tokenizer
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, 'model.onnx'),
+            providers=['CPUExecutionProvider']
+        )
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, 'tokenizer.json'))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.name = f"onnx:{os.path.basename(os.path.normpath(model_dir))}"
+        self.batch_size = batch_size
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        pooled = []
+        for start in range(0, len(texts), self.batch_size):
+            encodings = self.tokenizer.encode_batch(list(texts[start:start + self.batch_size]))
+            ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feeds = {'input_ids': ids, 'attention_mask': mask}
+            if 'token_type_ids' in self.input_names:
+                feeds['token_type_ids'] = np.zeros_like(ids)
+            hidden = self.session.run(None, feeds)[0]
+            weights = mask[:, :, None].astype(np.float32)
+            pooled.append((hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1.0))
+        if not pooled:
+            return np.zeros((0, self.session.get_outputs()[0].shape[-1]), dtype=np.float32)
+        return _normalize(np.vstack(pooled))
+
+
+class LsaEncoder:
+    """Latent semantic analysis (TF-IDF + truncated SVD) fitted on a corpus."""
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+        self.vectorizer = None
+        self.svd = None
+        self.name = 'lsa:unfitted'
+
+    def fit(self, texts: Sequence[str]) -> 'LsaEncoder':
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        self.vectorizer = TfidfVectorizer(max_features=20000, ngram_range=(1, 2),
+                                          stop_words='english', sublinear_tf=True)
+        tfidf = self.vectorizer.fit_transform(texts)
+        self.svd = TruncatedSVD(n_components=min(self.dimensions, tfidf.shape[1] - 1, len(texts) - 1),
+                                random_state=0)
+        self.svd.fit(tfidf)
+        digest = hashlib.sha1(self.svd.components_.tobytes()).hexdigest()[:12]
+        self.name = f"lsa:{digest}"
+        return self
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if self.svd is None:
+            raise ValueError("LsaEncoder must be fitted before encoding")
+        return _normalize(self.svd.transform(self.vectorizer.transform(texts)))
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> 'LsaEncoder':
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+
+def create_encoder(spec: str):
+    """
+    Build an encoder from a spec string, e.g. "spacy:en_core_web_md",
+    "onnx:/models/minilm-int8" or "lsa:/path/to/fitted_lsa.pkl".
+    """
+    kind, _, argument = spec.partition(':')
+    if kind == 'spacy':
+        return SpacyVectorEncoder(argument or 'en_core_web_md')
+    if kind == 'onnx':
+        return OnnxSentenceEncoder(argument)
+    if kind == 'lsa':
+        return LsaEncoder.load(argument)
+    raise ValueError(f"Unknown semantic encoder: {spec}")
+
+
+class EmbeddingIndex:
+    """
+    Contiguous matrix of unit-length embeddings keyed by string IDs.
+
+    With quantize=True rows are stored as int8 with a per-row scale (4x
+    smaller; cosine error around 1e-2).
+    """
+
+    def __init__(self, dimensions: int, quantize: bool = False):
+        self.dimensions = dimensions
+        self.quantize = quantize
+        self.keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.zeros((0, dimensions), dtype=np.int8 if quantize else np.float32)
+        self._scales = np.zeros(0, dtype=np.float32)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        """Add (or replace) unit-length vectors."""
+        with self._lock:
+            # A loaded (memory-mapped, read-only) index is copied on first write
+            self._grow(self._size)
+            for key, vector in zip(keys, np.asarray(vectors, dtype=np.float32)):
+                row = self._rows.get(key)
+                if row is None:
+                    row = self._size
+                    self._grow(row + 1)
+                    self._rows[key] = row
+                    self.keys.append(key)
+                    self._size += 1
+                if self.quantize:
+                    scale = float(np.abs(vector).max()) / 127 or 1.0
+                    self._vectors[row] = np.round(vector / scale).astype(np.int8)
+                    self._scales[row] = scale
+                else:
+                    self._vectors[row] = vector
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Drop every vector whose key is not in keys (the rest keep their order)."""
+        keep = set(keys)
+        with self._lock:
+            rows = np.fromiter(
+                (row for row, key in enumerate(self.keys) if key in keep), dtype=np.int64
+            )
+            if len(rows) == self._size:
+                return
+            # Fancy indexing copies, so a memory-mapped index becomes writable
+            self._vectors = self._vectors[rows]
+            self._scales = self._scales[rows]
+            self.keys = [self.keys[row] for row in rows]
+            self._rows = {key: row for row, key in enumerate(self.keys)}
+            self._size = len(self.keys)
+
+    def rows(self, keys: Iterable[str]) -> np.ndarray:
+        """Row numbers of the given keys (KeyError if one is missing)."""
+        return np.fromiter((self._rows[key] for key in keys), dtype=np.int64)
+
+    def dot(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of a query (or a query-by-dimension matrix) to stored rows."""
+        query = np.asarray(query, dtype=np.float32)
+        vectors = self._vectors[:self._size] if rows is None else self._vectors[rows]
+        scores = vectors.astype(np.float32, copy=False) @ query.T
+        if self.quantize:
+            scales = self._scales[:self._size] if rows is None else self._scales[rows]
+            scores = scores * (scales[:, None] if scores.ndim == 2 else scales)
+        return scores
+
+    def save(self, directory: str) -> None:
+        """Write the index to a directory (files are replaced, so a loaded copy stays valid)."""
+        os.makedirs(directory, exist_ok=True)
+        arrays = {'vectors.npy': self._vectors[:self._size], 'scales.npy': self._scales[:self._size]}
+        for name, array in arrays.items():
+            path = os.path.join(directory, name)
+            with open(f"{path}.tmp", 'wb') as f:
+                np.save(f, array)
+            os.replace(f"{path}.tmp", path)
+        path = os.path.join(directory, 'keys.json')
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump({'dimensions': self.dimensions, 'quantize': self.quantize, 'keys': self.keys}, f)
+        os.replace(f"{path}.tmp", path)
+
+    @classmethod
+    def load(cls, directory: str) -> 'EmbeddingIndex':
+        """Load a saved index; vectors are memory-mapped until the next add()."""
+        with open(os.path.join(directory, 'keys.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        index = cls(meta['dimensions'], quantize=meta['quantize'])
+        index.keys = meta['keys']
+        index._rows = {key: i for i, key in enumerate(index.keys)}
+        index._size = len(index.keys)
+        index._vectors = np.load(os.path.join(directory, 'vectors.npy'), mmap_mode='r')
+        index._scales = np.load(os.path.join(directory, 'scales.npy'), mmap_mode='r')
+        return index
+
+    def _grow(self, size: int) -> None:
+        if size <= len(self._vectors) and self._vectors.flags.writeable:
+            return
+        # Amortized doubling (also copies a read-only memory-mapped matrix)
+        capacity = max(size, 2 * len(self._vectors), 64)
+        vectors = np.zeros((capacity, self.dimensions), dtype=self._vectors.dtype)
+        vectors[:self._size] = self._vectors[:self._size]
+        scales = np.zeros(capacity, dtype=np.float32)
+        scales[:self._size] = self._scales[:self._size]
+        self._vectors, self._scales = vectors, scales
+
+
+class EmbeddingScorer:
+    """Semantic scorer over an encoder and a cache of candidate embeddings."""
+
+    def __init__(
+        self,
+        encoder,
+        index: Optional[EmbeddingIndex] = None,
+        quantize: bool = False,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Args:
+            encoder: Any object with name and encode(texts) -> unit vectors
+            index: Candidate embeddings (created on first use if omitted)
+            quantize: Store new embeddings as int8 when creating the index
+            max_entries: Embeddings kept before the oldest are evicted (None =
+                no limit); the texts of the current call are never evicted
+        """
+        self.encoder = encoder
+        self.index = index
+        self.quantize = quantize
+        self.max_entries = max_entries
+        # Held while encoding and reading rows, so eviction by one call
+        # cannot remove rows another call is about to score
+        self._lock = threading.RLock()
+
+    @property
+    def name(self) -> str:
+        return self.encoder.name
+
+    def precompute(self, texts: Iterable[str]) -> int:
+        """
+        Encode resume texts that are not indexed yet.
+
+        Returns:
+            Number of texts encoded
+        """
+        with self._lock:
+            pending = {}
+            for text in texts:
+                key = text_key(text)
+                if (self.index is None or key not in self.index) and key not in pending:
+                    pending[key] = text
+            return self._encode_missing(pending)
+
+    def similarity_matrix(self, job_texts: Sequence[str], texts: Sequence[str]) -> np.ndarray:
+        """
+        Candidate-by-job cosine similarities, clipped to [0, 1] like TF-IDF
+        scores (candidates not indexed yet are encoded first).
+        """
+        return self.score_vectors(self.encoder.encode(list(job_texts)), texts)
+
+    def score_vectors(self, job_vectors: np.ndarray, texts: Sequence[str]) -> np.ndarray:
+        """similarity_matrix for already encoded jobs (e.g. across chunks)."""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, len(job_vectors)))
+        keys = [text_key(text) for text in texts]
+        with self._lock:
+            self._encode_missing(dict(zip(keys, texts)))
+            scores = self.index.dot(job_vectors, self.index.rows(keys))
+        return np.clip(scores, 0.0, 1.0).astype(np.float64)
+
+    def similarities(self, job_text: str, texts: Sequence[str]) -> np.ndarray:
+        return self.similarity_matrix([job_text], texts)[:, 0]
+
+    def _encode_missing(self, texts: Dict[str, str]) -> int:
+        """Encode and index the texts (by key) that are not indexed yet."""
+        pending = [key for key in texts if self.index is None or key not in self.index]
+        if not pending:
+            return 0
+        vectors = self.encoder.encode([texts[key] for key in pending])
+        if self.index is None:
+            self.index = EmbeddingIndex(vectors.shape[1], quantize=self.quantize)
+        elif self.max_entries is not None:
+            excess = len(self.index) + len(pending) - self.max_entries
+            if excess > 0:
+                # Oldest first, skipping the texts this call needs
+                evicted = set()
+                for key in self.index.keys:
+                    if len(evicted) == excess:
+                        break
+                    if key not in texts:
+                        evicted.add(key)
+                self.index.retain(key for key in self.index.keys if key not in evicted)
+        self.index.add(pending, vectors)
+        return len(pending)
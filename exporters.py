@@ -0,0 +1,223 @@
+"""
+Streaming exporters for match results.
+
+Results are written one row at a time as CSV, JSON Lines, a JSON array or
+(with pyarrow installed) Parquet, either to a file or as chunks for a
+streamed HTTP response, so memory stays constant however many results are
+exported. Only the selected columns are materialized; heavy fields (full
+experience/education text, keywords, raw resume text) are left out unless
+asked for.
+
+Columns are looked up on the result first and then on its
+'candidate_data', so both ResumeMatcher results and the web app's
+formatted results can be exported.
+"""
+
+import csv
+import io
+import json
+import os
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence
+
+FORMATS = ('csv', 'jsonl', 'json', 'parquet')
+DEFAULT_COLUMNS = ('rank', 'name', 'email', 'match_score', 'skills_match', 'skills', 'file_path')
+HEAVY_COLUMNS = ('experience', 'education', 'keywords', 'raw_text')
+# Rows per Parquet row group
+PARQUET_BATCH_SIZE = 10000
+
+
+def _field(name: str) -> Callable[[Dict, int], object]:
+    def get(result: Dict, rank: int):
+        if name in result:
+            return result[name]
+        return (result.get('candidate_data') or {}).get(name, '')
+    return get
+
+
+def _preview(name: str, length: int) -> Callable[[Dict, int], str]:
+    get = _field(name)
+    return lambda result, rank: (get(result, rank) or '')[:length]
+
+
+# Column name -> value for a result (given its 1-based position)
+COLUMNS: Dict[str, Callable[[Dict, int], object]] = {
+    'rank': lambda result, rank: result.get('rank', rank),
+    'name': _field('name'),
+    'email': _field('email'),
+    'phone': _field('phone'),
+    'match_score': _field('match_score'),
+    'skills_match': _field('skills_match'),
+    'skills': lambda result, rank: list(_field('skills')(result, rank) or []),
+    'skills_count': lambda result, rank: len(_field('skills')(result, rank) or []),
+    'file_path': lambda result, rank: str(_field('file_path')(result, rank) or ''),
+    'filename': lambda result, rank: result.get('filename') or os.path.basename(
+        str(_field('file_path')(result, rank) or '')
+    ),
+    'experience_preview': _preview('experience', 100),
+    'education_preview': _preview('education', 100),
+    'experience': _field('experience'),
+    'education': _field('education'),
+    'keywords': lambda result, rank: list(_field('keywords')(result, rank) or []),
+    'raw_text': _field('raw_text')
+}
+
+
+def parse_columns(spec: Optional[str]) -> List[str]:
+    """
+    Column list from a comma-separated spec ("all" = every column).
+
+    Raises:
+        ValueError: Unknown column name
+    """
+    if not spec:
+        return list(DEFAULT_COLUMNS)
+    if spec.strip() == 'all':
+        return list(COLUMNS)
+    columns = [c.strip() for c in spec.split(',') if c.strip()]
+    unknown = [c for c in columns if c not in COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)} (available: {', '.join(COLUMNS)})")
+    return columns
+
+
+def iter_rows(results: Iterable[Dict], columns: Sequence[str]) -> Iterator[Dict]:
+    """Selected columns of each result, as dicts."""
+    getters = [(column, COLUMNS[column]) for column in columns]
+    for rank, result in enumerate(results, 1):
+        yield {column: get(result, rank) for column, get in getters}
+
+
+def iter_csv(
+    results: Iterable[Dict],
+    columns: Sequence[str] = DEFAULT_COLUMNS,
+    labels: Optional[Dict[str, str]] = None
+) -> Iterator[str]:
+    """
+    CSV text, one chunk per row (header first). List values are joined
+    with ", ".
+
+    Args:
+        labels: Header text per column (defaults to the column names)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    labels = labels or {}
+    writer.writerow([labels.get(column, column) for column in columns])
+    yield flush()
+    for row in iter_rows(results, columns):
+        writer.writerow([
+            ', '.join(map(str, value)) if isinstance(value, list) else value
+            for value in row.values()
+        ])
+        yield flush()
+
+
+def iter_jsonl(results: Iterable[Dict], columns: Sequence[str] = DEFAULT_COLUMNS) -> Iterator[str]:
+    """JSON Lines, one object per row."""
+    for row in iter_rows(results, columns):
+        yield json.dumps(row, default=str) + '\n'
+
+
+def iter_json(results: Iterable[Dict], columns: Sequence[str] = DEFAULT_COLUMNS) -> Iterator[str]:
+    """A JSON array of row objects, written incrementally."""
+    separator = '[\n  '
+    for row in iter_rows(results, columns):
+        yield separator + json.dumps(row, default=str)
+        separator = ',\n  '
+    yield '\n]\n' if separator != '[\n  ' else '[]\n'
+
+
+def iter_export(results: Iterable[Dict], fmt: str, columns: Sequence[str] = DEFAULT_COLUMNS) -> Iterator[str]:
+    """Text chunks for a streamed response in a text format (csv, jsonl, json)."""
+    if fmt == 'csv':
+        return iter_csv(results, columns)
+    if fmt == 'jsonl':
+        return iter_jsonl(results, columns)
+    if fmt == 'json':
+        return iter_json(results, columns)
+    raise ValueError(f"Cannot stream {fmt}; use one of csv, jsonl, json")
+
+
+def write_export(
+    results: Iterable[Dict],
+    path: str,
+    fmt: Optional[str] = None,
+    columns: Sequence[str] = DEFAULT_COLUMNS
+) -> int:
+    """
+    Write results to a file, row by row.
+
+    Args:
+        fmt: One of FORMATS (inferred from the extension when omitted)
+
+    Returns:
+        Number of rows written
+    """
+    fmt = fmt or format_for_path(path)
+    counted = _Counted(results)
+    if fmt == 'parquet':
+        _write_parquet(counted, path, columns)
+    else:
+        with open(path, 'w', encoding='utf-8', newline='' if fmt == 'csv' else None) as f:
+            _write_chunks(f, iter_export(counted, fmt, columns))
+    return counted.count
+
+
+def format_for_path(path: str) -> str:
+    """Export format implied by a file extension (JSON if unknown)."""
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext == 'ndjson':
+        return 'jsonl'
+    return ext if ext in FORMATS else 'json'
+
+
+def _write_chunks(f: IO[str], chunks: Iterable[str]) -> None:
+    for chunk in chunks:
+        f.write(chunk)
+
+
+def _write_parquet(results: Iterable[Dict], path: str, columns: Sequence[str]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    # Fixed schema so every row group matches regardless of its values
+    list_columns = {'skills', 'keywords'}
+    number_columns = {'rank': pa.int64(), 'skills_count': pa.int64(),
+                      'match_score': pa.float64(), 'skills_match': pa.float64()}
+    schema = pa.schema([
+        (column, pa.list_(pa.string()) if column in list_columns
+         else number_columns.get(column, pa.string()))
+        for column in columns
+    ])
+    with pq.ParquetWriter(path, schema) as writer:
+        batch: List[Dict] = []
+        for row in iter_rows(results, columns):
+            batch.append(row)
+            if len(batch) >= PARQUET_BATCH_SIZE:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                batch = []
+        if batch:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+
+
+class _Counted:
+    """Iterable wrapper counting the items it yields."""
+
+    def __init__(self, items: Iterable):
+        self.items = items
+        self.count = 0
+
+    def __iter__(self):
+        for item in self.items:
+            self.count += 1
+            yield item
@@ -0,0 +1,650 @@
+"""
+Document text extraction backends.
+
+A resume's format is sniffed from its leading bytes (the extension is only
+a fallback), so a Word 97 file named .doc, a DOCX saved as .doc or an RTF
+file with a .doc extension each reach a reader that understands them. Each
+format has an ordered list of backends; the first one whose dependencies
+are installed reads the file, and if it cannot open the document the next
+one is tried. Which backend handled each file, and how long it took, is
+recorded in metrics and on the TextStream.
+
+Preference order (fastest first, measured on the benchmark corpus):
+    pdf:  pypdfium2 -> PyPDF2 -> pdfplumber (pdfplumber is far slower and
+          only used when the others cannot open a file)
+    doc:  antiword -> catdoc (command-line tools) -> olefile (Word 97-2003
+          piece table)
+    docx: python-docx
+    odt, rtf, html, txt: built in (standard library)
+"""
+
+import codecs
+import hashlib
+import importlib
+import importlib.util
+import re
+import shutil
+import struct
+import subprocess
+import time
+import zipfile
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+from xml.etree import ElementTree
+
+import metrics
+
+# Extension -> format used when sniffing is inconclusive
+EXTENSION_FORMATS = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'doc',
+    '.odt': 'odt',
+    '.rtf': 'rtf',
+    '.html': 'html',
+    '.htm': 'html',
+    '.txt': 'txt'
+}
+RESUME_EXTENSIONS = tuple(EXTENSION_FORMATS)
+
+SNIFF_BYTES = 2048
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+ZIP_MAGIC = b'PK\x03\x04'
+ODT_MIMETYPE = b'application/vnd.oasis.opendocument.text'
+# Read size when streaming text and HTML
+BLOCK_SIZE = 64 * 1024
+# Seconds allowed for external converters (antiword, catdoc)
+COMMAND_TIMEOUT = 30
+
+ExtractFunc = Callable[[Path, Optional[int]], Iterator[str]]
+
+
+class ExtractionBackend:
+    """One way of reading text out of one document format."""
+
+    def __init__(
+        self,
+        name: str,
+        fmt: str,
+        extract: ExtractFunc,
+        modules: Sequence[str] = (),
+        commands: Sequence[str] = ()
+    ):
+        """
+        Args:
+            name: Backend name recorded for each extracted file
+            fmt: Document format it reads
+            extract: Yields newline-terminated text for (path, max_pages)
+            modules: Python modules it needs
+            commands: Executables it needs on PATH
+        """
+        self.name = name
+        self.format = fmt
+        self.extract = extract
+        self.modules = tuple(modules)
+        self.commands = tuple(commands)
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether its modules and commands are installed (checked once)."""
+        if self._available is None:
+            self._available = (
+                all(importlib.util.find_spec(module) is not None for module in self.modules) and
+                all(shutil.which(command) for command in self.commands)
+            )
+        return self._available
+
+
+# Format -> backends in order of preference
+BACKENDS: Dict[str, List[ExtractionBackend]] = {}
+
+
+def register_backend(
+    fmt: str,
+    name: str,
+    modules: Sequence[str] = (),
+    commands: Sequence[str] = (),
+    before: Optional[str] = None
+) -> Callable[[ExtractFunc], ExtractFunc]:
+    """
+    Decorator registering an extraction function for a format.
+
+    Args:
+        before: Name of a backend this one is preferred over (default: last)
+    """
+    def decorate(extract: ExtractFunc) -> ExtractFunc:
+        backends = BACKENDS.setdefault(fmt, [])
+        backend = ExtractionBackend(name, fmt, extract, modules, commands)
+        names = [b.name for b in backends]
+        backends.insert(names.index(before) if before in names else len(backends), backend)
+        return extract
+    return decorate
+
+
+def backends_for(fmt: str) -> List[ExtractionBackend]:
+    """Installed backends for a format, in order of preference."""
+    return [backend for backend in BACKENDS.get(fmt, []) if backend.available]
+
+
+def fingerprint() -> str:
+    """Short hash of the backend selected for each format (changes when one is installed)."""
+    selected = []
+    for fmt in sorted(BACKENDS):
+        backends = backends_for(fmt)
+        selected.append(f"{fmt}={backends[0].name if backends else '-'}")
+    selected = ','.join(selected)
+    return hashlib.sha1(selected.encode('utf-8')).hexdigest()[:8]
+
+
+def warmup() -> None:
+    """Import the preferred backend of every format."""
+    for fmt in BACKENDS:
+        for backend in backends_for(fmt)[:1]:
+            for module in backend.modules:
+                importlib.import_module(module)
+
+
+def sniff_format(file_path) -> Optional[str]:
+    """Format identified from a file's leading bytes, or None if unrecognized."""
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    if b'%PDF-' in head[:1024]:
+        # The header may follow up to 1 KB of junk
+        return 'pdf'
+    if head.startswith(OLE_MAGIC):
+        return 'doc'
+    if head.startswith(ZIP_MAGIC):
+        ext = Path(file_path).suffix.lower()
+        if ext in ('.docx', '.odt'):
+            # Trust the extension rather than reading the zip directory twice
+            return EXTENSION_FORMATS[ext]
+        return _sniff_zip(file_path)
+    start = head.lstrip(b'\xef\xbb\xbf \t\r\n').lower()
+    if start.startswith(b'{\\rtf'):
+        return 'rtf'
+    if start.startswith((b'<!doctype html', b'<html')):
+        return 'html'
+    return None
+
+
+def _sniff_zip(file_path) -> Optional[str]:
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            names = set(archive.namelist())
+            if 'word/document.xml' in names:
+                return 'docx'
+            if 'mimetype' in names and archive.read('mimetype').strip() == ODT_MIMETYPE:
+                return 'odt'
+    except (zipfile.BadZipFile, OSError):
+        pass
+    return None
+
+
+def detect_format(file_path) -> str:
+    """
+    Format of a resume: sniffed from its contents, else from its extension.
+
+    Raises:
+        ValueError: Unrecognized contents and unsupported extension
+    """
+    ext = Path(file_path).suffix.lower()
+    try:
+        fmt = sniff_format(file_path)
+    except OSError:
+        # Let the backend report the unreadable file
+        fmt = None
+    fmt = fmt or EXTENSION_FORMATS.get(ext)
+    if fmt is None:
+        raise ValueError(f"Unsupported file format: {ext}")
+    return fmt
+
+
+class ExtractionError(ValueError):
+    """No backend could read a document."""
+
+
+class TextStream:
+    """
+    A document's text, yielded lazily by the first backend able to open it.
+
+    After iteration starts, 'backend' names the backend that produced the
+    text and 'seconds' is the time spent extracting. If no backend can
+    open the file, iteration raises ExtractionError.
+    """
+
+    def __init__(self, file_path, fmt: Optional[str] = None, max_pages: Optional[int] = None):
+        """
+        Args:
+            fmt: Document format (sniffed when omitted)
+            max_pages: Stop after this many pages (paged formats only)
+        """
+        self.path = Path(file_path)
+        self.format = fmt or detect_format(file_path)
+        self.backend: Optional[str] = None
+        self.seconds = 0.0
+        self._chunks = self._generate(max_pages)
+
+    def __iter__(self) -> 'TextStream':
+        return self
+
+    def __next__(self) -> str:
+        return next(self._chunks)
+
+    def close(self) -> None:
+        """Stop reading and release the file."""
+        self._chunks.close()
+
+    def _generate(self, max_pages: Optional[int]) -> Iterator[str]:
+        backends = backends_for(self.format)
+        errors = [
+            f"{backend.name} is not installed"
+            for backend in BACKENDS.get(self.format, []) if not backend.available
+        ]
+        for backend in backends:
+            start = time.perf_counter()
+            chunks = backend.extract(self.path, max_pages)
+            try:
+                # Backends open the document on their first chunk; a file
+                # one cannot open is handed to the next
+                first = next(chunks, None)
+            except Exception as e:
+                errors.append(f"{backend.name}: {e}")
+                continue
+            self.backend = backend.name
+            try:
+                if first is not None:
+                    yield first
+                yield from chunks
+            except Exception as e:
+                # Keep the text read so far
+                metrics.inc('resume_matcher_parse_failures_total', format=self.format)
+                print(f"Error reading {self.format.upper()} {self.path} with {backend.name}: {e}")
+            finally:
+                chunks.close()
+                self.seconds = time.perf_counter() - start
+                metrics.inc('resume_matcher_extracted_total', format=self.format, backend=backend.name)
+                metrics.REGISTRY.observe(
+                    'resume_matcher_extraction_seconds', self.seconds,
+                    format=self.format, backend=backend.name
+                )
+            return
+        # Counted as a parse failure by the caller
+        raise ExtractionError(
+            f"Could not read {self.format.upper()} {self.path}: {'; '.join(errors) or 'no backend'}"
+        )
+
+
+def open_text(file_path, max_pages: Optional[int] = None) -> TextStream:
+    """
+    Stream a resume's text through the preferred backend for its format.
+
+    Raises:
+        ValueError: Unsupported file format (ExtractionError, on iteration,
+            when no backend can read the file)
+    """
+    return TextStream(file_path, max_pages=max_pages)
+
+
+# PDF
+
+@register_backend('pdf', 'pypdfium2', modules=['pypdfium2'])
+def _iter_pdfium(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    import pypdfium2
+    pdf = pypdfium2.PdfDocument(str(file_path))
+    try:
+        pages = len(pdf) if max_pages is None else min(len(pdf), max_pages)
+        for i in range(pages):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            yield text.replace('\r\n', '\n') + "\n"
+    finally:
+        pdf.close()
+
+
+@register_backend('pdf', 'pypdf2', modules=['PyPDF2'])
+def _iter_pypdf2(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    import PyPDF2
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for i, page in enumerate(pdf_reader.pages):
+            if max_pages is not None and i >= max_pages:
+                break
+            yield page.extract_text() + "\n"
+
+
+@register_backend('pdf', 'pdfplumber', modules=['pdfplumber'])
+def _iter_pdfplumber(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    import pdfplumber
+    with pdfplumber.open(file_path) as pdf:
+        for i, page in enumerate(pdf.pages):
+            if max_pages is not None and i >= max_pages:
+                break
+            yield (page.extract_text() or '') + "\n"
+            # Drop the page's parsed layout objects as we go
+            page.close()
+
+
+# Word
+
+@register_backend('docx', 'python-docx', modules=['docx'])
+def _iter_docx(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    from docx import Document
+    doc = Document(file_path)
+    for paragraph in doc.paragraphs:
+        yield paragraph.text + "\n"
+
+
+def _run_command(args: List[str]) -> Iterator[str]:
+    result = subprocess.run(args, capture_output=True, timeout=COMMAND_TIMEOUT)
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip()
+        raise ValueError(message or f"{args[0]} exited with status {result.returncode}")
+    for line in result.stdout.decode('utf-8', 'replace').splitlines():
+        yield line + "\n"
+
+
+@register_backend('doc', 'antiword', commands=['antiword'])
+def _iter_antiword(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    return _run_command(['antiword', '-m', 'UTF-8.txt', '-w', '0', str(file_path)])
+
+
+@register_backend('doc', 'catdoc', commands=['catdoc'])
+def _iter_catdoc(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    return _run_command(['catdoc', '-d', 'utf-8', '-w', str(file_path)])
+
+
+# Word 97-2003 control characters: cell/row marks, line, page and section
+# breaks become line breaks; hyphenation marks and object anchors are dropped
+WORD_CONTROL_CHARS = str.maketrans({
+    '\x07': '\t', '\x0b': '\n', '\x0c': '\n', '\x1e': '-', '\x1f': None,
+    '\x01': None, '\x08': None, '\x02': None, '\x05': None,
+    '\x13': None, '\x14': None, '\x15': None
+})
+# Field instructions between field-begin (0x13) and separator (0x14) or end
+# (0x15); the displayed result after the separator is kept
+WORD_FIELD_PATTERN = re.compile('\x13[^\x13\x14\x15]*[\x14\x15]')
+
+
+@register_backend('doc', 'olefile', modules=['olefile'])
+def _iter_word97(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    """Text of a Word 97-2003 binary from its piece table (text stories in CP order)."""
+    import olefile
+    with olefile.OleFileIO(str(file_path)) as ole:
+        if not ole.exists('WordDocument'):
+            raise ValueError("not a Word document")
+        word = ole.openstream('WordDocument').read()
+        ident, fib_version = struct.unpack_from('<HH', word, 0)
+        flags = struct.unpack_from('<H', word, 0x0A)[0]
+        # nFib 0xC1 (193) is Word 97; Word 6/95 (101-104) use a different layout
+        if ident != 0xA5EC or fib_version < 0xC1:
+            raise ValueError("Word 95 and older files are not supported")
+        if flags & 0x0100:
+            raise ValueError("document is encrypted")
+        table = ole.openstream('1Table' if flags & 0x0200 else '0Table').read()
+
+    fc_clx, lcb_clx = struct.unpack_from('<II', word, 0x01A2)
+    clx = table[fc_clx:fc_clx + lcb_clx]
+    pos = 0
+    # Skip property modifiers (Prc) up to the piece table (Pcdt)
+    while pos < len(clx) and clx[pos] == 0x01:
+        pos += 3 + struct.unpack_from('<h', clx, pos + 1)[0]
+    if pos >= len(clx) or clx[pos] != 0x02:
+        raise ValueError("piece table not found")
+    size = struct.unpack_from('<I', clx, pos + 1)[0]
+    plc = clx[pos + 5:pos + 5 + size]
+    pieces = (size - 4) // 12
+    cps = struct.unpack_from(f'<{pieces + 1}I', plc, 0)
+
+    pending = ''
+    for i in range(pieces):
+        length = cps[i + 1] - cps[i]
+        fc = struct.unpack_from('<I', plc, 4 * (pieces + 1) + 8 * i + 2)[0]
+        if fc & 0x40000000:
+            # Compressed piece: one cp1252 byte per character
+            offset = (fc & ~0x40000000) // 2
+            text = word[offset:offset + length].decode('cp1252', 'replace')
+        else:
+            text = word[fc:fc + 2 * length].decode('utf-16-le', 'replace')
+        pending += text
+        *paragraphs, pending = pending.split('\r')
+        for paragraph in paragraphs:
+            yield _clean_word_text(paragraph) + "\n"
+    if pending:
+        yield _clean_word_text(pending) + "\n"
+
+
+def _clean_word_text(text: str) -> str:
+    while '\x13' in text:
+        # Innermost fields first
+        text, count = WORD_FIELD_PATTERN.subn('', text)
+        if not count:
+            break
+    return text.translate(WORD_CONTROL_CHARS)
+
+
+# OpenDocument
+
+ODF_TEXT = 'urn:oasis:names:tc:opendocument:xmlns:text:1.0'
+ODF_PARAGRAPHS = {f'{{{ODF_TEXT}}}p', f'{{{ODF_TEXT}}}h'}
+
+
+@register_backend('odt', 'odf-xml')
+def _iter_odt(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    with zipfile.ZipFile(file_path) as archive, archive.open('content.xml') as content:
+        depth = 0
+        for event, element in ElementTree.iterparse(content, events=('start', 'end')):
+            if element.tag not in ODF_PARAGRAPHS:
+                continue
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                # Outermost paragraph only; nested ones (e.g. in frames) are inside its text
+                yield _odf_text(element) + "\n"
+                element.clear()
+
+
+def _odf_text(element) -> str:
+    parts = [element.text or '']
+    for child in element:
+        tag = child.tag
+        if tag == f'{{{ODF_TEXT}}}s':
+            parts.append(' ' * int(child.get(f'{{{ODF_TEXT}}}c', '1')))
+        elif tag == f'{{{ODF_TEXT}}}tab':
+            parts.append('\t')
+        elif tag == f'{{{ODF_TEXT}}}line-break':
+            parts.append('\n')
+        elif tag in ODF_PARAGRAPHS:
+            parts.append('\n' + _odf_text(child))
+        else:
+            parts.append(_odf_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+# RTF
+
+RTF_TOKEN_PATTERN = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-fA-F]{2})|\\([^a-zA-Z])|([{}])|[\r\n]+|([^\\{}\r\n]+)"
+)
+# Groups whose content is never document text
+RTF_SKIP_DESTINATIONS = {
+    'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'object', 'themedata',
+    'colorschememapping', 'latentstyles', 'datastore', 'xmlnstbl', 'listtable',
+    'listoverridetable', 'rsidtbl', 'generator', 'filetbl', 'revtbl', 'fldinst',
+    'bkmkstart', 'bkmkend', 'nonshppict'
+}
+RTF_SPECIAL = {
+    'par': '\n', 'line': '\n', 'sect': '\n', 'page': '\n', 'row': '\n',
+    'tab': '\t', 'cell': '\t', 'emdash': '\u2014', 'endash': '\u2013',
+    'bullet': '\u2022', 'lquote': '\u2018', 'rquote': '\u2019',
+    'ldblquote': '\u201c', 'rdblquote': '\u201d', '~': '\u00a0', '_': '-', '-': ''
+}
+
+
+@register_backend('rtf', 'rtf')
+def _iter_rtf(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    with open(file_path, 'rb') as f:
+        data = f.read().decode('latin-1')
+    match = re.search(r'\\ansicpg(\d+)', data[:SNIFF_BYTES])
+    codepage = f'cp{match.group(1)}' if match else 'cp1252'
+    try:
+        codecs.lookup(codepage)
+    except LookupError:
+        codepage = 'cp1252'
+
+    stack = []
+    skip = False
+    # ANSI fallback characters following each \uN (set by \ucN)
+    unicode_skip = 1
+    pending_skip = 0
+    out: List[str] = []
+    for word, arg, hex_code, symbol, brace, text in RTF_TOKEN_PATTERN.findall(data):
+        if brace:
+            if brace == '{':
+                stack.append((skip, unicode_skip))
+            elif stack:
+                skip, unicode_skip = stack.pop()
+            pending_skip = 0
+            continue
+        if skip:
+            continue
+        if hex_code:
+            if pending_skip:
+                pending_skip -= 1
+            else:
+                out.append(bytes([int(hex_code, 16)]).decode(codepage, 'replace'))
+            continue
+        if text:
+            dropped = min(pending_skip, len(text))
+            pending_skip -= dropped
+            out.append(text[dropped:])
+            continue
+        pending_skip = 0
+        if symbol == '*':
+            # Destinations marked ignorable
+            skip = True
+        elif symbol in RTF_SPECIAL:
+            out.append(RTF_SPECIAL[symbol])
+        elif symbol in ('\\', '{', '}'):
+            out.append(symbol)
+        elif word in RTF_SKIP_DESTINATIONS:
+            skip = True
+        elif word == 'uc':
+            unicode_skip = int(arg or 1)
+        elif word == 'u':
+            code = int(arg)
+            out.append(chr(code + 0x10000 if code < 0 else code))
+            pending_skip = unicode_skip
+        elif word in RTF_SPECIAL:
+            out.append(RTF_SPECIAL[word])
+            if RTF_SPECIAL[word] == '\n':
+                yield ''.join(out)
+                out = []
+    if out:
+        yield ''.join(out) + "\n"
+
+
+# HTML
+
+HTML_SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+HTML_BLOCK_TAGS = {
+    'p', 'div', 'br', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'table',
+    'section', 'article', 'header', 'footer', 'ul', 'ol', 'dl', 'dt', 'dd',
+    'pre', 'blockquote', 'hr', 'address', 'aside', 'nav', 'main', 'title'
+}
+HTML_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class _HTMLText(HTMLParser):
+    """Visible text of an HTML document, one line per block element."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: List[str] = []
+        self._line: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HTML_SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in ('td', 'th'):
+            self._line.append(' ')
+        elif tag in HTML_BLOCK_TAGS:
+            self.break_line()
+
+    def handle_endtag(self, tag):
+        if tag in HTML_SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in HTML_BLOCK_TAGS:
+            self.break_line()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._line.append(WHITESPACE_PATTERN.sub(' ', data))
+
+    def break_line(self):
+        line = ''.join(self._line).strip()
+        if line:
+            self.lines.append(line + "\n")
+        self._line = []
+
+
+@register_backend('html', 'html')
+def _iter_html(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+        if head.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        elif head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = 'utf-16'
+        else:
+            match = HTML_CHARSET_PATTERN.search(head)
+            encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)('replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        parser = _HTMLText()
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            parser.feed(decoder.decode(head + block))
+            head = b''
+            yield ''.join(parser.lines)
+            parser.lines = []
+        parser.feed(decoder.decode(head, final=True))
+        parser.close()
+        parser.break_line()
+        yield ''.join(parser.lines)
+
+
+# Plain text
+
+@register_backend('txt', 'text')
+def _iter_txt(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+        if head.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        elif head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = 'utf-16'
+        else:
+            # Resumes saved by older Windows editors are often cp1252
+            try:
+                codecs.getincrementaldecoder('utf-8')().decode(head)
+                encoding = 'utf-8'
+            except UnicodeDecodeError:
+                encoding = 'cp1252'
+        decoder = codecs.getincrementaldecoder(encoding)('replace')
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            yield decoder.decode(head + block)
+            head = b''
+        yield decoder.decode(head, final=True)
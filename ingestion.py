@@ -0,0 +1,203 @@
+"""
+Parallel resume ingestion.
+
+PDF text extraction and spaCy parsing are CPU-bound, so bulk screening is
+spread over a process pool. Each worker process builds one ResumeParser (and
+therefore loads the spaCy model) once, in the pool initializer, and then
+parses chunks of files submitted by the parent.
+
+Each file gets timeout_per_file seconds inside the worker (via SIGALRM where
+available); the parent also stops waiting once the whole batch is past the
+time it could take at that rate, and replaces the pool if any chunk is
+still running then.
+"""
+
+import math
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+import metrics
+from resume_matcher import file_format
+
+
+# Per-process parser and per-file time limit, set once by _init_worker
+_worker_parser = None
+_worker_timeout: Optional[float] = None
+
+
+class _FileTimeout(BaseException):
+    """
+    Raised by SIGALRM when a file runs out of time. A BaseException so the
+    extractors' and parser's `except Exception` handlers (which keep partial
+    text or try the next backend) cannot swallow it.
+    """
+
+
+def _on_alarm(signum, frame):
+    raise _FileTimeout()
+
+
+def _init_worker(parser_options: Dict, timeout_per_file: Optional[float] = None):
+    """Pool initializer: load the parser (and spaCy model) once per worker."""
+    global _worker_parser, _worker_timeout
+    from resume_matcher import ResumeParser
+    _worker_parser = ResumeParser(**parser_options)
+    if timeout_per_file and hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _on_alarm)
+        _worker_timeout = timeout_per_file
+
+
+def _parse_chunk(paths: List[str]) -> List[Tuple[bool, object]]:
+    """Parse a chunk of files in a worker, returning (ok, record_or_error)."""
+    results = []
+    for path in paths:
+        try:
+            if _worker_timeout:
+                # The clock starts when this file starts parsing
+                signal.setitimer(signal.ITIMER_REAL, _worker_timeout)
+            try:
+                results.append((True, _worker_parser.parse_resume(path)))
+            finally:
+                if _worker_timeout:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        except _FileTimeout:
+            results.append((False, f'timed out after {_worker_timeout:g}s'))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+
+class ParallelIngestor:
+    """Parses resumes on a pool of worker processes, preserving input order."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = 8,
+        timeout_per_file: float = 30.0,
+        cache=None,
+        version: Optional[str] = None,
+        parser_options: Optional[Dict] = None
+    ):
+        """
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Number of files sent to a worker per task
+            timeout_per_file: Seconds a file may take to parse, counted from
+                when its worker starts on it, before it is failed
+            cache: Optional ParseCache consulted in the parent process
+            version: Parser version used for cache keys
+            parser_options: Keyword arguments for each worker's ResumeParser
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.timeout_per_file = timeout_per_file
+        self.cache = cache
+        self.version = version
+        self.parser_options = parser_options or {}
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.parser_options, self.timeout_per_file)
+            )
+        return self._executor
+
+    def parse(self, paths: List[str]) -> List[Optional[Dict]]:
+        """
+        Parse files in parallel.
+
+        Returns:
+            One entry per input path, in order; None where parsing failed
+            or timed out
+        """
+        results: List[Optional[Dict]] = [None] * len(paths)
+        pending = []
+        keys = {}
+        for i, path in enumerate(paths):
+            if self.cache is not None:
+                try:
+                    keys[i] = self.cache.key_for_file(path, self.version)
+                except OSError as e:
+                    self._failed(path, e)
+                    continue
+                cached = self.cache.get(keys[i])
+                if cached is not None:
+                    cached['file_path'] = path
+                    results[i] = cached
+                    continue
+            pending.append(i)
+
+        if not pending:
+            return results
+
+        executor = self._get_executor()
+        chunks = [
+            pending[start:start + self.chunk_size]
+            for start in range(0, len(pending), self.chunk_size)
+        ]
+        futures = [
+            executor.submit(_parse_chunk, [paths[i] for i in chunk])
+            for chunk in chunks
+        ]
+        # Backstop for files the in-worker limit cannot interrupt (e.g. stuck
+        # in C code): every file taking timeout_per_file, chunks run
+        # self.workers at a time, plus one extra file's worth for startup
+        rounds = math.ceil(len(chunks) / self.workers)
+        deadline = self.timeout_per_file * (rounds * self.chunk_size + 1)
+        _, not_done = wait(futures, timeout=deadline)
+
+        for chunk, future in zip(chunks, futures):
+            if future in not_done:
+                future.cancel()
+                for i in chunk:
+                    self._failed(paths[i], 'timed out')
+                continue
+            try:
+                outcomes = future.result()
+            except Exception as e:
+                for i in chunk:
+                    self._failed(paths[i], e)
+                continue
+
+            for i, (ok, value) in zip(chunk, outcomes):
+                if not ok:
+                    self._failed(paths[i], value)
+                    continue
+                metrics.inc('resume_matcher_parsed_total', format=file_format(paths[i]))
+                results[i] = value
+                if i in keys:
+                    self.cache.put(keys[i], value)
+
+        if not_done:
+            # Stuck workers would otherwise keep their slots; start a new pool
+            self._restart()
+
+        return results
+
+    @staticmethod
+    def _failed(path: str, error) -> None:
+        metrics.inc('resume_matcher_parse_failures_total', format=file_format(path))
+        print(f"Error parsing {path}: {error}")
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _restart(self) -> None:
+        """Drop the pool without waiting for it; a fresh one is created on next use."""
+        executor, self._executor = self._executor, None
+        executor.shutdown(wait=False, cancel_futures=True)
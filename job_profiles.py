@@ -0,0 +1,202 @@
+"""
+Compiled job profiles.
+
+A JobProfile holds everything the matcher derives from a job description:
+the extracted requirements, the job's TF-IDF vector (for corpus-fitted
+vectorizers) and the score weights. Profiles are identified by a hash of the
+normalized job text, parser version and any non-default weights (so the
+same job with different weights is a different profile), kept in an in-memory LRU and
+optionally persisted as JSON, so re-running the same job against new
+resumes skips all job-side work.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Relative weight of each score component, by scoring.SCORERS name; zero
+# weights switch a component off
+DEFAULT_WEIGHTS = {'skills': 0.4, 'experience': 0.3, 'semantic': 0.3, 'education': 0.0, 'keywords': 0.0}
+
+
+def normalize_job_text(text: str) -> str:
+    """Case- and whitespace-insensitive form of a job description."""
+    return ' '.join(text.split()).lower()
+
+
+def profile_id_for(text: str, version: str, weights: Optional[Dict[str, float]] = None) -> str:
+    """Stable profile ID for a job description under a parser version and weights."""
+    key = f"{version}\n{normalize_job_text(text)}"
+    overrides = {
+        name: float(value) for name, value in (weights or {}).items()
+        if float(value) != DEFAULT_WEIGHTS.get(name)
+    }
+    if overrides:
+        # Canonical form, so equal weights always give the same ID
+        key += '\n' + json.dumps(overrides, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:24]
+
+
+class JobProfile:
+    """Precompiled requirements, vector and weights for one job."""
+
+    def __init__(
+        self,
+        profile_id: str,
+        requirements: Dict,
+        weights: Optional[Dict[str, float]] = None,
+        created_at: Optional[float] = None
+    ):
+        """
+        Args:
+            profile_id: ID from profile_id_for
+            requirements: JobAnalyzer.analyze_job output
+            weights: This job's own score weights (the rest come from
+                DEFAULT_WEIGHTS when scoring; see scoring.resolve_weights)
+            created_at: Creation timestamp (defaults to now)
+        """
+        self.id = profile_id
+        self.requirements = requirements
+        self.weights = dict(weights or {})
+        self.created_at = created_at or time.time()
+        # TF-IDF row for the vectorizer identified by vectorizer_id
+        self.vector = None
+        self.vectorizer_id: Optional[str] = None
+        self._stored_vector: Optional[Dict] = None
+
+    @property
+    def job_data(self) -> Dict:
+        """Requirements in the form rank_candidates expects (weights are resolved per call)."""
+        return self.requirements
+
+    def set_vector(self, vector, vectorizer_id: str) -> None:
+        self.vector = vector
+        self.vectorizer_id = vectorizer_id
+        self._stored_vector = None
+
+    def vector_for(self, vectorizer_id: str):
+        """The cached job vector if it was built by this vectorizer, else None."""
+        if self.vectorizer_id != vectorizer_id:
+            return None
+        if self.vector is None and self._stored_vector is not None:
+            from scipy import sparse
+            stored = self._stored_vector
+            self.vector = sparse.csr_matrix(
+                (stored['data'], stored['indices'], [0, len(stored['indices'])]),
+                shape=(1, stored['n_features'])
+            )
+        return self.vector
+
+    def to_dict(self) -> Dict:
+        data = {
+            'id': self.id,
+            'requirements': self.requirements,
+            'weights': self.weights,
+            'created_at': self.created_at
+        }
+        if self.vector is not None:
+            data['vector'] = {
+                'vectorizer_id': self.vectorizer_id,
+                'n_features': self.vector.shape[1],
+                'indices': self.vector.indices.tolist(),
+                'data': self.vector.data.tolist()
+            }
+        elif self._stored_vector is not None:
+            data['vector'] = dict(self._stored_vector, vectorizer_id=self.vectorizer_id)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'JobProfile':
+        profile = cls(
+            data['id'],
+            data['requirements'],
+            weights=data.get('weights'),
+            created_at=data.get('created_at')
+        )
+        stored = data.get('vector')
+        if stored:
+            profile.vectorizer_id = stored['vectorizer_id']
+            profile._stored_vector = stored
+        return profile
+
+    def summary(self) -> Dict:
+        """JSON-serializable view without the raw text and vector."""
+        return {
+            'job_profile_id': self.id,
+            'required_skills': self.requirements.get('required_skills', []),
+            'keywords': self.requirements.get('keywords', []),
+            'experience_required': self.requirements.get('experience_required', 0),
+            'education_required': self.requirements.get('education_required', 0),
+            'weights': dict(DEFAULT_WEIGHTS, **self.weights),
+            'created_at': self.created_at
+        }
+
+
+class JobProfileStore:
+    """LRU of job profiles, optionally persisted as one JSON file each."""
+
+    def __init__(self, directory: Optional[str] = None, memory_entries: int = 256):
+        """
+        Args:
+            directory: Where profiles are persisted (None = memory only)
+            memory_entries: Profiles kept in memory
+        """
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self._memory: 'OrderedDict[str, JobProfile]' = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, profile_id: str) -> Optional[JobProfile]:
+        """Return a profile by ID, loading it from disk if needed."""
+        with self._lock:
+            profile = self._memory.get(profile_id)
+            if profile is not None:
+                self._memory.move_to_end(profile_id)
+                return profile
+
+        path = self._path(profile_id)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                profile = JobProfile.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading job profile {profile_id}: {e}")
+            return None
+        with self._lock:
+            self._remember(profile)
+        return profile
+
+    def put(self, profile: JobProfile) -> None:
+        """Store (or replace) a profile."""
+        with self._lock:
+            self._remember(profile)
+        path = self._path(profile.id)
+        if path is not None:
+            # Unique temp name so concurrent writers never share a file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(profile.to_dict(), f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def _path(self, profile_id: str) -> Optional[str]:
+        # IDs are hex digests; anything else cannot name a stored profile
+        if not self.directory or not profile_id.isalnum():
+            return None
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def _remember(self, profile: JobProfile) -> None:
+        self._memory[profile.id] = profile
+        self._memory.move_to_end(profile.id)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
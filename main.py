@@ -4,20 +4,186 @@ Command-line interface for the Resume Matching System
 
 import argparse
 import json
+import pickle
 from pathlib import Path
+import exporters
 from resume_matcher import ResumeMatcher
+from resume_index import ResumeIndex, find_resumes
+from skill_taxonomy import SkillTaxonomy
+
+
+JOB_EXTENSIONS = ('.txt', '.md')
+
+
+def read_text(path) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def parse_weights(text: str):
+    """
+    Parse --weights, e.g. "skills=0.5,experience=0.2,education=0.1".
+    
+    Raises:
+        ValueError: For malformed pairs or invalid weights
+    """
+    from scoring import resolve_weights
+    weights = {}
+    for pair in filter(None, (part.strip() for part in text.split(','))):
+        name, _, value = pair.partition('=')
+        try:
+            weights[name.strip()] = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid weight '{pair}' (expected name=number)") from None
+    resolve_weights(weights)
+    return weights
+
+
+def fit_vectorizer(matcher: ResumeMatcher, texts, path: str) -> None:
+    """Fit the TF-IDF vocabulary on the screened resumes and save it for later runs."""
+    try:
+        matcher.fit_corpus(texts)
+    except ValueError as e:
+        print(f"Error fitting vectorizer: {e}")
+        return
+    matcher.save_vectorizer(path)
+    print(f"Saved TF-IDF vectorizer fitted on {len(texts)} resume(s) to {path}")
+
+
+def fit_lsa(matcher: ResumeMatcher, texts, path: str) -> None:
+    """Fit an LSA encoder on the screened resumes, save it and score with it."""
+    from embeddings import EmbeddingScorer, LsaEncoder
+    try:
+        encoder = LsaEncoder().fit(texts)
+    except ValueError as e:
+        print(f"Error fitting LSA encoder: {e}")
+        return
+    encoder.save(path)
+    matcher.semantic_scorer = EmbeddingScorer(encoder)
+    print(f"Saved LSA encoder fitted on {len(texts)} resume(s) to {path}")
+
+
+def find_job_files(paths):
+    """Job description files given directly or found in the given directories."""
+    job_files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            job_files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in JOB_EXTENSIONS))
+        elif path.is_file():
+            job_files.append(path)
+        else:
+            print(f"Warning: {path} is not a file or directory, skipping")
+    return job_files
+
+
+def batch_output_path(output: Path, name: str) -> Path:
+    """Per-job output file for --jobs, e.g. shortlist.csv -> shortlist.backend_dev.csv."""
+    return output.with_name(f"{output.stem}.{name}{output.suffix}")
+
+
+def print_batch_results(batch, job_files, output=None, fmt=None, columns=None):
+    """
+    Display per-job rankings (and best jobs per candidate) for --jobs.
+    
+    With an output path, each job's matches are exported to their own file
+    (see batch_output_path) with the selected columns, and the best jobs
+    per candidate go to <output>.best_jobs.json.
+    """
+    for job_file, job in zip(job_files, batch['jobs']):
+        print("=" * 80)
+        print(f"{job_file.name} ({job['job_profile_id']})")
+        print("=" * 80)
+        for i, candidate in enumerate(job['matches'], 1):
+            print(f"{i}. {candidate['name']} - {candidate['match_score']}% "
+                  f"(skills {candidate['skills_match']*100:.1f}%) - {candidate['file_path']}")
+        print()
+    
+    if batch['candidates']:
+        print("=" * 80)
+        print("BEST JOBS PER CANDIDATE")
+        print("=" * 80)
+        for candidate in batch['candidates']:
+            best = ', '.join(
+                f"{job_files[job['job_index']].name} ({job['match_score']}%)"
+                for job in candidate['best_jobs']
+            )
+            print(f"{candidate['name']}: {best}")
+        print()
+    
+    if output:
+        output_path = Path(output)
+        fmt = fmt or exporters.format_for_path(output)
+        for job_file, job in zip(job_files, batch['jobs']):
+            job_path = batch_output_path(output_path, job_file.stem)
+            try:
+                count = exporters.write_export(
+                    job['matches'], str(job_path), fmt, columns or exporters.DEFAULT_COLUMNS
+                )
+            except ImportError as e:
+                print(f"Error saving results: {e}")
+                return
+            print(f"Saved {count} result(s) for {job_file.name} to {job_path} ({fmt})")
+        if batch['candidates']:
+            # Names, emails and scores only; no parsed resume data
+            best_path = output_path.with_name(f"{output_path.stem}.best_jobs.json")
+            for candidate in batch['candidates']:
+                for job in candidate['best_jobs']:
+                    job['job_file'] = str(job_files[job['job_index']])
+            with open(best_path, 'w', encoding='utf-8') as f:
+                json.dump(batch['candidates'], f, indent=2, default=str)
+            print(f"Saved best jobs per candidate to {best_path}")
+
+
+def print_results(results, output=None, fmt=None, columns=None):
+    """
+    Display ranked candidates and optionally save them.
+    
+    Args:
+        fmt: json, jsonl, csv or parquet (inferred from the output extension)
+        columns: Columns to export (default: exporters.DEFAULT_COLUMNS)
+    """
+    print("=" * 80)
+    print("MATCHING RESULTS")
+    print("=" * 80)
+    print(f"\nTop {len(results)} Candidates:\n")
+    
+    for i, candidate in enumerate(results, 1):
+        print(f"{i}. {candidate['name']}")
+        print(f"   Email: {candidate['email']}")
+        print(f"   Match Score: {candidate['match_score']}%")
+        print(f"   Skills Match: {candidate['skills_match']*100:.1f}%")
+        print(f"   File: {candidate['file_path']}")
+        print()
+    
+    # Save to file if requested
+    if output:
+        output_path = Path(output)
+        fmt = fmt or exporters.format_for_path(output)
+        try:
+            count = exporters.write_export(results, str(output_path), fmt, columns or exporters.DEFAULT_COLUMNS)
+        except ImportError as e:
+            print(f"Error saving results: {e}")
+            return
+        print(f"\nSaved {count} result(s) to {output_path} ({fmt})")
 
 
 def main():
     parser = argparse.ArgumentParser(
         description='AI-Powered Resume Screening and Candidate Matching'
     )
-    parser.add_argument(
+    job_group = parser.add_mutually_exclusive_group(required=True)
+    job_group.add_argument(
         '--job',
         type=str,
-        required=True,
         help='Job description text or path to job description file'
     )
+    job_group.add_argument(
+        '--jobs',
+        type=str,
+        nargs='+',
+        help='Several job description files (or directories of .txt/.md files) '
+             'to match against the same resumes in one pass'
+    )
     parser.add_argument(
         '--resumes',
         type=str,
@@ -36,77 +202,280 @@ def main():
         default=0.0,
         help='Minimum match score threshold (0-100, default: 0)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes used to parse resumes (default: 1)'
+    )
+    parser.add_argument(
+        '--skills-taxonomy',
+        type=str,
+        help='JSON skill taxonomy (skill -> aliases) to use instead of the built-in list'
+    )
+    parser.add_argument(
+        '--max-pages',
+        type=int,
+        help='Only read this many pages of each PDF resume (default: all)'
+    )
+    parser.add_argument(
+        '--max-chars',
+        type=int,
+        help='Only read this many characters of each resume (default: all)'
+    )
+    parser.add_argument(
+        '--semantic-encoder',
+        type=str,
+        help='Score semantic similarity with dense embeddings instead of TF-IDF, '
+             'e.g. spacy:en_core_web_md, onnx:/path/to/model_dir or lsa:/path/to/lsa.pkl'
+    )
+    parser.add_argument(
+        '--fit-lsa',
+        type=str,
+        metavar='PATH',
+        help='Fit an LSA encoder on the resumes being screened, save it to PATH '
+             '(for --semantic-encoder lsa:PATH) and score with it'
+    )
+    parser.add_argument(
+        '--vectorizer',
+        type=str,
+        help='Score with a TF-IDF vectorizer saved by --fit-vectorizer instead of '
+             'fitting one on every run'
+    )
+    parser.add_argument(
+        '--fit-vectorizer',
+        type=str,
+        metavar='PATH',
+        help='Fit the TF-IDF vectorizer on the resumes being screened, save it to '
+             'PATH (for --vectorizer) and score with it'
+    )
+    parser.add_argument(
+        '--weights',
+        type=str,
+        help='Relative score weights, e.g. skills=0.4,experience=0.3,semantic=0.3,'
+             'education=0.1,keywords=0 (unlisted components keep their defaults)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse and score resumes in chunks, keeping only the top N in memory'
+    )
+    parser.add_argument(
+        '--best-jobs',
+        type=int,
+        default=0,
+        help='With --jobs, also list each candidate\'s best N jobs (default: 0)'
+    )
+    parser.add_argument(
+        '--index',
+        type=str,
+        help='Keep parsed resumes in this index directory and only re-parse '
+             'new or changed files on each run'
+    )
+    parser.add_argument(
+        '--candidate-limit',
+        type=int,
+        help='With --index, only fully score the N resumes sharing the most '
+             'terms/skills with the job (default: score all)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running, updating the index (and results) as resume files '
+             'are added, changed or deleted (requires --index)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=5.0,
+        help='Seconds between directory scans in --watch mode (default: 5)'
+    )
     parser.add_argument(
         '--output',
         type=str,
-        help='Output file path for JSON results (optional)'
+        help='Output file path for results (optional)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=exporters.FORMATS,
+        help='Output format (default: from the --output extension, else json; '
+             'parquet requires pyarrow)'
+    )
+    parser.add_argument(
+        '--columns',
+        type=str,
+        help=f"Comma-separated columns to export, or 'all' "
+             f"(default: {','.join(exporters.DEFAULT_COLUMNS)}; "
+             f"available: {','.join(exporters.COLUMNS)})"
     )
     
     args = parser.parse_args()
+    columns = None
+    if args.columns:
+        try:
+            columns = exporters.parse_columns(args.columns)
+        except ValueError as e:
+            parser.error(str(e))
+    weights = None
+    if args.weights:
+        try:
+            weights = parse_weights(args.weights)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.watch and not args.index:
+        parser.error('--watch requires --index')
+    if args.candidate_limit is not None and (not args.index or args.candidate_limit <= 0):
+        parser.error('--candidate-limit requires --index and a positive count')
+    if args.jobs and (args.index or args.stream):
+        parser.error('--jobs cannot be combined with --index or --stream')
+    if args.fit_vectorizer and (args.vectorizer or args.stream):
+        parser.error('--fit-vectorizer cannot be combined with --vectorizer or --stream')
+    if args.fit_lsa and (args.semantic_encoder or args.stream):
+        parser.error('--fit-lsa cannot be combined with --semantic-encoder or --stream')
     
     # Initialize matcher
     print("Initializing Resume Matcher...")
-    matcher = ResumeMatcher()
+    taxonomy = None
+    if args.skills_taxonomy:
+        taxonomy = SkillTaxonomy.from_file(args.skills_taxonomy)
+    semantic_scorer = None
+    if args.semantic_encoder:
+        from embeddings import EmbeddingScorer, create_encoder
+        semantic_scorer = EmbeddingScorer(create_encoder(args.semantic_encoder))
+    matcher = ResumeMatcher(
+        workers=args.workers,
+        taxonomy=taxonomy,
+        max_pages=args.max_pages,
+        max_chars=args.max_chars,
+        semantic_scorer=semantic_scorer
+    )
+    if args.vectorizer:
+        try:
+            matcher.load_vectorizer(args.vectorizer)
+        except (OSError, pickle.UnpicklingError) as e:
+            print(f"Error loading vectorizer {args.vectorizer}: {e}")
+            return
     
-    # Get job description
-    job_path = Path(args.job)
-    if job_path.is_file():
-        with open(job_path, 'r', encoding='utf-8') as f:
-            job_description = f.read()
+    # Get job description(s)
+    if args.jobs:
+        job_files = find_job_files(args.jobs)
+        if not job_files:
+            print("No job description files found")
+            return
+        job_descriptions = [read_text(path) for path in job_files]
     else:
-        job_description = args.job
+        job_path = Path(args.job)
+        job_description = read_text(job_path) if job_path.is_file() else args.job
     
     # Get resume paths
-    resume_path = Path(args.resumes)
-    resume_paths = []
-    
-    if resume_path.is_file():
-        resume_paths = [str(resume_path)]
-    elif resume_path.is_dir():
-        # Find all resume files in directory
-        extensions = ['.pdf', '.docx', '.doc', '.txt']
-        for ext in extensions:
-            resume_paths.extend(resume_path.glob(f'*{ext}'))
-        resume_paths = [str(p) for p in resume_paths]
-    else:
+    try:
+        resume_paths = find_resumes(args.resumes)
+    except FileNotFoundError:
         print(f"Error: {args.resumes} is not a valid file or directory")
         return
     
+    if args.index:
+        index = ResumeIndex(args.index, matcher)
+        
+        def match_index():
+            results = matcher.match_store(
+                job_description,
+                index.store,
+                top_n=args.top,
+                min_score=args.min_score / 100.0,
+                weights=weights,
+                candidates=index.candidates if args.candidate_limit else None,
+                candidate_limit=args.candidate_limit or 0
+            )
+            print_results(results, args.output, args.format, columns)
+        
+        stats = index.update(resume_paths)
+        matcher.close()
+        print(f"\nIndexed {len(index)} resume(s): {stats['added']} added, "
+              f"{stats['changed']} changed, {stats['removed']} removed, "
+              f"{stats['unchanged']} unchanged, {stats['failed']} failed")
+        if args.fit_vectorizer:
+            fit_vectorizer(matcher, list(index.store.texts(index.store.live_indices())), args.fit_vectorizer)
+        if args.fit_lsa:
+            fit_lsa(matcher, list(index.store.texts(index.store.live_indices())), args.fit_lsa)
+            # Nothing changed on disk, so this only embeds and saves the resumes
+            index.update(resume_paths)
+        print(f"Matching candidates to job description...\n")
+        match_index()
+        
+        if args.watch:
+            def on_update(stats):
+                print(f"\nIndex updated: {stats['added']} added, {stats['changed']} changed, "
+                      f"{stats['removed']} removed\n")
+                match_index()
+            
+            print(f"\nWatching {args.resumes} for changes (Ctrl+C to stop)...")
+            index.watch(lambda: find_resumes(args.resumes), args.interval, on_update)
+            matcher.close()
+        return
+    
     if not resume_paths:
         print(f"No resume files found in {args.resumes}")
         return
     
     print(f"\nFound {len(resume_paths)} resume(s)")
-    print(f"Matching candidates to job description...\n")
     
-    # Match candidates
-    results = matcher.match_candidates(
-        job_description=job_description,
-        resume_paths=resume_paths,
-        top_n=args.top,
-        min_score=args.min_score / 100.0
-    )
+    candidates = None
+    if args.fit_vectorizer or args.fit_lsa:
+        # Parsed once here and ranked below instead of parsing again
+        candidates = matcher.parse_resumes(resume_paths)
+    if args.fit_vectorizer:
+        fit_vectorizer(matcher, [c['raw_text'] for c in candidates], args.fit_vectorizer)
+    if args.fit_lsa:
+        fit_lsa(matcher, [c['raw_text'] for c in candidates], args.fit_lsa)
     
-    # Display results
-    print("=" * 80)
-    print("MATCHING RESULTS")
-    print("=" * 80)
-    print(f"\nTop {len(results)} Candidates:\n")
+    if args.jobs:
+        print(f"Matching candidates to {len(job_files)} job descriptions...\n")
+        if candidates is None:
+            batch = matcher.match_jobs(
+                job_descriptions,
+                resume_paths,
+                top_n=args.top,
+                min_score=args.min_score / 100.0,
+                jobs_per_candidate=args.best_jobs,
+                weights=weights
+            )
+        else:
+            batch = matcher.rank_jobs(
+                [matcher.compile_job(job) for job in job_descriptions],
+                candidates,
+                top_n=args.top,
+                min_score=args.min_score / 100.0,
+                jobs_per_candidate=args.best_jobs,
+                weights=weights
+            )
+        matcher.close()
+        print_batch_results(batch, job_files, args.output, args.format, columns)
+        return
     
-    for i, candidate in enumerate(results, 1):
-        print(f"{i}. {candidate['name']}")
-        print(f"   Email: {candidate['email']}")
-        print(f"   Match Score: {candidate['match_score']}%")
-        print(f"   Skills Match: {candidate['skills_match']*100:.1f}%")
-        print(f"   File: {candidate['file_path']}")
-        print()
+    print(f"Matching candidates to job description...\n")
     
-    # Save to file if requested
-    if args.output:
-        output_path = Path(args.output)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"\nResults saved to {output_path}")
+    # Match candidates
+    if candidates is None:
+        results = matcher.match_candidates(
+            job_description=job_description,
+            resume_paths=resume_paths,
+            top_n=args.top,
+            min_score=args.min_score / 100.0,
+            streaming=args.stream,
+            weights=weights
+        )
+    else:
+        results = matcher.rank_candidates(
+            matcher.compile_job(job_description),
+            candidates,
+            top_n=args.top,
+            min_score=args.min_score / 100.0,
+            weights=weights
+        )
+    matcher.close()
+    
+    print_results(results, args.output, args.format, columns)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,171 @@
+"""
+Lightweight in-process instrumentation.
+
+Stage timers and counters used across the pipeline, rendered in the
+Prometheus text exposition format for the /api/metrics endpoint. Timers
+also feed an optional per-request collector, which the Flask app turns
+into a Server-Timing header.
+
+Metrics are per process: each gunicorn worker (and each parallel ingestion
+worker) keeps its own registry.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+STAGE_SECONDS = 'resume_matcher_stage_seconds'
+
+_HELP = {
+    STAGE_SECONDS: 'Time spent in each pipeline stage',
+    'resume_matcher_parse_cache_total': 'Parse cache lookups by result',
+    'resume_matcher_parsed_total': 'Resumes parsed by file format',
+    'resume_matcher_parse_failures_total': 'Resume parse failures by file format',
+    'resume_matcher_extracted_total': 'Documents read by detected format and extraction backend',
+    'resume_matcher_extraction_seconds': 'Text extraction time by detected format and backend',
+    'resume_matcher_http_request_seconds': 'HTTP request latency by endpoint',
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms keyed by name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets=DEFAULT_BUCKETS, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(tuple(buckets))
+            histogram.observe(value)
+
+    def counter_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                self._header(lines, name, 'counter')
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(key)} {_number(value)}")
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, 'histogram')
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(
+                            f"{name}_bucket{_labels(key + (('le', _number(bound)),))} {cumulative}"
+                        )
+                    lines.append(f"{name}_bucket{_labels(key + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{_labels(key)} {_number(histogram.total)}")
+                    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _header(lines: List[str], name: str, kind: str) -> None:
+        if name in _HELP:
+            lines.append(f"# HELP {name} {_HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+def _labels(key: LabelKey) -> str:
+    if not key:
+        return ''
+    escaped = (
+        k + '="' + str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for k, v in key
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+REGISTRY = MetricsRegistry()
+
+_request = threading.local()
+
+
+def start_request_timing() -> None:
+    """Begin collecting stage timings for the current thread's request."""
+    _request.timings = {}
+
+
+def finish_request_timing() -> Dict[str, float]:
+    """Stop collecting and return {stage: total seconds} for the request."""
+    timings = getattr(_request, 'timings', None) or {}
+    _request.timings = None
+    return timings
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Record an already measured stage duration."""
+    REGISTRY.observe(STAGE_SECONDS, seconds, stage=stage)
+    timings: Optional[Dict[str, float]] = getattr(_request, 'timings', None)
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Time a pipeline stage into the stage histogram (and request timings)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start)
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Increment a counter in the default registry."""
+    REGISTRY.inc(name, value, **labels)
+
+
+def server_timing_header(timings: Dict[str, float]) -> str:
+    """Format stage timings as a Server-Timing header value (milliseconds)."""
+    return ', '.join(
+        f"{stage};dur={seconds * 1000:.1f}"
+        for stage, seconds in timings.items()
+    )
@@ -0,0 +1,154 @@
+"""
+Persistent, content-addressed cache for parsed resumes.
+
+Entries are keyed by a hash of the file contents plus the parser version, so
+the same resume uploaded under a different name (or scored against another
+job) is parsed only once. A small in-process LRU sits in front of an SQLite
+file that stores zlib-compressed JSON records with LRU / size-bounded
+eviction.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import metrics
+
+
+class ParseCache:
+    """Two-tier (memory + SQLite) cache of ResumeParser output."""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 50000,
+        max_bytes: int = 256 * 1024 * 1024,
+        memory_entries: int = 512
+    ):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            max_entries: Maximum number of records kept on disk
+            max_bytes: Maximum total size of compressed records on disk
+            memory_entries: Size of the in-process LRU tier
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key_for_file(file_path: str, version: str) -> str:
+        """Content hash of a file combined with the parser version."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return f"{version}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached record, or None on a miss."""
+        with self._lock:
+            record = self._memory.get(key)
+            if record is not None:
+                self._memory.move_to_end(key)
+                metrics.inc('resume_matcher_parse_cache_total', result='memory_hit')
+                return dict(record)
+
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                metrics.inc('resume_matcher_parse_cache_total', result='miss')
+                return None
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._conn.commit()
+            record = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+            self._remember(key, record)
+            metrics.inc('resume_matcher_parse_cache_total', result='disk_hit')
+            return dict(record)
+
+    def put(self, key: str, record: Dict) -> None:
+        """Store a parsed record (the per-upload file_path is not cached)."""
+        record = {k: v for k, v in record.items() if k != 'file_path'}
+        data = zlib.compress(json.dumps(record, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, data, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time())
+            )
+            self._evict()
+            self._conn.commit()
+            self._remember(key, record)
+
+    def clear(self) -> None:
+        """Remove every cached record."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _remember(self, key: str, record: Dict) -> None:
+        """Insert into the memory tier, evicting the least recently used."""
+        self._memory[key] = record
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Drop least recently used rows until both bounds are respected."""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC"
+        )
+        stale = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            stale.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+        for (key,) in stale:
+            self._memory.pop(key, None)
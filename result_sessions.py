@@ -0,0 +1,173 @@
+"""
+Server-side result sessions.
+
+Match results are kept on the server under a result-session ID instead of
+being shipped to (and posted back from) the browser. Clients fetch pages of
+a session, sorted and filtered server-side, and exports are streamed from
+the stored results. Sessions expire after a TTL of inactivity; the least
+recently used are also evicted once max_sessions is reached.
+"""
+
+import math
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Sort name -> (key, descending by default)
+SORT_KEYS = {
+    'score': (lambda r: r['match_score'], True),
+    'skills_match': (lambda r: r['skills_match'], True),
+    'skills': (lambda r: len(r.get('skills') or []), True),
+    'name': (lambda r: (r.get('name') or '').lower(), False)
+}
+
+
+class ResultSession:
+    """Ranked, formatted results of one match, with paging and filtering."""
+
+    def __init__(self, results: List[Dict], session_id: Optional[str] = None):
+        """
+        Args:
+            results: Formatted match results, best first
+            session_id: ID to store the session under (random if omitted)
+        """
+        self.id = session_id or uuid.uuid4().hex
+        self.results = [dict(result, rank=i) for i, result in enumerate(results, 1)]
+        self.created_at = time.time()
+        self.last_access = self.created_at
+        self._stats: Optional[Dict] = None
+
+    def query(
+        self,
+        search: str = '',
+        min_score: float = 0.0,
+        sort: str = 'score',
+        descending: Optional[bool] = None
+    ) -> List[Dict]:
+        """
+        Results matching a search term (name, email or skill substring) and
+        a minimum score, in the requested order.
+
+        Raises:
+            ValueError: Unknown sort name
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"sort must be one of {', '.join(SORT_KEYS)}")
+        term = search.strip().lower()
+        results = [
+            r for r in self.results
+            if r['match_score'] >= min_score and (not term or _matches(r, term))
+        ]
+        key, default_descending = SORT_KEYS[sort]
+        if sort == 'score' and descending in (None, True):
+            # Already ranked best first
+            return results
+        return sorted(results, key=key, reverse=default_descending if descending is None else descending)
+
+    def page(self, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE, **query) -> Dict:
+        """
+        One page of query() results.
+
+        Returns:
+            {'results', 'page', 'page_size', 'pages', 'total'} where total
+            counts the filtered results
+        """
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        results = self.query(**query)
+        pages = max(1, math.ceil(len(results) / page_size))
+        page = max(1, min(page, pages))
+        start = (page - 1) * page_size
+        return {
+            'results': results[start:start + page_size],
+            'page': page,
+            'page_size': page_size,
+            'pages': pages,
+            'total': len(results)
+        }
+
+    def stats(self) -> Dict:
+        """Score and skill statistics over all results (computed once)."""
+        if self._stats is None:
+            scores = [r['match_score'] for r in self.results]
+            skill_counts = Counter(skill for r in self.results for skill in r.get('skills') or [])
+            self._stats = {
+                'total': len(scores),
+                'average_score': round(sum(scores) / len(scores), 2) if scores else 0.0,
+                'top_score': max(scores, default=0.0),
+                'lowest_score': min(scores, default=0.0),
+                'distribution': {
+                    'excellent': sum(1 for s in scores if s >= 80),
+                    'good': sum(1 for s in scores if 60 <= s < 80),
+                    'fair': sum(1 for s in scores if 40 <= s < 60),
+                    'poor': sum(1 for s in scores if s < 40)
+                },
+                'distinct_skills': len(skill_counts),
+                'top_skills': skill_counts.most_common(10)
+            }
+        return self._stats
+
+
+def _matches(result: Dict, term: str) -> bool:
+    return (
+        term in (result.get('name') or '').lower() or
+        term in (result.get('email') or '').lower() or
+        any(term in skill.lower() for skill in result.get('skills') or [])
+    )
+
+
+class ResultSessionStore:
+    """In-memory result sessions with TTL and LRU eviction."""
+
+    def __init__(self, ttl: float = 1800.0, max_sessions: int = 200):
+        """
+        Args:
+            ttl: Seconds a session is kept after its last access
+            max_sessions: Sessions kept before the least recently used go
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: 'OrderedDict[str, ResultSession]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, results: List[Dict], session_id: Optional[str] = None) -> ResultSession:
+        session = ResultSession(results, session_id)
+        with self._lock:
+            self._sessions[session.id] = session
+            self._sessions.move_to_end(session.id)
+            self._evict()
+        return session
+
+    def get(self, session_id: str) -> Optional[ResultSession]:
+        """Return a live session (refreshing its TTL), or None."""
+        with self._lock:
+            self._evict()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_access = time.time()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def get_or_create(self, session_id: str, results: Callable[[], List[Dict]]) -> ResultSession:
+        """The session with this ID, created from results() if it does not exist."""
+        session = self.get(session_id)
+        if session is None:
+            session = self.create(results(), session_id)
+        return session
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _evict(self) -> None:
+        # Sessions are ordered by last access, so expired ones are at the front
+        cutoff = time.time() - self.ttl
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_access >= cutoff and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
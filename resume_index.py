@@ -0,0 +1,270 @@
+"""
+Incremental resume index.
+
+Keeps the parsed resumes of a directory in a CandidateStore plus a manifest
+of each file's path, mtime, size and content hash, and a CandidateIndex of
+the stored rows for two-stage retrieval. update() re-parses only
+files that are new or whose contents changed and drops records of deleted
+files, so re-screening a large, mostly unchanged share costs a directory
+scan instead of a full parse. watch() polls the directory and keeps the
+index current as files arrive. With a semantic encoder, resume embeddings
+are saved alongside, so only new or changed resumes are encoded.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from candidate_index import CandidateIndex
+from columnar_store import CandidateStore
+from extractors import RESUME_EXTENSIONS
+from metrics import timed
+
+MANIFEST_FILE = 'manifest.json'
+RETRIEVAL_DIR = 'retrieval'
+EMBEDDINGS_DIR = 'embeddings'
+HASH_BLOCK_SIZE = 1024 * 1024
+# Rewrite the store once this fraction of its records are deleted
+COMPACT_RATIO = 0.25
+
+
+def find_resumes(path: str) -> List[str]:
+    """Resume files at a path (a single file, or a directory's top level)."""
+    resume_path = Path(path)
+    if resume_path.is_file():
+        return [str(resume_path)]
+    if not resume_path.is_dir():
+        raise FileNotFoundError(f"{path} is not a valid file or directory")
+    resume_paths = []
+    for ext in RESUME_EXTENSIONS:
+        resume_paths.extend(resume_path.glob(f'*{ext}'))
+    return [str(p) for p in resume_paths]
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResumeIndex:
+    """Parsed resumes of a directory, updated incrementally."""
+
+    def __init__(self, directory: str, matcher):
+        """
+        Args:
+            directory: Where the store and manifest are kept
+            matcher: ResumeMatcher used to parse resumes (its parser
+                version is recorded; a different version re-parses all)
+        """
+        self.directory = directory
+        self.matcher = matcher
+        self.store = CandidateStore(os.path.join(directory, 'store'))
+        # Inverted index over store rows (candidate ID = record index)
+        self.candidates = CandidateIndex()
+        self.manifest: Dict[str, Dict] = {}
+        # Encoder whose saved embeddings cover every stored resume
+        self.embedded_with: Optional[str] = None
+        self._load_manifest()
+        self._load_embeddings()
+
+    def update(self, paths: Iterable[str]) -> Dict[str, int]:
+        """
+        Bring the index in line with the given resume files.
+
+        Returns:
+            Counts of 'added', 'changed', 'removed', 'unchanged' and
+            'failed' files
+        """
+        stats = {'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 0, 'failed': 0}
+        current = {}
+        to_parse = []
+        for path in paths:
+            path = os.path.abspath(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Vanished between listing and stat; treated as removed
+                continue
+            current[path] = True
+            entry = self.manifest.get(path)
+            if entry is not None and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+                stats['unchanged'] += 1
+                continue
+            try:
+                digest = file_digest(path)
+            except OSError as e:
+                print(f"Error reading {path}: {e}")
+                continue
+            if entry is not None and entry['sha256'] == digest:
+                # Touched but not modified
+                entry.update(mtime=stat.st_mtime, size=stat.st_size)
+                stats['unchanged'] += 1
+                continue
+            stats['changed' if entry is not None else 'added'] += 1
+            to_parse.append((path, {'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': digest}))
+
+        for path in [p for p in self.manifest if p not in current]:
+            self._drop(path)
+            stats['removed'] += 1
+
+        if to_parse:
+            parsed = {
+                str(candidate['file_path']): candidate
+                for candidate in self.matcher.parse_resumes([path for path, _ in to_parse])
+            }
+            for path, entry in to_parse:
+                self._drop(path)
+                candidate = parsed.get(path)
+                if candidate is None:
+                    # Kept in the manifest so it is retried only once it changes
+                    stats['failed'] += 1
+                    entry['record'] = None
+                else:
+                    entry['record'] = self.store.append(candidate)
+                    self.candidates.add(entry['record'], candidate)
+                self.manifest[path] = entry
+            self.store.flush()
+
+        if len(self.store) and len(self.store) - len(self.store.live_indices()) > COMPACT_RATIO * len(self.store):
+            self._compact()
+        if to_parse or stats['removed']:
+            self.embedded_with = None
+        self._embed()
+        self._save_manifest()
+        return stats
+
+    def _embed(self) -> int:
+        """
+        Embed the stored resumes with the matcher's semantic scorer, if it
+        has one, and save the embeddings (only resumes not embedded yet are
+        encoded).
+
+        Returns:
+            Number of resumes encoded
+        """
+        scorer = self.matcher.semantic_scorer
+        if scorer is None or self.embedded_with == scorer.name:
+            return 0
+        from embeddings import text_key
+        live = self.store.live_indices()
+        with timed('embed'):
+            encoded = scorer.precompute(self.store.texts(live))
+        if scorer.index is not None:
+            # Drop embeddings of deleted or changed resumes
+            scorer.index.retain(text_key(text) for text in self.store.texts(live))
+            scorer.index.save(os.path.join(self.directory, EMBEDDINGS_DIR))
+        self.embedded_with = scorer.name
+        return encoded
+
+    def watch(
+        self,
+        list_paths: Callable[[], Iterable[str]],
+        interval: float = 5.0,
+        on_update: Optional[Callable[[Dict[str, int]], None]] = None
+    ) -> None:
+        """
+        Poll for new, changed and deleted files until interrupted.
+
+        Args:
+            list_paths: Returns the current resume files (e.g. find_resumes)
+            interval: Seconds between scans
+            on_update: Called with update() counts whenever something changed
+        """
+        try:
+            while True:
+                stats = self.update(list_paths())
+                if on_update is not None and (stats['added'] or stats['changed'] or stats['removed']):
+                    on_update(stats)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self.manifest.values() if entry['record'] is not None)
+
+    def _drop(self, path: str) -> None:
+        entry = self.manifest.pop(path, None)
+        if entry is not None and entry['record'] is not None:
+            self.store.delete(entry['record'])
+            self.candidates.remove(entry['record'])
+
+    def _compact(self) -> None:
+        mapping = self.store.compact()
+        for entry in self.manifest.values():
+            if entry['record'] is not None:
+                entry['record'] = mapping[entry['record']]
+        self.candidates.remap(mapping)
+
+    def _load_manifest(self) -> None:
+        path = os.path.join(self.directory, MANIFEST_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        except (OSError, ValueError) as e:
+            print(f"Error reading index manifest {path}: {e}")
+            data = {}
+        if data.get('parser_version') == self.matcher.parser.version and data.get('count') == len(self.store):
+            self.manifest = data['files']
+            self.embedded_with = data.get('embeddings')
+            self._load_candidates()
+            return
+        if len(self.store):
+            # Written by another parser version (or out of sync): start over
+            store_dir = self.store.directory
+            self.store.close()
+            shutil.rmtree(store_dir)
+            self.store = CandidateStore(store_dir)
+
+    def _load_candidates(self) -> None:
+        live = self.store.live_indices()
+        try:
+            candidates = CandidateIndex.load(os.path.join(self.directory, RETRIEVAL_DIR))
+        except FileNotFoundError:
+            candidates = None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading candidate index: {e}")
+            candidates = None
+        if candidates is not None and len(candidates) == len(live):
+            self.candidates = candidates
+            return
+        # Missing (index written before retrieval existed) or out of sync: rebuild
+        self.candidates = CandidateIndex()
+        for row in live:
+            self.candidates.add(int(row), self.store[int(row)])
+        if len(live):
+            self.candidates.save(os.path.join(self.directory, RETRIEVAL_DIR))
+
+    def _load_embeddings(self) -> None:
+        scorer = self.matcher.semantic_scorer
+        if scorer is None or scorer.index is not None or self.embedded_with != scorer.name:
+            return
+        from embeddings import EmbeddingIndex
+        try:
+            scorer.index = EmbeddingIndex.load(os.path.join(self.directory, EMBEDDINGS_DIR))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading embeddings: {e}")
+            self.embedded_with = None
+
+    def _save_manifest(self) -> None:
+        # Candidate index first: the manifest is what marks the directory valid
+        self.candidates.save(os.path.join(self.directory, RETRIEVAL_DIR))
+        path = os.path.join(self.directory, MANIFEST_FILE)
+        data = {
+            'parser_version': self.matcher.parser.version,
+            'count': len(self.store),
+            'embeddings': self.embedded_with,
+            'files': self.manifest
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
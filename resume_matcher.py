@@ -7,109 +7,509 @@ using NLP and machine learning techniques.
 
 import re
 import os
-from typing import List, Dict, Tuple
+import hashlib
+import pickle
+import threading
+import time
+import importlib.util
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator, TYPE_CHECKING
 from pathlib import Path
 import json
 
-try:
+import extractors
+import metrics
+from extractors import TextStream, open_text
+from metrics import timed
+from skill_taxonomy import SkillTaxonomy, default_taxonomy
+from job_profiles import JobProfile, JobProfileStore, profile_id_for
+
+# Heavy dependencies (scikit-learn, spaCy, PyPDF2, python-docx) are imported
+# on first use so that importing this module stays cheap on cold starts.
+if TYPE_CHECKING:
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    import PyPDF2
-    from docx import Document
-except ImportError:
-    print("Please install required packages: pip install -r requirements.txt")
-    raise
+    from scoring import CandidateMatrix
 
 # spaCy is optional - app works without it
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+SPACY_AVAILABLE = importlib.util.find_spec('spacy') is not None
+if not SPACY_AVAILABLE:
     print("Note: spaCy not available. Using lightweight NLP features.")
 
+# Bump whenever extraction logic changes so cached parse results are invalidated.
+PARSER_VERSION = "5"
+
+# Only the tagger/parser (for POS tags and noun chunks) are used by the
+# extractors; named entities and lemmas are never read.
+SPACY_DISABLED_COMPONENTS = ['ner', 'lemmatizer']
+
+# Patterns are compiled once at import time and shared by every parse.
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}')
+WORD_PATTERN = re.compile(r'\b[a-z]{4,}\b')
+EXPERIENCE_YEARS_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'),
+    re.compile(r'experience.*?(\d+)\+?\s*years?'),
+    re.compile(r'(\d+)\+?\s*years?.*?experience')
+]
+# Employment date ranges, e.g. "2019 - 2023", "Mar 2020 – Present", "01/2018 to 06/2021"
+DATE_RANGE_PATTERN = re.compile(
+    r'\b(?:\d{1,2}/)?((?:19|20)\d{2})\s*(?:-|–|—|to)\s*'
+    r'(?:[a-z]{3,9}\.?\s+)?(?:\d{1,2}/)?((?:19|20)\d{2}|present|current|now|today)\b'
+)
+# Anything beyond this is a misread date or a typo, not a career
+MAX_EXPERIENCE_YEARS = 50
+
+# Degrees by ordinal level (1 associate/diploma ... 4 doctorate)
+DEGREE_LEVEL_PATTERNS = [
+    (4, re.compile(r"\bph\.?\s?d\b|\bdoctorate\b|\bdoctoral\b|\bdoctor of\b")),
+    (3, re.compile(
+        r"\bmaster(?:'|’)?s\b|\bmaster of\b|\bm\.?sc\b|\bmba\b|\bm\.s\.|\bm\.?\s?eng\b|\bm\.?tech\b"
+    )),
+    (2, re.compile(
+        r"\bbachelor|\bb\.?sc\b|\bb\.s\.|\bb\.a\.|\bb\.?\s?eng\b|\bb\.?tech\b|\bundergraduate degree\b"
+    )),
+    (1, re.compile(r"\bassociate(?:'|’)?s? degree\b|\bdiploma\b"))
+]
+
+# Keywords that mark a line as belonging to a section when no explicit
+# header is present (matched as substrings of the lowercased line).
+SECTION_KEYWORDS = {
+    'experience': ['experience', 'work history', 'employment', 'career'],
+    'education': ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd'],
+}
+SECTION_KEYWORD_PATTERN = re.compile(
+    '(?=' + '|'.join(
+        f"(?P<{section}>{'|'.join(re.escape(k) for k in keywords)})"
+        for section, keywords in SECTION_KEYWORDS.items()
+    ) + ')'
+)
+
+# A line consisting only of a section title, e.g. "WORK EXPERIENCE:"
+SECTION_HEADER_PATTERN = re.compile(
+    r'^[\W_]*(?:'
+    r'(?P<experience>(?:work |professional |employment )?(?:experience|history)'
+    r'|employment|career(?: history)?)'
+    r'|(?P<education>education(?: (?:and|&) training)?|academic background)'
+    r'|(?P<skills>(?:technical |core |key )?(?:skills|competencies)(?: (?:and|&) tools)?'
+    r'|technologies)'
+    r'|(?P<contact>contact(?: information| details| info)?)'
+    r')[\W_]*$',
+    re.IGNORECASE
+)
+MAX_HEADER_LENGTH = 40
+
+# Characters read by extract_header (enough for name and contact details)
+HEADER_CHARS = 2000
+
+# One spaCy pipeline per process, shared by every parser
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """Return the process-wide spaCy pipeline, loading it on first use (None if unavailable)."""
+    global _nlp, _nlp_loaded
+    if _nlp_loaded:
+        return _nlp
+    with _nlp_lock:
+        if not _nlp_loaded:
+            if SPACY_AVAILABLE:
+                try:
+                    import spacy
+                    # Download if needed: python -m spacy download en_core_web_sm
+                    _nlp = spacy.load("en_core_web_sm", disable=SPACY_DISABLED_COMPONENTS)
+                except (OSError, ImportError):
+                    # Model not found - use basic parsing
+                    _nlp = None
+            _nlp_loaded = True
+    return _nlp
+
+
+def warmup() -> Dict[str, float]:
+    """
+    Import the extraction/vectorization backends and load the shared spaCy
+    model, so the first request does not pay for them.
+    
+    Safe to call before forking workers (e.g. gunicorn --preload): only
+    process-wide, fork-safe state is initialized.
+    
+    Returns:
+        Seconds spent on each step
+    """
+    timings = {}
+    start = time.perf_counter()
+    extractors.warmup()
+    timings['document_backends'] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: F401
+    timings['sklearn'] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    get_nlp()
+    timings['spacy'] = time.perf_counter() - start
+    return timings
+
+
+def file_format(file_path) -> str:
+    """Lowercase extension without the dot, used as a metrics label."""
+    return Path(file_path).suffix.lower().lstrip('.') or 'unknown'
+
+
+def stated_experience_years(text: str) -> int:
+    """Years from the first "N+ years (of) experience" phrase, or 0."""
+    text_lower = text.lower()
+    for pattern in EXPERIENCE_YEARS_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def employment_years(text: str) -> float:
+    """
+    Years covered by the date ranges in a text, overlapping ranges merged.
+    
+    Open-ended ranges ("2021 - Present") run to the current year.
+    """
+    current_year = time.localtime().tm_year
+    ranges = []
+    for start, end in DATE_RANGE_PATTERN.findall(text.lower()):
+        end = current_year if not end[0].isdigit() else int(end)
+        if int(start) <= end <= current_year:
+            ranges.append((int(start), end))
+    
+    total = 0
+    covered_until = 0
+    for start, end in sorted(ranges):
+        start = max(start, covered_until)
+        if end > start:
+            total += end - start
+            covered_until = end
+    return float(total)
+
+
+def degree_levels(text: str) -> List[int]:
+    """Ordinal levels (see DEGREE_LEVEL_PATTERNS) of every degree a text mentions."""
+    text_lower = text.lower()
+    return [level for level, pattern in DEGREE_LEVEL_PATTERNS if pattern.search(text_lower)]
+
+
+class ResumeSections:
+    """
+    A resume split into lines once, with section headers and section
+    keyword hits located in a single pass. Extractors share these offsets
+    instead of re-splitting and re-scanning the text.
+    """
+    
+    def __init__(self, text: str):
+        self.lines = text.split('\n')
+        self.headers: Dict[str, int] = {}
+        self.keyword_lines: Dict[str, List[int]] = {name: [] for name in SECTION_KEYWORDS}
+        self._header_lines: List[int] = []
+        
+        for i, line in enumerate(self.lines):
+            for match in SECTION_KEYWORD_PATTERN.finditer(line.lower()):
+                hits = self.keyword_lines[match.lastgroup]
+                if not hits or hits[-1] != i:
+                    hits.append(i)
+            
+            stripped = line.strip()
+            if stripped and len(stripped) <= MAX_HEADER_LENGTH:
+                header = SECTION_HEADER_PATTERN.match(stripped)
+                if header:
+                    self._header_lines.append(i)
+                    self.headers.setdefault(header.lastgroup, i)
+    
+    def section(self, name: str, max_lines: int) -> Optional[List[str]]:
+        """Lines from a section's header up to the next header, or None."""
+        start = self.headers.get(name)
+        if start is None:
+            return None
+        end = len(self.lines)
+        for i in self._header_lines:
+            if i > start:
+                end = i
+                break
+        return self.lines[start:min(end, start + max_lines)]
+    
+    def contact_text(self) -> str:
+        """The resume header block (before the first section) plus any contact section."""
+        first_header = self._header_lines[0] if self._header_lines else len(self.lines)
+        lines = self.lines[:first_header] + (self.section('contact', 10) or [])
+        return '\n'.join(lines)
+
 
 class ResumeParser:
     """Extracts structured information from resumes using NLP."""
     
-    def __init__(self):
-        self.nlp = None
-        if SPACY_AVAILABLE:
-            try:
-                # Load spaCy model (download if needed: python -m spacy download en_core_web_sm)
-                self.nlp = spacy.load("en_core_web_sm")
-            except (OSError, ImportError):
-                # spaCy not available or model not found - use basic parsing
-                self.nlp = None
-    
-    def extract_text(self, file_path: str) -> str:
-        """Extract text from PDF, DOCX, or TXT files."""
-        file_path = Path(file_path)
-        ext = file_path.suffix.lower()
-        
-        if ext == '.pdf':
-            return self._extract_from_pdf(file_path)
-        elif ext in ['.docx', '.doc']:
-            return self._extract_from_docx(file_path)
-        elif ext == '.txt':
-            return self._extract_from_txt(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {ext}")
+    def __init__(
+        self,
+        cache=None,
+        batch_size: int = 32,
+        n_process: int = 1,
+        taxonomy: Optional[SkillTaxonomy] = None,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ):
+        """
+        Args:
+            cache: Optional ParseCache used to reuse results for files whose
+                contents have already been parsed
+            batch_size: Documents per batch when streaming through nlp.pipe
+            n_process: Processes used by nlp.pipe for batch parsing
+            taxonomy: Skill taxonomy to match against (defaults to the
+                built-in one)
+            max_pages: Page budget per PDF (None = read every page)
+            max_chars: Character budget per document (None = no limit)
+        """
+        self.cache = cache
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.taxonomy = taxonomy or default_taxonomy()
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.nlp = get_nlp()
     
-    def _extract_from_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file."""
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            print(f"Error reading PDF {file_path}: {e}")
-        return text
-    
-    def _extract_from_docx(self, file_path: Path) -> str:
-        """Extract text from DOCX file."""
-        text = ""
-        try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-        except Exception as e:
-            print(f"Error reading DOCX {file_path}: {e}")
-        return text
-    
-    def _extract_from_txt(self, file_path: Path) -> str:
-        """Extract text from TXT file."""
+    def extract_text(
+        self,
+        file_path: str,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> str:
+        """
+        Extract text from a resume (PDF, DOCX, DOC, ODT, RTF, HTML or TXT).
+        
+        Args:
+            file_path: Resume file
+            max_pages: Stop after this many PDF pages (defaults to the
+                parser's max_pages; None = no limit)
+            max_chars: Stop once this many characters have been read
+                (defaults to the parser's max_chars; None = no limit)
+        """
+        return self._extract(file_path, max_pages, max_chars)[0]
+    
+    def _extract(
+        self,
+        file_path: str,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> Tuple[str, TextStream]:
+        """extract_text() plus the stream, which records the format and backend used."""
+        if max_pages is None:
+            max_pages = self.max_pages
+        if max_chars is None:
+            max_chars = self.max_chars
+        
+        parts = []
+        size = 0
+        chunks = self.iter_text(file_path, max_pages=max_pages)
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except Exception as e:
-            print(f"Error reading TXT {file_path}: {e}")
-            return ""
+            for chunk in chunks:
+                if max_chars is not None and size + len(chunk) >= max_chars:
+                    parts.append(chunk[:max_chars - size])
+                    break
+                parts.append(chunk)
+                size += len(chunk)
+        finally:
+            # Closing the generator releases the file when stopping early
+            chunks.close()
+        return ''.join(parts), chunks
+    
+    def extract_header(self, file_path: str, max_chars: int = HEADER_CHARS) -> str:
+        """Extract only the start of a resume, stopping as soon as it is read."""
+        return self.extract_text(file_path, max_chars=max_chars)
+    
+    def iter_text(self, file_path: str, max_pages: Optional[int] = None) -> TextStream:
+        """
+        Lazily yield a file's text (pages for PDF, paragraphs for word
+        processor formats, blocks for TXT), each newline-terminated.
+        
+        The format is sniffed from the file's contents and read by the
+        fastest installed backend (see extractors.py).
+        
+        Raises:
+            ValueError: Unsupported file format (extractors.ExtractionError,
+                on iteration, when no backend can read the file)
+        """
+        return open_text(file_path, max_pages=max_pages)
+    
+    @property
+    def version(self) -> str:
+        """Parser version used in cache keys (NLP and fallback output differ)."""
+        version = (
+            f"{PARSER_VERSION}-{'spacy' if self.nlp else 'basic'}"
+            f"-{self.taxonomy.fingerprint}-x{extractors.fingerprint()}"
+        )
+        if self.max_pages is not None or self.max_chars is not None:
+            version += f"-p{self.max_pages}-c{self.max_chars}"
+        return version
+    
+    def analyze_text(self, text: str):
+        """Run the spaCy pipeline once; the Doc is shared by all extractors."""
+        return self.nlp(text) if self.nlp else None
     
     def parse_resume(self, file_path: str) -> Dict:
         """Parse resume and extract structured information."""
-        text = self.extract_text(file_path)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key_for_file(file_path, self.version)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached['file_path'] = file_path
+                return cached
+        
+        try:
+            with timed('extract_text'):
+                text, stream = self._extract(file_path)
+            with timed('nlp'):
+                doc = self.analyze_text(text)
+            with timed('extract_fields'):
+                resume_data = self._build_record(file_path, text, doc, stream)
+        except Exception:
+            metrics.inc('resume_matcher_parse_failures_total', format=file_format(file_path))
+            raise
+        metrics.inc('resume_matcher_parsed_total', format=file_format(file_path))
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, resume_data)
+        
+        return resume_data
+    
+    def parse_contact(self, file_path: str) -> Dict:
+        """Extract name, email and phone, reading only the top of the file."""
+        text = self.extract_header(file_path)
+        sections = ResumeSections(text)
+        return {
+            'file_path': file_path,
+            'name': self._extract_name(text, sections),
+            'email': self._extract_email(text, sections),
+            'phone': self._extract_phone(text, sections)
+        }
+    
+    def parse_resumes(self, file_paths: List[str]) -> List[Optional[Dict]]:
+        """
+        Parse many resumes, streaming their texts through nlp.pipe.
+        
+        Returns:
+            One entry per input path, in order; None where parsing failed
+        """
+        results: List[Optional[Dict]] = [None] * len(file_paths)
+        # Extraction runs lazily inside nlp.pipe's input; its time is tracked
+        # so that the remainder of each wait can be attributed to spaCy.
+        extraction_seconds = [0.0]
+        # Contexts go through nlp.pipe, which pickles them when n_process > 1,
+        # so only (index, cache key) travels with the text and the streams
+        # stay here in the parent.
+        streams: Dict[int, TextStream] = {}
+        
+        def pending() -> Iterator[Tuple[str, Tuple[int, Optional[str]]]]:
+            for i, file_path in enumerate(file_paths):
+                try:
+                    cache_key = None
+                    if self.cache is not None:
+                        cache_key = self.cache.key_for_file(file_path, self.version)
+                        cached = self.cache.get(cache_key)
+                        if cached is not None:
+                            cached['file_path'] = file_path
+                            results[i] = cached
+                            continue
+                    start = time.perf_counter()
+                    text, stream = self._extract(file_path)
+                    elapsed = time.perf_counter() - start
+                    extraction_seconds[0] += elapsed
+                    metrics.record_stage('extract_text', elapsed)
+                    streams[i] = stream
+                    yield text, (i, cache_key)
+                except Exception as e:
+                    metrics.inc('resume_matcher_parse_failures_total', format=file_format(file_path))
+                    print(f"Error parsing {file_path}: {e}")
         
-        # Extract key information
-        resume_data = {
+        if self.nlp:
+            parsed = (
+                (doc.text, doc, context)
+                for doc, context in self.nlp.pipe(
+                    pending(),
+                    as_tuples=True,
+                    batch_size=self.batch_size,
+                    n_process=self.n_process
+                )
+            )
+        else:
+            parsed = ((text, None, context) for text, context in pending())
+        
+        # nlp.pipe processes batch_size texts at a time: the first next() of a
+        # batch waits for all of it and the rest return at once, so waits are
+        # summed and recorded as one 'nlp' sample per batch.
+        batch_seconds = 0.0
+        batch_docs = 0
+        while True:
+            start = time.perf_counter()
+            extracted_before = extraction_seconds[0]
+            item = next(parsed, None)
+            if self.nlp:
+                waited = time.perf_counter() - start
+                batch_seconds += max(0.0, waited - (extraction_seconds[0] - extracted_before))
+                batch_docs += item is not None
+                if batch_docs and (batch_docs == self.batch_size or item is None):
+                    metrics.record_stage('nlp', batch_seconds)
+                    batch_seconds = 0.0
+                    batch_docs = 0
+            if item is None:
+                break
+            
+            text, doc, (i, cache_key) = item
+            stream = streams.pop(i)
+            try:
+                with timed('extract_fields'):
+                    results[i] = self._build_record(file_paths[i], text, doc, stream)
+            except Exception as e:
+                metrics.inc('resume_matcher_parse_failures_total', format=file_format(file_paths[i]))
+                print(f"Error parsing {file_paths[i]}: {e}")
+                continue
+            metrics.inc('resume_matcher_parsed_total', format=file_format(file_paths[i]))
+            if cache_key is not None:
+                self.cache.put(cache_key, results[i])
+        
+        return results
+    
+    def _build_record(
+        self,
+        file_path: str,
+        text: str,
+        doc=None,
+        stream: Optional[TextStream] = None
+    ) -> Dict:
+        """
+        Run every extractor over one document's text and spaCy Doc.
+        
+        Args:
+            stream: The text's TextStream; its detected format and the
+                backend that read it are recorded on the result
+        """
+        sections = ResumeSections(text)
+        record = {
             'file_path': file_path,
-            'name': self._extract_name(text),
-            'email': self._extract_email(text),
-            'phone': self._extract_phone(text),
-            'skills': self._extract_skills(text),
-            'experience': self._extract_experience(text),
-            'education': self._extract_education(text),
+            'name': self._extract_name(text, sections),
+            'email': self._extract_email(text, sections),
+            'phone': self._extract_phone(text, sections),
+            'skills': self._extract_skills(text, doc),
+            'experience': self._extract_experience(text, sections),
+            'education': self._extract_education(text, sections),
             'raw_text': text,
-            'keywords': self._extract_keywords(text)
+            'keywords': self._extract_keywords(text, doc),
+            # Numeric features scored by scoring.ExperienceScorer/EducationScorer
+            'experience_years': self._extract_experience_years(text, sections),
+            'education_level': self._extract_education_level(text, sections)
         }
-        
-        return resume_data
+        if stream is not None:
+            record['document_format'] = stream.format
+            record['extraction_backend'] = stream.backend
+        return record
     
-    def _extract_name(self, text: str) -> str:
+    def _extract_name(self, text: str, sections: Optional[ResumeSections] = None) -> str:
         """Extract candidate name (first few lines often contain name)."""
-        lines = text.split('\n')[:5]
+        lines = sections.lines[:5] if sections else text.split('\n')[:5]
         for line in lines:
             line = line.strip()
             if len(line) > 3 and len(line) < 50:
@@ -117,39 +517,33 @@ class ResumeParser:
                 return line
         return "Unknown"
     
-    def _extract_email(self, text: str) -> str:
-        """Extract email address."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else ""
+    def _extract_email(self, text: str, sections: Optional[ResumeSections] = None) -> str:
+        """Extract email address (contact block first, then the whole text)."""
+        return self._first_match(EMAIL_PATTERN, text, sections)
     
-    def _extract_phone(self, text: str) -> str:
-        """Extract phone number."""
-        phone_pattern = r'[\+]?[(]?[0-9]{3}[)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4,6}'
-        matches = re.findall(phone_pattern, text)
-        return matches[0] if matches else ""
+    def _extract_phone(self, text: str, sections: Optional[ResumeSections] = None) -> str:
+        """Extract phone number (contact block first, then the whole text)."""
+        return self._first_match(PHONE_PATTERN, text, sections)
     
-    def _extract_skills(self, text: str) -> List[str]:
+    @staticmethod
+    def _first_match(pattern, text: str, sections: Optional[ResumeSections]) -> str:
+        """First match of a compiled pattern, preferring the contact block."""
+        if sections:
+            match = pattern.search(sections.contact_text())
+            if match:
+                return match.group(0)
+        match = pattern.search(text)
+        return match.group(0) if match else ""
+    
+    def _extract_skills(self, text: str, doc=None) -> List[str]:
         """Extract technical skills using NLP and keyword matching."""
-        # Common technical skills database
-        common_skills = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'django', 'flask',
-            'sql', 'postgresql', 'mysql', 'mongodb', 'aws', 'docker', 'kubernetes',
-            'git', 'linux', 'html', 'css', 'typescript', 'angular', 'vue',
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-            'agile', 'scrum', 'ci/cd', 'rest api', 'graphql', 'microservices'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
+        # Single pass over the text with the compiled skill taxonomy
+        found_skills = self.taxonomy.find(text)
         
         # Use NLP to find noun phrases that might be skills
         if self.nlp:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             for chunk in doc.noun_chunks:
                 chunk_text = chunk.text.lower()
                 if len(chunk_text) > 2 and len(chunk_text) < 30:
@@ -159,46 +553,66 @@ class ResumeParser:
         
         return list(set(found_skills))  # Remove duplicates
     
-    def _extract_experience(self, text: str) -> str:
+    def _extract_experience(self, text: str, sections: Optional[ResumeSections] = None) -> str:
         """Extract work experience section."""
-        # Look for experience-related keywords
-        experience_keywords = ['experience', 'work history', 'employment', 'career']
-        lines = text.split('\n')
+        sections = sections or ResumeSections(text)
         
-        experience_section = []
-        in_experience = False
+        # Prefer an explicit "Experience" header
+        section = sections.section('experience', 15)
+        if section:
+            return '\n'.join(section)
         
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in experience_keywords):
-                in_experience = True
-            if in_experience:
-                experience_section.append(line)
-                if len(experience_section) > 20:  # Limit section size
-                    break
-        
-        return '\n'.join(experience_section[:15]) if experience_section else text[:500]
+        # Otherwise start at the first line mentioning experience
+        hits = sections.keyword_lines['experience']
+        if hits:
+            return '\n'.join(sections.lines[hits[0]:hits[0] + 15])
+        return text[:500]
     
-    def _extract_education(self, text: str) -> str:
+    def _extract_education(self, text: str, sections: Optional[ResumeSections] = None) -> str:
         """Extract education section."""
-        education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'phd']
-        lines = text.split('\n')
+        sections = sections or ResumeSections(text)
+        
+        # Prefer an explicit "Education" header
+        section = sections.section('education', 10)
+        if section:
+            return '\n'.join(section)
         
+        # Otherwise collect the lines around education keywords
+        lines = sections.lines
         education_section = []
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in education_keywords):
-                # Include surrounding lines
-                start = max(0, i - 2)
-                end = min(len(lines), i + 5)
-                education_section.extend(lines[start:end])
+        for i in sections.keyword_lines['education']:
+            # Include surrounding lines
+            start = max(0, i - 2)
+            end = min(len(lines), i + 5)
+            education_section.extend(lines[start:end])
+            if len(education_section) >= 10:
+                break
         
         return '\n'.join(education_section[:10]) if education_section else ""
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _extract_experience_years(self, text: str, sections: Optional[ResumeSections] = None) -> float:
+        """
+        Total years of experience: the larger of a stated "N years of
+        experience" and the merged date ranges of the experience section
+        (the whole text when there is no experience header).
+        """
+        sections = sections or ResumeSections(text)
+        section = sections.section('experience', len(sections.lines))
+        dated = employment_years('\n'.join(section) if section else text)
+        return min(max(float(stated_experience_years(text)), dated), MAX_EXPERIENCE_YEARS)
+    
+    def _extract_education_level(self, text: str, sections: Optional[ResumeSections] = None) -> int:
+        """Highest degree level (0 none ... 4 doctorate) in the education section or text."""
+        sections = sections or ResumeSections(text)
+        section = sections.section('education', len(sections.lines))
+        levels = degree_levels('\n'.join(section) if section else text)
+        return max(levels, default=0)
+    
+    def _extract_keywords(self, text: str, doc=None) -> List[str]:
         """Extract important keywords from resume."""
         if self.nlp:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             keywords = []
             for token in doc:
                 if token.pos_ in ['NOUN', 'PROPN'] and not token.is_stop:
@@ -207,106 +621,736 @@ class ResumeParser:
             return list(set(keywords))[:50]  # Top 50 keywords
         else:
             # Fallback: simple word extraction
-            words = re.findall(r'\b[a-z]{4,}\b', text.lower())
+            words = WORD_PATTERN.findall(text.lower())
             return list(set(words))[:50]
 
 
 class JobAnalyzer:
     """Analyzes job descriptions to extract requirements."""
     
-    def __init__(self):
-        self.parser = ResumeParser()
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None, parser: Optional[ResumeParser] = None):
+        """
+        Args:
+            taxonomy: Skill taxonomy used when no parser is given
+            parser: Existing ResumeParser to reuse for job text analysis
+        """
+        self.parser = parser or ResumeParser(taxonomy=taxonomy)
     
     def analyze_job(self, job_description: str) -> Dict:
         """Extract requirements from job description."""
-        if isinstance(job_description, (Path, str)) and os.path.isfile(job_description):
-            with open(job_description, 'r', encoding='utf-8') as f:
-                job_description = f.read()
-        
-        return {
-            'raw_text': job_description,
-            'required_skills': self.parser._extract_skills(job_description),
-            'keywords': self.parser._extract_keywords(job_description),
-            'experience_required': self._extract_experience_years(job_description)
-        }
+        with timed('analyze_job'):
+            if isinstance(job_description, (Path, str)) and os.path.isfile(job_description):
+                with open(job_description, 'r', encoding='utf-8') as f:
+                    job_description = f.read()
+            
+            doc = self.parser.analyze_text(job_description)
+            return {
+                'raw_text': job_description,
+                'required_skills': self.parser._extract_skills(job_description, doc),
+                'keywords': self.parser._extract_keywords(job_description, doc),
+                'experience_required': self._extract_experience_years(job_description),
+                'education_required': self._extract_education_required(job_description)
+            }
     
     def _extract_experience_years(self, text: str) -> int:
         """Extract required years of experience."""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'experience.*?(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?.*?experience'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                return int(matches[0])
-        return 0
+        return stated_experience_years(text)
+    
+    def _extract_education_required(self, text: str) -> int:
+        """Lowest degree level the job asks for ("Bachelor's, Master's preferred" -> 2)."""
+        return min(degree_levels(text), default=0)
 
 
 class ResumeMatcher:
     """Main class for matching candidates to job requirements."""
     
-    def __init__(self):
-        self.parser = ResumeParser()
-        self.job_analyzer = JobAnalyzer()
-        self.vectorizer = TfidfVectorizer(
+    def __init__(
+        self,
+        parse_cache=None,
+        workers: int = 1,
+        nlp_batch_size: int = 32,
+        nlp_processes: int = 1,
+        taxonomy: Optional[SkillTaxonomy] = None,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        job_profiles: Optional[JobProfileStore] = None,
+        semantic_scorer=None
+    ):
+        """
+        Args:
+            parse_cache: Optional ParseCache shared by resume parsing
+            workers: Number of processes used to parse resumes (1 = in-process)
+            nlp_batch_size: Documents per nlp.pipe batch for in-process parsing
+            nlp_processes: Processes used by nlp.pipe for in-process parsing
+            taxonomy: Skill taxonomy shared by resume and job parsing
+            max_pages: Page budget per PDF resume (None = no limit)
+            max_chars: Character budget per resume (None = no limit)
+            job_profiles: Store of compiled job profiles (defaults to an
+                in-memory LRU)
+            semantic_scorer: embeddings.EmbeddingScorer used for the
+                semantic score instead of TF-IDF; candidates are embedded
+                once, when parsed
+        """
+        # Options that must be identical for in-process and worker parsers
+        self._parser_options = {
+            'taxonomy': taxonomy,
+            'max_pages': max_pages,
+            'max_chars': max_chars
+        }
+        self.parser = ResumeParser(
+            cache=parse_cache,
+            batch_size=nlp_batch_size,
+            n_process=nlp_processes,
+            **self._parser_options
+        )
+        self.workers = workers
+        self._ingestor = None
+        self.job_analyzer = JobAnalyzer(parser=self.parser)
+        self.job_profiles = job_profiles if job_profiles is not None else JobProfileStore()
+        self.vectorizer = self._build_vectorizer()
+        # True once the vectorizer has been fitted on a reference corpus
+        # (see fit_corpus); scoring then only transforms instead of refitting.
+        self.corpus_fitted = False
+        # Identifies the fitted vocabulary/IDF so cached job vectors can be reused
+        self.vectorizer_id: Optional[str] = None
+        self.semantic_scorer = semantic_scorer
+    
+    def warmup(self) -> Dict[str, float]:
+        """
+        Load all backends and run one small match end to end, so the first
+        real request is served at steady-state latency.
+        
+        Returns:
+            Seconds spent on each step
+        """
+        timings = warmup()
+        start = time.perf_counter()
+        job_data = self.job_analyzer.analyze_job(
+            "Python developer with 3+ years of experience in SQL and Docker"
+        )
+        self._calculate_similarities(job_data, [
+            {'raw_text': "Python developer skilled in SQL, Docker and AWS", 'skills': ['Python', 'SQL']},
+            {'raw_text': "Java engineer with Spring and Kubernetes", 'skills': ['Java']}
+        ])
+        timings['first_match'] = time.perf_counter() - start
+        return timings
+    
+    @staticmethod
+    def _build_vectorizer() -> 'TfidfVectorizer':
+        """Create the TF-IDF vectorizer used for semantic similarity."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(
             max_features=5000,
             ngram_range=(1, 2),
             stop_words='english'
         )
     
+    def fit_corpus(self, texts: List[str]) -> None:
+        """
+        Fit the vectorizer once on a reference corpus (e.g. the talent pool).
+        
+        Subsequent scoring reuses this vocabulary and IDF weights instead of
+        refitting on every request.
+        """
+        self.vectorizer = self._build_vectorizer()
+        self.vectorizer.fit(texts)
+        self.corpus_fitted = True
+        self.vectorizer_id = self._vectorizer_fingerprint(self.vectorizer)
+    
+    def save_vectorizer(self, path: str) -> None:
+        """Persist the corpus-fitted vectorizer to disk."""
+        if not self.corpus_fitted:
+            raise ValueError("Vectorizer has not been fitted on a corpus")
+        with open(path, 'wb') as f:
+            pickle.dump(self.vectorizer, f)
+    
+    def load_vectorizer(self, path: str) -> None:
+        """Load a vectorizer previously saved with save_vectorizer."""
+        with open(path, 'rb') as f:
+            self.vectorizer = pickle.load(f)
+        self.corpus_fitted = True
+        self.vectorizer_id = self._vectorizer_fingerprint(self.vectorizer)
+    
+    @staticmethod
+    def _vectorizer_fingerprint(vectorizer) -> str:
+        """Hash of a fitted vectorizer's vocabulary and IDF weights."""
+        digest = hashlib.sha1(str(sorted(vectorizer.vocabulary_.items())).encode('utf-8'))
+        digest.update(vectorizer.idf_.tobytes())
+        return digest.hexdigest()[:16]
+    
+    def compile_job(self, job_description, weights: Optional[Dict[str, float]] = None) -> JobProfile:
+        """
+        Analyze a job description once and return its reusable profile.
+        
+        Profiles are cached by normalized job text and weights, so compiling
+        the same job again (or matching it against new resumes) skips job
+        analysis. A job compiled with weights gets its own profile; the
+        weight-free profile of the same text is never changed.
+        
+        Args:
+            job_description: Job description text, file path, or an existing
+                JobProfile (returned as is unless weights are given)
+            weights: Score weights overriding DEFAULT_WEIGHTS
+        """
+        if isinstance(job_description, JobProfile):
+            if not weights:
+                return job_description
+            weights = dict(job_description.weights, **weights)
+            job_description = job_description.requirements['raw_text']
+        elif isinstance(job_description, Path) or os.path.isfile(job_description):
+            with open(job_description, 'r', encoding='utf-8') as f:
+                job_description = f.read()
+        
+        profile_id = profile_id_for(job_description, self.parser.version, weights)
+        profile = self.job_profiles.get(profile_id)
+        if profile is None:
+            profile = JobProfile(
+                profile_id,
+                self.job_analyzer.analyze_job(job_description),
+                weights=weights
+            )
+            if self.corpus_fitted:
+                profile.set_vector(
+                    self.vectorizer.transform([job_description]), self.vectorizer_id
+                )
+            self.job_profiles.put(profile)
+        return profile
+    
+    def get_job_profile(self, profile_id: str) -> Optional[JobProfile]:
+        """Look up a previously compiled job profile by ID."""
+        return self.job_profiles.get(profile_id)
+    
     def match_candidates(
         self,
         job_description: str,
         resume_paths: List[str],
         top_n: int = 10,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        batch_scoring: bool = True,
+        streaming: bool = False,
+        chunk_size: int = 256,
+        weights: Optional[Dict[str, float]] = None
     ) -> List[Dict]:
         """
         Match candidates to job description.
         
         Args:
-            job_description: Job description text or file path
-            resume_paths: List of resume file paths
+            job_description: Job description text, file path or JobProfile
+            resume_paths: List of resume file paths (any iterable when streaming)
             top_n: Number of top candidates to return
             min_score: Minimum match score (0-1)
+            batch_scoring: Score the whole pool with a single TF-IDF fit
+                (set to False for the legacy per-candidate scoring)
+            streaming: Parse and score chunk_size resumes at a time, keeping
+                only the current top N in memory (see match_streaming)
+            chunk_size: Resumes per chunk in streaming mode
+            weights: Score weights for this call only, on top of the job
+                profile's (see scoring.SCORERS for the component names)
         
         Returns:
             List of candidate matches with scores
         """
-        # Analyze job description
-        job_data = self.job_analyzer.analyze_job(job_description)
+        # Analyze job description (cached by job text)
+        profile = self.compile_job(job_description)
+        
+        if streaming:
+            return self.match_streaming(
+                profile,
+                resume_paths,
+                top_n=top_n,
+                min_score=min_score,
+                chunk_size=chunk_size,
+                weights=weights
+            )
         
         # Parse all resumes
-        candidates = []
-        for resume_path in resume_paths:
-            try:
-                candidate = self.parser.parse_resume(resume_path)
-                candidates.append(candidate)
-            except Exception as e:
-                print(f"Error parsing {resume_path}: {e}")
+        with timed('parse_resumes'):
+            candidates = self.parse_resumes(resume_paths)
+        
+        with timed('rank'):
+            return self.rank_candidates(
+                profile,
+                candidates,
+                top_n=top_n,
+                min_score=min_score,
+                batch_scoring=batch_scoring,
+                weights=weights
+            )
+    
+    def match_jobs(
+        self,
+        job_descriptions: List,
+        resume_paths: List[str],
+        top_n: int = 10,
+        min_score: float = 0.0,
+        jobs_per_candidate: int = 0,
+        weights: Optional[Dict[str, float]] = None
+    ) -> Dict:
+        """
+        Match several jobs against one candidate pool.
+        
+        Each resume is parsed once and all jobs are scored together (see
+        rank_jobs).
+        
+        Args:
+            job_descriptions: Job description texts, file paths or JobProfiles
+            resume_paths: List of resume file paths
+            top_n: Number of top candidates to return per job
+            min_score: Minimum match score (0-1)
+            jobs_per_candidate: Also return each candidate's best N jobs
+            weights: Score weights applied on top of every job's own
+        
+        Returns:
+            {'jobs': [...], 'candidates': [...]} as described in rank_jobs
+        """
+        profiles = [self.compile_job(job) for job in job_descriptions]
+        with timed('parse_resumes'):
+            candidates = self.parse_resumes(resume_paths)
+        with timed('rank'):
+            return self.rank_jobs(
+                profiles,
+                candidates,
+                top_n=top_n,
+                min_score=min_score,
+                jobs_per_candidate=jobs_per_candidate,
+                weights=weights
+            )
+    
+    def rank_jobs(
+        self,
+        profiles: List[JobProfile],
+        candidates: List[Dict],
+        top_n: int = 10,
+        min_score: float = 0.0,
+        jobs_per_candidate: int = 0,
+        weights: Optional[Dict[str, float]] = None
+    ) -> Dict:
+        """
+        Score already-parsed candidates against several job profiles at once.
+        
+        Candidates are vectorized once and all semantic scores come from a
+        single candidate-by-job sparse product; skills match is another.
+        With a corpus-fitted vectorizer every job's scores equal those of
+        rank_candidates. Otherwise the TF-IDF model is fitted once on all
+        jobs plus the pool, so IDF weights (and semantic scores) differ
+        slightly from matching each job on its own.
+        
+        Args:
+            weights: Score weights applied on top of every job's own
+        
+        Returns:
+            'jobs': per job (in input order) its job_profile_id and top_n
+                'matches' as returned by rank_candidates
+            'candidates': when jobs_per_candidate > 0, per candidate its
+                name, email, file_path and 'best_jobs' (job_index,
+                job_profile_id, match_score), best first
+        """
+        import numpy as np
+        from scoring import CandidateMatrix, top_indices
+        
+        result = {
+            'jobs': [{'job_profile_id': p.id, 'matches': []} for p in profiles],
+            'candidates': []
+        }
+        if not candidates or not profiles:
+            return result
+        
+        jobs = [profile.job_data for profile in profiles]
+        job_weights = [self._resolve_weights(profile, weights) for profile in profiles]
+        with timed('score'):
+            matrix = CandidateMatrix(candidates)
+            skills_match = matrix.skills_match_many([job['required_skills'] for job in jobs])
+            similarities = None
+            if any(w['semantic'] for w in job_weights):
+                similarities = self._job_similarities(jobs, profiles, candidates, matrix)
+            scores = np.empty_like(skills_match)
+            for j, job in enumerate(jobs):
+                precomputed = {'skills': skills_match[:, j]}
+                if similarities is not None:
+                    precomputed['semantic'] = similarities[:, j]
+                scores[:, j], _ = self._final_scores(matrix, job, job_weights[j], precomputed)
+        
+        for j, entry in enumerate(result['jobs']):
+            entry['matches'] = [
+                self._match_entry(candidates[i], float(scores[i, j]), float(skills_match[i, j]))
+                for i in top_indices(scores[:, j], top_n, min_score * 100)
+            ]
+        
+        if jobs_per_candidate > 0:
+            # Stable sort so tied jobs keep their input order
+            best = np.argsort(-scores, axis=1, kind='stable')[:, :jobs_per_candidate]
+            for i, candidate in enumerate(candidates):
+                result['candidates'].append({
+                    'name': candidate['name'],
+                    'email': candidate['email'],
+                    'file_path': candidate['file_path'],
+                    'best_jobs': [
+                        {
+                            'job_index': int(j),
+                            'job_profile_id': profiles[j].id,
+                            'match_score': float(scores[i, j])
+                        }
+                        for j in best[i]
+                    ]
+                })
+        return result
+    
+    def _job_similarities(
+        self,
+        jobs: List[Dict],
+        profiles: List[JobProfile],
+        candidates: List[Dict],
+        matrix: 'CandidateMatrix'
+    ):
+        """Candidate-by-job semantic similarity array for rank_jobs."""
+        import numpy as np
+        from scipy import sparse
+        
+        if self.semantic_scorer is not None:
+            with timed('embed'):
+                return self.semantic_scorer.similarity_matrix(
+                    [job['raw_text'] for job in jobs], [c['raw_text'] for c in candidates]
+                )
+        try:
+            with timed('vectorize'):
+                if self.corpus_fitted:
+                    job_vectors = sparse.vstack([
+                        self._job_vector(job, profile) for job, profile in zip(jobs, profiles)
+                    ])
+                    candidate_vectors = self.vectorizer.transform([c['raw_text'] for c in candidates])
+                else:
+                    vectors = self._build_vectorizer().fit_transform(
+                        [job['raw_text'] for job in jobs] + [c['raw_text'] for c in candidates]
+                    )
+                    job_vectors, candidate_vectors = vectors[:len(jobs)], vectors[len(jobs):]
+                return (candidate_vectors @ job_vectors.T).toarray()
+        except ValueError:
+            # Empty vocabulary: fall back to simple keyword matching
+            return np.column_stack([matrix.keyword_jaccard(job['keywords']) for job in jobs])
+    
+    def match_streaming(
+        self,
+        job_description,
+        resume_paths: Iterable,
+        top_n: int = 10,
+        min_score: float = 0.0,
+        chunk_size: int = 256,
+        weights: Optional[Dict[str, float]] = None
+    ) -> List[Dict]:
+        """
+        Parse and score resumes chunk by chunk, keeping a bounded top-N heap.
+        
+        Candidates that fall out of the heap (or never reach min_score) are
+        released as soon as their chunk is scored, so peak memory is
+        O(top_n + chunk_size) instead of O(pool size).
+        
+        With a corpus-fitted vectorizer (see fit_corpus) scores equal those
+        of match_candidates. Otherwise the TF-IDF vocabulary and IDF are
+        fitted once on the job plus the first chunk and reused for the
+        remaining chunks, so semantic scores are an approximation of
+        fitting on the whole pool.
+        """
+        import heapq
+        from itertools import islice
+        import numpy as np
+        
+        profile = self.compile_job(job_description)
+        if top_n <= 0:
+            return []
+        weights = self._resolve_weights(profile, weights)
+        vectorizer = self.vectorizer if self.corpus_fitted else None
+        # Entries are (match_score, -sequence, match): ties favour earlier resumes
+        heap: List[Tuple[float, int, Dict]] = []
+        sequence = 0
+        
+        paths = iter(resume_paths)
+        while True:
+            chunk_paths = list(islice(paths, max(1, chunk_size)))
+            if not chunk_paths:
+                break
+            with timed('parse_resumes'):
+                candidates = self.parse_resumes(chunk_paths)
+            if not candidates:
                 continue
+            
+            if vectorizer is None and weights['semantic']:
+                texts = [profile.requirements['raw_text']] + [c['raw_text'] for c in candidates]
+                try:
+                    vectorizer = self._build_vectorizer().fit(texts)
+                except ValueError:
+                    # Empty vocabulary so far: keyword overlap for this chunk
+                    pass
+            
+            with timed('score'):
+                scores, skills_match = self._score_pool(
+                    profile, candidates, vectorizer=vectorizer, weights=weights
+                )
+                for i in np.flatnonzero(scores >= min_score * 100):
+                    key = (float(scores[i]), -(sequence + int(i)))
+                    if len(heap) < top_n:
+                        heapq.heappush(heap, key + (
+                            self._match_entry(candidates[i], key[0], float(skills_match[i])),
+                        ))
+                    elif key > heap[0][:2]:
+                        heapq.heapreplace(heap, key + (
+                            self._match_entry(candidates[i], key[0], float(skills_match[i])),
+                        ))
+            sequence += len(candidates)
+            # Drop this chunk's parsed records; winners are referenced by the heap
+            del candidates
+        
+        return [match for _, _, match in sorted(heap, key=lambda e: e[:2], reverse=True)]
+    
+    def match_store(
+        self,
+        job_description,
+        store,
+        top_n: int = 10,
+        min_score: float = 0.0,
+        chunk_size: int = 1024,
+        weights: Optional[Dict[str, float]] = None,
+        candidates=None,
+        candidate_limit: int = 2000
+    ) -> List[Dict]:
+        """
+        Match a job against a columnar CandidateStore.
         
+        Skills, keywords and the numeric feature columns are scored straight
+        from the store's memory-mapped arrays and resume text is decoded
+        chunk_size records at a time for the TF-IDF transform (skipped when
+        the semantic weight is zero), so memory stays bounded regardless of
+        pool size. Only the returned matches are materialized as dicts.
+        
+        Without a corpus-fitted vectorizer one is fitted on the job plus the
+        stored texts (one extra pass), which gives the same scores as
+        match_candidates over the same resumes.
+        
+        Args:
+            candidates: CandidateIndex over the store's record indices (e.g.
+                ResumeIndex.candidates); when given and the store holds more
+                than candidate_limit live records, only the candidate_limit
+                records sharing the most terms/skills with the job are scored
+            candidate_limit: Records kept by that retrieval stage
+        """
+        import numpy as np
+        from scoring import CandidateMatrix, top_indices
+        
+        profile = self.compile_job(job_description)
+        job_data = profile.job_data
+        weights = self._resolve_weights(profile, weights)
+        rows = store.live_indices()
+        if candidates is not None and len(rows) > candidate_limit:
+            with timed('retrieve'):
+                rows = np.array(sorted(candidates.retrieve(job_data, limit=candidate_limit)), dtype=np.int64)
+        if not len(rows) or top_n <= 0:
+            return []
+        
+        with timed('score'):
+            matrix = CandidateMatrix.from_store(store, rows)
+            precomputed = {}
+            if weights['semantic']:
+                precomputed['semantic'] = self._store_similarities(
+                    job_data, profile, store, rows, matrix, max(1, chunk_size)
+                )
+            scores, skills_match = self._final_scores(matrix, job_data, weights, precomputed)
+            selected = top_indices(scores, top_n, min_score * 100)
+        
+        return [
+            self._match_entry(store[int(rows[i])].to_dict(), float(scores[i]), float(skills_match[i]))
+            for i in selected
+        ]
+    
+    def _store_similarities(
+        self,
+        job_data: Dict,
+        profile: JobProfile,
+        store,
+        rows,
+        matrix: 'CandidateMatrix',
+        chunk_size: int
+    ):
+        """Semantic similarity of stored candidates, decoding chunk_size texts at a time."""
+        from itertools import chain, islice
+        import numpy as np
+        
+        similarities = np.zeros(len(rows))
+        texts = store.texts(rows)
+        if self.semantic_scorer is not None:
+            with timed('embed'):
+                job_vectors = self.semantic_scorer.encoder.encode([job_data['raw_text']])
+                for start in range(0, len(rows), chunk_size):
+                    chunk = list(islice(texts, chunk_size))
+                    similarities[start:start + len(chunk)] = \
+                        self.semantic_scorer.score_vectors(job_vectors, chunk)[:, 0]
+            return similarities
+        try:
+            with timed('vectorize'):
+                if self.corpus_fitted:
+                    vectorizer = self.vectorizer
+                    job_vector = self._job_vector(job_data, profile)
+                else:
+                    vectorizer = self._build_vectorizer()
+                    vectorizer.fit(chain([job_data['raw_text']], store.texts(rows)))
+                    job_vector = vectorizer.transform([job_data['raw_text']])
+                for start in range(0, len(rows), chunk_size):
+                    chunk = vectorizer.transform(list(islice(texts, chunk_size)))
+                    similarities[start:start + chunk.shape[0]] = (chunk @ job_vector.T).toarray().ravel()
+        except ValueError:
+            # Empty vocabulary: fall back to simple keyword matching
+            return matrix.keyword_jaccard(job_data['keywords'])
+        return similarities
+    
+    def parse_resumes(self, resume_paths: List[str]) -> List[Dict]:
+        """Parse resumes (in parallel when workers > 1), skipping failures."""
+        if self.workers > 1 and len(resume_paths) > 1:
+            if self._ingestor is None:
+                from ingestion import ParallelIngestor
+                self._ingestor = ParallelIngestor(
+                    workers=self.workers,
+                    cache=self.parser.cache,
+                    version=self.parser.version,
+                    parser_options=self._parser_options
+                )
+            parsed = self._ingestor.parse([str(p) for p in resume_paths])
+        else:
+            parsed = self.parser.parse_resumes(resume_paths)
+        candidates = [candidate for candidate in parsed if candidate is not None]
+        if self.semantic_scorer is not None:
+            with timed('embed'):
+                self.semantic_scorer.precompute(c['raw_text'] for c in candidates)
+        return candidates
+    
+    def close(self) -> None:
+        """Release the worker pool, if one was started."""
+        if self._ingestor is not None:
+            self._ingestor.close()
+            self._ingestor = None
+    
+    def rank_candidates(
+        self,
+        job_data,
+        candidates: List[Dict],
+        top_n: int = 10,
+        min_score: float = 0.0,
+        batch_scoring: bool = True,
+        matrix: Optional['CandidateMatrix'] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> List[Dict]:
+        """
+        Score already-parsed candidates against analyzed job data or a JobProfile.
+        
+        Args:
+            matrix: CandidateMatrix already encoded for these candidates, to
+                reuse across jobs (built on the fly if omitted)
+            weights: Score weights for this call only, on top of the job's
+        """
         if not candidates:
             return []
         
-        # Calculate match scores
+        if not batch_scoring:
+            weights = self._resolve_weights(job_data, weights)
+            if isinstance(job_data, JobProfile):
+                job_data = job_data.job_data
+            return self._rank_individually(job_data, candidates, top_n, min_score, weights)
+        
+        from scoring import top_indices
+        with timed('score'):
+            scores, skills_match = self._score_pool(job_data, candidates, matrix=matrix, weights=weights)
+            selected = top_indices(scores, top_n, min_score * 100)
+        
+        return [
+            self._match_entry(candidates[i], float(scores[i]), float(skills_match[i]))
+            for i in selected
+        ]
+    
+    def _score_pool(
+        self,
+        job_data,
+        candidates: List[Dict],
+        matrix: Optional['CandidateMatrix'] = None,
+        vectorizer=None,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Score a pool with the registered feature scorers (see scoring.py);
+        semantic similarity is only computed when it has a weight.
+        
+        Args:
+            job_data: Analyzed job data or a JobProfile
+            vectorizer: Already fitted TF-IDF vectorizer to transform with
+                (defaults to the corpus-fitted one, else fits on the pool)
+            weights: Score weights on top of the job's
+        
+        Returns:
+            (match scores rounded to 0-100, skills match fractions) arrays
+        """
+        import numpy as np
+        from scoring import CandidateMatrix
+        
+        weights = self._resolve_weights(job_data, weights)
+        profile = None
+        if isinstance(job_data, JobProfile):
+            profile, job_data = job_data, job_data.job_data
+        
+        matrix = matrix if matrix is not None else CandidateMatrix(candidates)
+        precomputed = {}
+        if weights['semantic']:
+            precomputed['semantic'] = np.asarray(
+                self._calculate_similarities(job_data, candidates, profile, matrix, vectorizer),
+                dtype=np.float64
+            )
+        return self._final_scores(matrix, job_data, weights, precomputed)
+    
+    @staticmethod
+    def _resolve_weights(job, weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Score weights for one call: DEFAULT_WEIGHTS, then the job profile's
+        own, then the call's. Nothing is stored on the (shared) profile.
+        """
+        from scoring import resolve_weights
+        job_weights = job.weights if isinstance(job, JobProfile) else job.get('weights')
+        return resolve_weights(job_weights, weights)
+    
+    @staticmethod
+    def _final_scores(
+        matrix: 'CandidateMatrix',
+        job_data: Dict,
+        weights: Dict[str, float],
+        precomputed: Dict
+    ):
+        """
+        Weighted scores of a pool via scoring.score_candidates.
+        
+        Returns:
+            (match scores rounded to 0-100, skills match fractions) arrays;
+            skills match is reported even when it carries no weight
+        """
+        import numpy as np
+        from scoring import score_candidates
+        
+        scores, components = score_candidates(matrix, job_data, weights, precomputed)
+        skills_match = components.get('skills')
+        if skills_match is None:
+            skills_match = matrix.skills_match(job_data['required_skills'])
+        return np.round(scores * 100, 2), skills_match
+    
+    def _rank_individually(
+        self,
+        job_data: Dict,
+        candidates: List[Dict],
+        top_n: int,
+        min_score: float,
+        weights: Dict[str, float]
+    ) -> List[Dict]:
+        """Legacy ranking that scores candidates one at a time."""
         matches = []
         for candidate in candidates:
-            score = self._calculate_match_score(job_data, candidate)
-            matches.append({
-                'name': candidate['name'],
-                'email': candidate['email'],
-                'file_path': candidate['file_path'],
-                'match_score': round(score * 100, 2),
-                'skills_match': self._calculate_skills_match(
-                    job_data['required_skills'],
-                    candidate['skills']
-                ),
-                'candidate_data': candidate
-            })
+            score = self._calculate_match_score(job_data, candidate, weights)
+            matches.append(self._match_entry(
+                candidate,
+                round(score * 100, 2),
+                self._calculate_skills_match(job_data['required_skills'], candidate['skills'])
+            ))
         
         # Sort by match score
         matches.sort(key=lambda x: x['match_score'], reverse=True)
@@ -319,45 +1363,101 @@ class ResumeMatcher:
         
         return filtered_matches[:top_n]
     
-    def _calculate_match_score(self, job_data: Dict, candidate: Dict) -> float:
-        """Calculate overall match score using TF-IDF and cosine similarity."""
-        # Combine job description and candidate resume
-        job_text = job_data['raw_text']
-        candidate_text = candidate['raw_text']
+    @staticmethod
+    def _match_entry(candidate: Dict, match_score: float, skills_match: float) -> Dict:
+        return {
+            'name': candidate['name'],
+            'email': candidate['email'],
+            'file_path': candidate['file_path'],
+            'match_score': match_score,
+            'skills_match': skills_match,
+            'candidate_data': candidate
+        }
+    
+    def _calculate_similarities(
+        self,
+        job_data: Dict,
+        candidates: List[Dict],
+        profile: Optional[JobProfile] = None,
+        matrix: Optional['CandidateMatrix'] = None,
+        vectorizer=None
+    ) -> List[float]:
+        """
+        Cosine similarity between the job and every candidate in one pass.
         
-        # Vectorize and calculate similarity
+        The job and the whole pool are vectorized into a single sparse matrix
+        (fitted once, so IDF reflects the pool), and all similarities come
+        from one sparse matrix-vector product. With a corpus-fitted (or
+        given, already fitted) vectorizer only transforms are done, and the
+        corpus-fitted job vector is taken from the profile when available.
+        """
+        if self.semantic_scorer is not None:
+            with timed('embed'):
+                return self.semantic_scorer.similarities(
+                    job_data['raw_text'], [c['raw_text'] for c in candidates]
+                ).tolist()
+        if vectorizer is None and self.corpus_fitted:
+            vectorizer = self.vectorizer
         try:
-            vectors = self.vectorizer.fit_transform([job_text, candidate_text])
-            similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
-        except:
-            # Fallback: simple keyword matching
-            similarity = self._simple_keyword_match(
-                job_data['keywords'],
-                candidate['keywords']
-            )
+            with timed('vectorize'):
+                if vectorizer is not None:
+                    if vectorizer is self.vectorizer and self.corpus_fitted:
+                        job_vector = self._job_vector(job_data, profile)
+                    else:
+                        job_vector = vectorizer.transform([job_data['raw_text']])
+                    candidate_vectors = vectorizer.transform([c['raw_text'] for c in candidates])
+                    return (candidate_vectors @ job_vector.T).toarray().ravel().tolist()
+                texts = [job_data['raw_text']] + [c['raw_text'] for c in candidates]
+                vectors = self._build_vectorizer().fit_transform(texts)
+        except ValueError:
+            # Empty vocabulary: fall back to simple keyword matching
+            if matrix is not None:
+                return matrix.keyword_jaccard(job_data['keywords']).tolist()
+            return [
+                self._simple_keyword_match(job_data['keywords'], c['keywords'])
+                for c in candidates
+            ]
         
-        # Weighted scoring
-        skills_weight = 0.4
-        experience_weight = 0.3
-        semantic_weight = 0.3
-        
-        # Skills match
-        skills_score = self._calculate_skills_match(
-            job_data['required_skills'],
-            candidate['skills']
-        )
-        
-        # Experience match (simplified)
-        experience_score = 1.0  # Could be enhanced with actual experience extraction
+        # TF-IDF rows are L2-normalized, so the dot product is the cosine
+        return (vectors[1:] @ vectors[0].T).toarray().ravel().tolist()
+    
+    def _job_vector(self, job_data: Dict, profile: Optional[JobProfile]):
+        """Job TF-IDF row for the corpus-fitted vectorizer, cached on the profile."""
+        if profile is None:
+            return self.vectorizer.transform([job_data['raw_text']])
+        vector = profile.vector_for(self.vectorizer_id)
+        if vector is None:
+            vector = self.vectorizer.transform([job_data['raw_text']])
+            profile.set_vector(vector, self.vectorizer_id)
+            self.job_profiles.put(profile)
+        return vector
+    
+    def _calculate_match_score(
+        self,
+        job_data: Dict,
+        candidate: Dict,
+        weights: Optional[Dict[str, float]] = None
+    ) -> float:
+        """Calculate overall match score using TF-IDF and cosine similarity."""
+        similarity = self._calculate_similarities(job_data, [candidate])[0]
+        return self._combine_scores(job_data, candidate, similarity, weights)
+    
+    def _combine_scores(
+        self,
+        job_data: Dict,
+        candidate: Dict,
+        similarity: float,
+        weights: Optional[Dict[str, float]] = None
+    ) -> float:
+        """Combine semantic similarity with the other weighted score components."""
+        import numpy as np
+        from scoring import CandidateMatrix, score_candidates
         
-        # Final weighted score
-        final_score = (
-            skills_score * skills_weight +
-            experience_score * experience_weight +
-            similarity * semantic_weight
+        weights = self._resolve_weights(job_data, weights)
+        scores, _ = score_candidates(
+            CandidateMatrix([candidate]), job_data, weights, {'semantic': np.array([similarity])}
         )
-        
-        return min(final_score, 1.0)  # Cap at 1.0
+        return float(scores[0])
     
     def _calculate_skills_match(self, required_skills: List[str], candidate_skills: List[str]) -> float:
         """Calculate skills match percentage."""
@@ -0,0 +1,347 @@
+"""
+Vectorized candidate scoring.
+
+Candidates' skills and keywords are encoded once into sparse binary
+candidate-by-feature matrices over a vocabulary fixed at encoding time, and
+every registered FeatureScorer encodes its own candidate-side features
+alongside them. Each score component (skills match, experience fit,
+education level, keyword overlap, semantic similarity) and the weighted
+final score for the whole pool are then a few sparse matrix-vector products
+and array operations instead of per-candidate Python loops.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from job_profiles import DEFAULT_WEIGHTS
+
+
+class CandidateMatrix:
+    """
+    Binary skill and keyword matrices, plus each scorer's encoded features,
+    for a fixed list of candidates.
+    """
+
+    def __init__(self, candidates: Sequence[Dict]):
+        """
+        Args:
+            candidates: Parsed resumes (with 'skills' and 'keywords'), in the
+                order scores are returned
+        """
+        self.size = len(candidates)
+        # Skills are compared case-insensitively, keywords exactly
+        self.skill_vocabulary: Dict[str, int] = {}
+        self.keyword_vocabulary: Dict[str, int] = {}
+        self.skills = self._encode(
+            ((s.lower() for s in c.get('skills', [])) for c in candidates),
+            self.skill_vocabulary
+        )
+        self.keywords = self._encode(
+            (c.get('keywords', []) for c in candidates),
+            self.keyword_vocabulary
+        )
+        # Distinct keywords per candidate (the Jaccard union needs them)
+        self.keyword_counts = np.diff(self.keywords.indptr).astype(np.float64)
+        self.features = self._encode_features(scorer.encode(candidates) for scorer in SCORERS.values())
+
+    @classmethod
+    def from_store(cls, store, rows: Optional[np.ndarray] = None) -> 'CandidateMatrix':
+        """
+        Build from a CandidateStore's interned skill/keyword ID arrays
+        without materializing any candidate records.
+
+        Args:
+            store: columnar_store.CandidateStore
+            rows: Record indices to include, in score order (default: all)
+        """
+        matrix = cls.__new__(cls)
+        skills = store.list_matrix('skills')
+        keywords = store.list_matrix('keywords')
+        if rows is not None:
+            skills, keywords = skills[rows], keywords[rows]
+        matrix.size = skills.shape[0]
+        # The store interns skills as written; fold case-variants together
+        matrix.skill_vocabulary = {}
+        remap = np.array([
+            matrix.skill_vocabulary.setdefault(skill.lower(), len(matrix.skill_vocabulary))
+            for skill in store.skill_vocabulary
+        ], dtype=np.int64)
+        skills = sparse.csr_matrix(
+            (skills.data, remap[skills.indices] if len(remap) else skills.indices, skills.indptr),
+            shape=(matrix.size, len(matrix.skill_vocabulary))
+        )
+        skills.sum_duplicates()
+        skills.data[:] = 1
+        matrix.skills = skills
+        matrix.keyword_vocabulary = {k: i for i, k in enumerate(store.keyword_vocabulary)}
+        matrix.keywords = keywords
+        matrix.keyword_counts = np.diff(keywords.indptr).astype(np.float64)
+        matrix.features = matrix._encode_features(
+            scorer.encode_store(store, rows) for scorer in SCORERS.values()
+        )
+        return matrix
+
+    @staticmethod
+    def _encode_features(encoded: Iterable[Optional[np.ndarray]]) -> Dict[str, np.ndarray]:
+        """Scorer name -> candidate-side feature array, for scorers that have one."""
+        return {
+            name: features
+            for name, features in zip(SCORERS, encoded)
+            if features is not None
+        }
+
+    def _encode(self, rows: Iterable[Iterable[str]], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+        indptr = [0]
+        indices: List[int] = []
+        for row in rows:
+            columns = {vocabulary.setdefault(item, len(vocabulary)) for item in row}
+            indices.extend(columns)
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float32)
+        return sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(self.size, len(vocabulary))
+        )
+
+    def skills_match(self, required_skills: List[str]) -> np.ndarray:
+        """Fraction of the required skills each candidate has."""
+        if not required_skills:
+            return np.zeros(self.size)
+        # Required skills missing from the vocabulary count against everyone
+        weights = np.zeros(len(self.skill_vocabulary), dtype=np.float32)
+        for skill in required_skills:
+            column = self.skill_vocabulary.get(skill.lower())
+            if column is not None:
+                weights[column] += 1
+        return (self.skills @ weights).astype(np.float64) / len(required_skills)
+
+    def skills_match_many(self, required_skills: Sequence[List[str]]) -> np.ndarray:
+        """
+        skills_match for several jobs at once.
+
+        Returns:
+            Candidate-by-job array of required-skill fractions
+        """
+        rows, columns = [], []
+        for j, skills in enumerate(required_skills):
+            for skill in skills:
+                column = self.skill_vocabulary.get(skill.lower())
+                if column is not None:
+                    rows.append(column)
+                    columns.append(j)
+        # Duplicate (skill, job) entries are summed, as in skills_match
+        weights = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, columns)),
+            shape=(len(self.skill_vocabulary), len(required_skills))
+        )
+        counts = (self.skills @ weights).toarray().astype(np.float64)
+        lengths = np.array([len(skills) for skills in required_skills], dtype=np.float64)
+        return np.divide(counts, lengths, out=np.zeros_like(counts), where=lengths > 0)
+
+    def keyword_jaccard(self, job_keywords: List[str]) -> np.ndarray:
+        """Jaccard overlap between the job's and each candidate's keyword sets."""
+        job_set = set(job_keywords)
+        if not job_set:
+            return np.zeros(self.size)
+        indicator = np.zeros(len(self.keyword_vocabulary), dtype=np.float32)
+        columns = [self.keyword_vocabulary[k] for k in job_set if k in self.keyword_vocabulary]
+        indicator[columns] = 1
+        overlap = (self.keywords @ indicator).astype(np.float64)
+        union = len(job_set) + self.keyword_counts - overlap
+        scores = np.divide(overlap, union, out=np.zeros(self.size), where=union > 0)
+        # No keywords on the candidate side means no overlap score at all
+        scores[self.keyword_counts == 0] = 0.0
+        return scores
+
+
+class FeatureScorer:
+    """
+    One component of the match score.
+
+    Candidate-side features are encoded once per pool, when the
+    CandidateMatrix is built (encode for parsed dicts, encode_store for a
+    CandidateStore's columns); score then evaluates the whole pool against
+    a job with array operations only, so adding a scorer adds no
+    per-candidate Python work at query time.
+    """
+
+    name = ''
+    # Scores computed outside the matrix (e.g. TF-IDF or embedding
+    # similarity) and handed to score_candidates as precomputed arrays
+    external = False
+
+    def encode(self, candidates: Sequence[Dict]) -> Optional[np.ndarray]:
+        """Candidate-side feature array for parsed candidates (None if not needed)."""
+        return None
+
+    def encode_store(self, store, rows: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Candidate-side feature array read from a CandidateStore."""
+        return None
+
+    def score(self, matrix: CandidateMatrix, job: Dict) -> np.ndarray:
+        """0-1 score of every candidate in the matrix for analyzed job data."""
+        raise NotImplementedError
+
+
+class SkillsScorer(FeatureScorer):
+    """Fraction of the job's required skills each candidate has."""
+
+    name = 'skills'
+
+    def score(self, matrix: CandidateMatrix, job: Dict) -> np.ndarray:
+        return matrix.skills_match(job.get('required_skills', []))
+
+
+class KeywordScorer(FeatureScorer):
+    """Jaccard overlap of job and candidate keywords."""
+
+    name = 'keywords'
+
+    def score(self, matrix: CandidateMatrix, job: Dict) -> np.ndarray:
+        return matrix.keyword_jaccard(job.get('keywords', []))
+
+
+class NumericFeatureScorer(FeatureScorer):
+    """
+    Candidate value over the job's requirement, capped at 1.0; every
+    candidate scores 1.0 when the job states no requirement.
+    """
+
+    # Parsed record field / CandidateStore column, and the job_data key
+    field = ''
+    requirement = ''
+    dtype = np.float32
+
+    def encode(self, candidates: Sequence[Dict]) -> np.ndarray:
+        return np.fromiter(
+            (c.get(self.field) or 0 for c in candidates), dtype=self.dtype, count=len(candidates)
+        )
+
+    def encode_store(self, store, rows: Optional[np.ndarray]) -> np.ndarray:
+        values = store.column(self.field)
+        return np.array(values if rows is None else values[rows], dtype=self.dtype)
+
+    def score(self, matrix: CandidateMatrix, job: Dict) -> np.ndarray:
+        required = job.get(self.requirement) or 0
+        if required <= 0:
+            return np.ones(matrix.size)
+        return np.minimum(matrix.features[self.name].astype(np.float64) / required, 1.0)
+
+
+class ExperienceScorer(NumericFeatureScorer):
+    """Candidate's years of experience against the years the job asks for."""
+
+    name = 'experience'
+    field = 'experience_years'
+    requirement = 'experience_required'
+
+
+class EducationScorer(NumericFeatureScorer):
+    """Candidate's highest degree level against the job's minimum."""
+
+    name = 'education'
+    field = 'education_level'
+    requirement = 'education_required'
+    dtype = np.uint8
+
+
+class SemanticScorer(FeatureScorer):
+    """Job-resume text similarity (TF-IDF or embeddings), computed by the matcher."""
+
+    name = 'semantic'
+    external = True
+
+    def score(self, matrix: CandidateMatrix, job: Dict) -> np.ndarray:
+        raise ValueError("Semantic similarity must be passed to score_candidates as precomputed")
+
+
+# Score components by name; weights (see job_profiles.DEFAULT_WEIGHTS) refer to these
+SCORERS: Dict[str, FeatureScorer] = {}
+
+
+def register_scorer(scorer: FeatureScorer) -> FeatureScorer:
+    """Add (or replace) a score component; give it a weight to use it."""
+    SCORERS[scorer.name] = scorer
+    return scorer
+
+
+for _scorer in (SkillsScorer(), ExperienceScorer(), SemanticScorer(), EducationScorer(), KeywordScorer()):
+    register_scorer(_scorer)
+
+
+def resolve_weights(*overrides: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """
+    DEFAULT_WEIGHTS updated with each given override in turn (e.g. a job
+    profile's weights, then a request's).
+
+    Raises:
+        ValueError: For unknown components, negative weights, or when every
+            weight is zero
+    """
+    weights = dict(DEFAULT_WEIGHTS)
+    for override in overrides:
+        weights.update(override or {})
+    for name, value in weights.items():
+        if name not in SCORERS:
+            raise ValueError(f"Unknown score component: {name}")
+        if not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"Weight for {name} must be a non-negative number")
+    if not any(weights.values()):
+        raise ValueError("At least one score weight must be positive")
+    return weights
+
+
+def score_candidates(
+    matrix: CandidateMatrix,
+    job: Dict,
+    weights: Dict[str, float],
+    precomputed: Optional[Dict[str, np.ndarray]] = None
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Weighted final score for the pool, capped at 1.0.
+
+    Weights are relative (divided by their sum) and zero-weight components
+    are not evaluated.
+
+    Args:
+        matrix: The pool's CandidateMatrix
+        job: Analyzed job data
+        weights: Component weights from resolve_weights
+        precomputed: Component scores already computed for this pool (always
+            needed for external components such as 'semantic')
+
+    Returns:
+        (final scores, {component name: scores}) arrays
+    """
+    precomputed = precomputed or {}
+    total = sum(weights.values())
+    final = np.zeros(matrix.size)
+    components = {}
+    for name, weight in weights.items():
+        if not weight:
+            continue
+        values = precomputed.get(name)
+        if values is None:
+            values = SCORERS[name].score(matrix, job)
+        components[name] = values
+        final += values * (weight / total)
+    return np.minimum(final, 1.0), components
+
+
+def top_indices(scores: np.ndarray, top_n: int, min_score: float) -> np.ndarray:
+    """
+    Indices of the top_n scores at or above min_score, best first.
+
+    Ties keep the candidates' original order.
+    """
+    eligible = np.flatnonzero(scores >= min_score)
+    if top_n <= 0 or not len(eligible):
+        return eligible[:0]
+    if len(eligible) > top_n:
+        # Keep everything tied with the N-th best score, then sort only those
+        cutoff = np.partition(scores[eligible], len(eligible) - top_n)[len(eligible) - top_n]
+        eligible = eligible[scores[eligible] >= cutoff]
+    order = np.argsort(-scores[eligible], kind='stable')
+    return eligible[order[:top_n]]
@@ -0,0 +1,202 @@
+"""
+Asynchronous batch screening jobs.
+
+Large match requests are submitted as jobs and processed on a local worker
+pool, so the web request that creates a job returns immediately. Clients
+poll (or stream) the job for progress and provisional top-N results, then
+fetch the final ranking when it is done.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class ScreeningJob:
+    """State of one submitted screening job."""
+
+    def __init__(
+        self,
+        job_description: str,
+        resume_paths: List[str],
+        top_n: int,
+        min_score: float,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        self.id = uuid.uuid4().hex
+        self.job_description = job_description
+        self.resume_paths = resume_paths
+        self.top_n = top_n
+        self.min_score = min_score
+        # Per-job score weights on top of the job profile's
+        self.weights = weights
+        self.status = QUEUED
+        self.stage = 'queued'
+        self.total = len(resume_paths)
+        self.processed = 0
+        self.partial_results: List[Dict] = []
+        self.results: Optional[List[Dict]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        # Bumped on every change so streaming clients can detect updates
+        self.revision = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    def update(self, **fields) -> None:
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.updated_at = time.time()
+        self.revision += 1
+
+    def snapshot(self, include_results: bool = False) -> Dict:
+        """JSON-serializable view of the job."""
+        data = {
+            'job_id': self.id,
+            'status': self.status,
+            'stage': self.stage,
+            'progress': {
+                'processed': self.processed,
+                'total': self.total,
+                'percent': round(100.0 * self.processed / self.total, 1) if self.total else 100.0
+            },
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+        if self.error:
+            data['error'] = self.error
+        if include_results and self.results is not None:
+            data['results'] = self.results
+            data['total_matched'] = len(self.results)
+        else:
+            data['partial_results'] = self.partial_results
+        return data
+
+
+class ScreeningJobManager:
+    """Runs screening jobs on a local thread pool and tracks their state."""
+
+    def __init__(
+        self,
+        matcher_factory: Callable,
+        format_result: Callable[[Dict], Dict] = lambda result: result,
+        load_candidates: Optional[Callable[[List[str]], List[Dict]]] = None,
+        workers: int = 2,
+        chunk_size: int = 50,
+        max_jobs: int = 200,
+        synchronous: bool = False
+    ):
+        """
+        Args:
+            matcher_factory: Returns the ResumeMatcher used to run jobs
+            format_result: Converts a match result for API responses
+            load_candidates: Returns parsed records for resume paths
+                (defaults to parsing them with the matcher)
+            workers: Number of jobs processed concurrently
+            chunk_size: Resumes parsed between progress updates
+            max_jobs: Finished jobs retained before the oldest are dropped
+            synchronous: Run jobs inside submit() (for serverless hosts where
+                background threads do not outlive the request)
+        """
+        self.matcher_factory = matcher_factory
+        self.format_result = format_result
+        self.load_candidates = load_candidates
+        self.chunk_size = max(1, chunk_size)
+        self.max_jobs = max_jobs
+        self.synchronous = synchronous
+        self._jobs: 'OrderedDict[str, ScreeningJob]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='screening')
+
+    def submit(
+        self,
+        job_description: str,
+        resume_paths: List[str],
+        top_n: int = 10,
+        min_score: float = 0.0,
+        weights: Optional[Dict[str, float]] = None
+    ) -> ScreeningJob:
+        """Queue a screening job (or run it inline in synchronous mode) and return it."""
+        job = ScreeningJob(job_description, resume_paths, top_n, min_score, weights)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        if self.synchronous:
+            self._run(job)
+        else:
+            self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ScreeningJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond max_jobs."""
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [j.id for j in self._jobs.values() if j.finished][:excess]:
+            del self._jobs[job_id]
+
+    def _run(self, job: ScreeningJob) -> None:
+        try:
+            matcher = self.matcher_factory()
+            job.update(status=RUNNING, stage='analyzing job')
+            job_data = matcher.compile_job(job.job_description)
+
+            candidates = []
+            provisional: List[Dict] = []
+            for start in range(0, job.total, self.chunk_size):
+                chunk = job.resume_paths[start:start + self.chunk_size]
+                job.update(stage='parsing')
+                if self.load_candidates is not None:
+                    parsed = self.load_candidates(chunk)
+                else:
+                    parsed = matcher.parse_resumes(chunk)
+                candidates.extend(parsed)
+
+                # Provisional ranking: score the new chunk on its own and merge
+                # it into the running top N; final scores use the whole pool.
+                provisional = sorted(
+                    provisional + matcher.rank_candidates(
+                        job_data, parsed, top_n=job.top_n, min_score=job.min_score, weights=job.weights
+                    ),
+                    key=lambda m: m['match_score'],
+                    reverse=True
+                )[:job.top_n]
+                job.update(
+                    processed=min(start + len(chunk), job.total),
+                    partial_results=[self.format_result(m) for m in provisional]
+                )
+
+            job.update(stage='scoring')
+            results = matcher.rank_candidates(
+                job_data, candidates, top_n=job.top_n, min_score=job.min_score, weights=job.weights
+            )
+            job.update(
+                status=DONE,
+                stage='done',
+                results=[self.format_result(m) for m in results],
+                partial_results=[]
+            )
+        except Exception as e:
+            job.update(status=FAILED, stage='failed', error=str(e))
+        finally:
+            # Inputs are no longer needed once the job has finished
+            job.job_description = None
+            job.resume_paths = []
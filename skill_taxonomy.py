@@ -0,0 +1,167 @@
+"""
+Skill taxonomy and single-pass skill matcher.
+
+All skill names and aliases are compiled once into a trie-shaped regular
+expression, so extraction is a single scan over the text whatever the size
+of the taxonomy. Matches respect word boundaries ("java" does not match
+inside "javascript", "git" not inside "digital") and aliases are normalized
+to their canonical skill name.
+"""
+
+import hashlib
+import json
+import re
+from typing import Dict, List, Optional
+
+# Canonical skill -> aliases
+DEFAULT_SKILLS = {
+    'python': ['python3'],
+    'java': [],
+    'javascript': ['ecmascript'],
+    'react': ['reactjs', 'react.js'],
+    'node.js': ['nodejs'],
+    'django': [],
+    'flask': [],
+    'sql': [],
+    'postgresql': ['postgres'],
+    'mysql': [],
+    'mongodb': ['mongo'],
+    'aws': ['amazon web services'],
+    'docker': [],
+    'kubernetes': ['k8s'],
+    'git': [],
+    'linux': [],
+    'html': ['html5'],
+    'css': ['css3'],
+    'typescript': [],
+    'angular': ['angularjs'],
+    'vue': ['vue.js', 'vuejs'],
+    'machine learning': [],
+    'deep learning': [],
+    'tensorflow': [],
+    'pytorch': [],
+    'agile': [],
+    'scrum': [],
+    'ci/cd': ['ci-cd', 'continuous integration'],
+    'rest api': ['rest apis', 'restful api', 'restful apis'],
+    'graphql': [],
+    'microservices': ['microservice'],
+}
+
+# Characters that continue a skill token; a match may not be adjacent to one
+_WORD_CHARS = r'a-z0-9+#'
+
+_END = ''
+
+
+class SkillTaxonomy:
+    """A set of canonical skills and their aliases, compiled for matching."""
+
+    def __init__(self, skills: Dict[str, List[str]]):
+        """
+        Args:
+            skills: Mapping of canonical skill name to a list of aliases
+        """
+        self.aliases: Dict[str, str] = {}
+        for canonical, aliases in skills.items():
+            canonical = self._normalize_term(canonical)
+            if not canonical:
+                continue
+            self.aliases[canonical] = canonical
+            for alias in aliases or []:
+                alias = self._normalize_term(alias)
+                if alias:
+                    self.aliases.setdefault(alias, canonical)
+        self.skills = sorted(set(self.aliases.values()))
+        self._pattern = self._compile(self.aliases)
+        self.fingerprint = hashlib.sha1(
+            json.dumps(sorted(self.aliases.items())).encode('utf-8')
+        ).hexdigest()[:12]
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SkillTaxonomy':
+        """
+        Load a taxonomy from JSON.
+
+        Accepts either a mapping of skill -> aliases, a list of skill names,
+        or a list of {"name": ..., "aliases": [...]} objects.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return cls(data)
+        skills = {}
+        for entry in data:
+            if isinstance(entry, str):
+                skills[entry] = []
+            else:
+                skills[entry['name']] = entry.get('aliases', [])
+        return cls(skills)
+
+    def normalize(self, term: str) -> Optional[str]:
+        """Canonical skill name for a skill or alias, or None if unknown."""
+        return self.aliases.get(self._normalize_term(term))
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills mentioned in text, in order of first mention."""
+        if self._pattern is None:
+            return []
+        found = {}
+        for match in self._pattern.finditer(text.lower()):
+            surface = ' '.join(match.group(0).split())
+            found.setdefault(self.aliases[surface], None)
+        return list(found)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, term: str) -> bool:
+        return self.normalize(term) is not None
+
+    @staticmethod
+    def _normalize_term(term: str) -> str:
+        return ' '.join(term.lower().split())
+
+    @classmethod
+    def _compile(cls, terms) -> Optional['re.Pattern']:
+        """Build one boundary-aware regex from a trie of all terms."""
+        trie: Dict = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+        if not trie:
+            return None
+        body = cls._trie_to_regex(trie)
+        return re.compile(rf'(?<![{_WORD_CHARS}]){body}(?![{_WORD_CHARS}])')
+
+    @classmethod
+    def _trie_to_regex(cls, node: Dict) -> str:
+        """
+        Convert a trie node to a regex fragment.
+
+        Longer continuations are tried first (the terminal branch is an
+        optional group), so the longest skill at a position wins.
+        """
+        branches = []
+        for char in sorted(k for k in node if k != _END):
+            char_pattern = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(char_pattern + cls._trie_to_regex(node[char]))
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if _END in node:
+            pattern = '(?:' + pattern + ')?'
+        return pattern
+
+
+_default_taxonomy = None
+
+
+def default_taxonomy() -> SkillTaxonomy:
+    """The built-in taxonomy, compiled once per process."""
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        _default_taxonomy = SkillTaxonomy(DEFAULT_SKILLS)
+    return _default_taxonomy
@@ -2,6 +2,13 @@
 
 const API_BASE = '/api';
 let uploadedFiles = [];
+const RESUME_EXTENSIONS = ['pdf', 'docx', 'doc', 'odt', 'rtf', 'html', 'htm', 'txt'];
+const ARCHIVE_EXTENSIONS = ['zip', 'tar', 'tgz', 'gz', 'bz2'];
+// Files per bulk request, kept under serverless body limits
+const BULK_BATCH_BYTES = 4 * 1024 * 1024;
+const BULK_BATCH_FILES = 200;
+// Results are kept server-side and fetched a page at a time
+const RESULTS_PAGE_SIZE = 50;
 
 // Initialize
 document.addEventListener('DOMContentLoaded', function() {
@@ -59,18 +66,20 @@ function handleDrop(e) {
     const files = Array.from(e.dataTransfer.files);
     const validFiles = files.filter(file => {
         const ext = file.name.split('.').pop().toLowerCase();
-        return ['pdf', 'docx', 'doc', 'txt'].includes(ext);
+        return RESUME_EXTENSIONS.includes(ext) || ARCHIVE_EXTENSIONS.includes(ext);
     });
     
     if (validFiles.length !== files.length) {
-        alert('Some files were skipped. Only PDF, DOCX, DOC, and TXT files are supported.');
+        alert('Some files were skipped. Only PDF, DOCX, DOC, TXT files and ZIP/tar archives are supported.');
     }
     
     uploadFiles(validFiles);
 }
 
 async function uploadFiles(files) {
-    const uploadedFilesContainer = document.getElementById('uploadedFiles');
+    if (files.length > 1 || files.some(isArchive)) {
+        return uploadFilesBulk(files);
+    }
     
     for (const file of files) {
         if (file.size > 16 * 1024 * 1024) {
@@ -101,7 +110,7 @@ async function uploadFiles(files) {
                     type: file.type
                 });
                 
-                displayUploadedFile(data.filename, file.name, file.size);
+                displayUploadedFile(data.filename, file.name, file.size, data.contact);
             } else {
                 alert(`Error uploading ${file.name}: ${data.error}`);
             }
@@ -112,7 +121,73 @@ async function uploadFiles(files) {
     }
 }
 
-function displayUploadedFile(filename, originalName, size) {
+function isArchive(file) {
+    const ext = file.name.split('.').pop().toLowerCase();
+    return ARCHIVE_EXTENSIONS.includes(ext);
+}
+
+// Upload many files (and archives) in a few multipart requests instead of one per file
+async function uploadFilesBulk(files) {
+    const batches = [];
+    let batch = [];
+    let batchBytes = 0;
+    for (const file of files) {
+        if (batch.length && (batchBytes + file.size > BULK_BATCH_BYTES || batch.length >= BULK_BATCH_FILES)) {
+            batches.push(batch);
+            batch = [];
+            batchBytes = 0;
+        }
+        batch.push(file);
+        batchBytes += file.size;
+    }
+    if (batch.length) batches.push(batch);
+    
+    const skipped = [];
+    let skippedCount = 0;
+    for (const group of batches) {
+        const formData = new FormData();
+        group.forEach(file => formData.append('files', file));
+        
+        try {
+            const response = await fetch(`${API_BASE}/upload/bulk?parse=1`, {
+                method: 'POST',
+                body: formData
+            });
+            const data = await response.json();
+            
+            if (data.skipped) {
+                skipped.push(...data.skipped);
+                skippedCount += data.skipped_count || data.skipped.length;
+            }
+            if (!data.success) {
+                if (!data.skipped) alert(`Error uploading files: ${data.error}`);
+                continue;
+            }
+            
+            for (const stored of data.files) {
+                // Identical content is stored once; list it once
+                if (uploadedFiles.some(f => f.filename === stored.filename)) continue;
+                uploadedFiles.push({
+                    filename: stored.filename,
+                    originalName: stored.original_name,
+                    size: stored.size
+                });
+                displayUploadedFile(stored.filename, stored.original_name, stored.size);
+            }
+        } catch (error) {
+            console.error('Bulk upload error:', error);
+            alert(`Error uploading files: ${error.message}`);
+        }
+    }
+    
+    if (skipped.length) {
+        // The server lists only the first skipped files of each request
+        const more = skippedCount > skipped.length ? `\n...and ${skippedCount - skipped.length} more` : '';
+        alert('Some files were skipped:\n' + skipped.map(s => `${s.name}: ${s.reason}`).join('\n') + more);
+    }
+}
+
+function displayUploadedFile(filename, originalName, size, contact = null) {
     const uploadedFilesContainer = document.getElementById('uploadedFiles');
     
     const fileItem = document.createElement('div');
@@ -140,6 +215,13 @@ function displayUploadedFile(filename, originalName, size) {
         </div>
     `;
     
+    // Name/email read from the top of the resume at upload time
+    if (contact && contact.name) {
+        const contactLine = document.createElement('p');
+        contactLine.textContent = contact.email ? `${contact.name} · ${contact.email}` : contact.name;
+        fileItem.querySelector('.file-details').appendChild(contactLine);
+    }
+    
     uploadedFilesContainer.appendChild(fileItem);
 }
 
@@ -149,6 +231,10 @@ function getFileIcon(filename) {
         'pdf': '<i class="fas fa-file-pdf"></i>',
         'docx': '<i class="fas fa-file-word"></i>',
         'doc': '<i class="fas fa-file-word"></i>',
+        'odt': '<i class="fas fa-file-word"></i>',
+        'rtf': '<i class="fas fa-file-word"></i>',
+        'html': '<i class="fas fa-file-code"></i>',
+        'htm': '<i class="fas fa-file-code"></i>',
         'txt': '<i class="fas fa-file-alt"></i>'
     };
     return icons[ext] || '<i class="fas fa-file"></i>';
@@ -258,7 +344,8 @@ async function matchCandidates() {
     matchBtn.disabled = true;
     
     try {
-        const response = await fetch(`${API_BASE}/match`, {
+        // Submit an asynchronous screening job so large batches never hit request timeouts
+        const response = await fetch(`${API_BASE}/jobs`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -267,7 +354,8 @@ async function matchCandidates() {
                 job_description: jobDescription,
                 filenames: uploadedFiles.map(f => f.filename),
                 top_n: topN,
-                min_score: minScore
+                min_score: minScore,
+                page_size: RESULTS_PAGE_SIZE
             })
         });
         
@@ -278,7 +366,10 @@ async function matchCandidates() {
         const data = await response.json();
         
         if (data.success) {
-            displayResults(data.results);
+            // Jobs run inline on serverless hosts and come back already finished
+            const page = data.status === 'done' ? data : await waitForJob(data.job_id);
+            resetResultFilters();
+            showResultPage(page);
         } else {
             alert(`Error: ${data.error}`);
         }
@@ -297,13 +388,123 @@ async function matchCandidates() {
     }
 }
 
+// Poll a screening job until it finishes, showing progress in the loading panel
+async function waitForJob(jobId) {
+    const loadingText = document.querySelector('#loading p');
+    const defaultText = loadingText.textContent;
+    
+    try {
+        while (true) {
+            const response = await fetch(`${API_BASE}/jobs/${jobId}`);
+            if (!response.ok) {
+                throw new Error(`Server error: ${response.status} ${response.statusText}`);
+            }
+            
+            const job = await response.json();
+            if (job.status === 'done') {
+                break;
+            }
+            if (job.status === 'failed') {
+                throw new Error(job.error || 'Screening job failed');
+            }
+            
+            const progress = job.progress;
+            loadingText.textContent = `Analyzing resumes... ${progress.processed}/${progress.total} (${progress.percent}%)`;
+            await new Promise(resolve => setTimeout(resolve, 1000));
+        }
+        
+        const response = await fetch(`${API_BASE}/jobs/${jobId}/results?page_size=${RESULTS_PAGE_SIZE}`);
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status} ${response.statusText}`);
+        }
+        return await response.json();
+    } finally {
+        loadingText.textContent = defaultText;
+    }
+}
+
+// Show one page of a server-side result session
+function showResultPage(page) {
+    currentSession = {
+        id: page.result_session_id,
+        page: page.page,
+        pages: page.pages,
+        total: page.total,
+        totalMatched: page.total_matched,
+        stats: page.stats
+    };
+    if (page.total_matched === 0) {
+        displayResults([]);
+        return;
+    }
+    updateStatistics(page.stats);
+    updateSearchFilters(page.results);
+    displayResults(page.results);
+}
+
+function resultQuery() {
+    const params = new URLSearchParams();
+    const searchTerm = document.getElementById('searchInput').value.trim();
+    const filterScore = parseInt(document.getElementById('filterScore').value) || 0;
+    const sortBy = document.getElementById('sortBy').value;
+    if (searchTerm) params.set('q', searchTerm);
+    if (filterScore) params.set('min_score', filterScore);
+    if (sortBy) params.set('sort', sortBy);
+    return params;
+}
+
+function resetResultFilters() {
+    document.getElementById('searchInput').value = '';
+    document.getElementById('filterScore').value = '';
+    document.getElementById('sortBy').value = 'score';
+}
+
+async function loadResultPage(pageNumber) {
+    if (!currentSession) return;
+    
+    const params = resultQuery();
+    params.set('page', pageNumber);
+    params.set('page_size', RESULTS_PAGE_SIZE);
+    
+    try {
+        const response = await fetch(`${API_BASE}/results/${currentSession.id}?${params}`);
+        if (response.status === 404) {
+            alert('These results have expired. Please run the match again.');
+            return;
+        }
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status} ${response.statusText}`);
+        }
+        showResultPage(await response.json());
+    } catch (error) {
+        console.error('Results error:', error);
+        alert(`Error loading results: ${error.message}`);
+    }
+}
+
+function paginationHtml() {
+    if (!currentSession || currentSession.pages <= 1) return '';
+    const { page, pages } = currentSession;
+    return `
+        <div class="results-pagination" style="display: flex; justify-content: center; align-items: center; gap: 12px; margin-top: 20px;">
+            <button class="btn btn-secondary" onclick="loadResultPage(${page - 1})" ${page <= 1 ? 'disabled' : ''}>
+                <i class="fas fa-chevron-left"></i> Previous
+            </button>
+            <span>Page ${page} of ${pages}</span>
+            <button class="btn btn-secondary" onclick="loadResultPage(${page + 1})" ${page >= pages ? 'disabled' : ''}>
+                Next <i class="fas fa-chevron-right"></i>
+            </button>
+        </div>
+    `;
+}
+
 function displayResults(results) {
     const resultsContainer = document.getElementById('resultsContainer');
     
-    // Store results globally
+    // Store the current page globally
     currentResults = results;
     
-    if (results.length === 0) {
+    if (results.length === 0 && (!currentSession || currentSession.totalMatched === 0)) {
         resultsContainer.innerHTML = `
             <div class="no-results">
                 <i class="fas fa-search"></i>
@@ -315,21 +516,20 @@ function displayResults(results) {
         return;
     }
     
-    // Show actions and stats
+    // Show actions
     document.getElementById('resultsActions').style.display = 'block';
-    updateStatistics(results);
-    updateSearchFilters(results);
     
+    const total = currentSession ? currentSession.total : results.length;
     let html = `
         <div class="results-header" style="margin-bottom: 20px; padding: 15px; background: #f8fafc; border-radius: 8px;">
-            <h3 style="margin-bottom: 5px;">Found ${results.length} Matching Candidate${results.length !== 1 ? 's' : ''}</h3>
-            <p style="color: #64748b; font-size: 0.9rem;">Sorted by match score (highest first)</p>
+            <h3 style="margin-bottom: 5px;">Found ${total} Matching Candidate${total !== 1 ? 's' : ''}</h3>
+            <p style="color: #64748b; font-size: 0.9rem;">Ranked by match score (highest first)</p>
         </div>
         <div class="results-grid">
     `;
     
     results.forEach((candidate, index) => {
-        const rank = index + 1;
+        const rank = candidate.rank || index + 1;
         const scoreColor = getScoreColor(candidate.match_score);
         
         html += `
@@ -380,6 +580,7 @@ function displayResults(results) {
     });
     
     html += '</div>';
+    html += paginationHtml();
     resultsContainer.innerHTML = html;
     
     // Animate score bars
@@ -495,8 +696,10 @@ window.onclick = function(event) {
     });
 }
 
-// Store current results globally
+// Current page of results and the server-side session it came from
 let currentResults = [];
+let currentSession = null;
+let searchTimer = null;
 
 // Initialize search/filter event listeners after results are displayed
 function initializeSearchFilters() {
@@ -504,29 +707,29 @@ function initializeSearchFilters() {
     const filterScore = document.getElementById('filterScore');
     const sortBy = document.getElementById('sortBy');
     
-    if (searchInput) searchInput.oninput = () => filterAndSearch();
+    if (searchInput) searchInput.oninput = () => {
+        // Debounce so typing does not send a request per keystroke
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(filterAndSearch, 300);
+    };
     if (filterScore) filterScore.onchange = () => filterAndSearch();
     if (sortBy) sortBy.onchange = () => filterAndSearch();
 }
 
 // Statistics Functions
-function updateStatistics(results) {
-    if (results.length === 0) {
+// Statistics cover the whole result session and are computed server-side
+function updateStatistics(stats) {
+    if (!stats || stats.total === 0) {
         document.getElementById('statsPanel').style.display = 'none';
         return;
     }
     
     document.getElementById('statsPanel').style.display = 'grid';
     
-    const total = results.length;
-    const avgScore = results.reduce((sum, r) => sum + r.match_score, 0) / total;
-    const topScore = Math.max(...results.map(r => r.match_score));
-    const totalSkills = new Set(results.flatMap(r => r.skills || [])).size;
-    
-    document.getElementById('statTotal').textContent = total;
-    document.getElementById('statAvgScore').textContent = avgScore.toFixed(1) + '%';
-    document.getElementById('statTopScore').textContent = topScore.toFixed(1) + '%';
-    document.getElementById('statTotalSkills').textContent = totalSkills;
+    document.getElementById('statTotal').textContent = stats.total;
+    document.getElementById('statAvgScore').textContent = stats.average_score.toFixed(1) + '%';
+    document.getElementById('statTopScore').textContent = stats.top_score.toFixed(1) + '%';
+    document.getElementById('statTotalSkills').textContent = stats.distinct_skills;
 }
 
 // Search and Filter Functions
@@ -551,82 +754,29 @@ function updateSearchFilters(results) {
     });
 }
 
+// Search, score filter and sort are applied server-side over the whole session
 function filterAndSearch() {
-    const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-    const filterScore = parseInt(document.getElementById('filterScore').value) || 0;
-    const sortBy = document.getElementById('sortBy').value;
-    
-    let filtered = currentResults.filter(candidate => {
-        const matchesSearch = !searchTerm || 
-            candidate.name.toLowerCase().includes(searchTerm) ||
-            candidate.email.toLowerCase().includes(searchTerm) ||
-            (candidate.skills || []).some(skill => skill.toLowerCase().includes(searchTerm));
-        
-        const matchesScore = candidate.match_score >= filterScore;
-        
-        return matchesSearch && matchesScore;
-    });
-    
-    // Sort
-    if (sortBy === 'name') {
-        filtered.sort((a, b) => (a.name || '').localeCompare(b.name || ''));
-    } else if (sortBy === 'skills') {
-        filtered.sort((a, b) => (b.skills?.length || 0) - (a.skills?.length || 0));
-    } else {
-        filtered.sort((a, b) => b.match_score - a.match_score);
-    }
-    
-    // Re-display filtered results
-    originalDisplayResults(filtered);
+    loadResultPage(1);
 }
 
 // Export Functions
-async function exportToCSV() {
-    if (currentResults.length === 0) {
+function exportToCSV() {
+    if (!currentSession || currentSession.totalMatched === 0) {
         alert('No results to export');
         return;
     }
     
-    try {
-        const response = await fetch(`${API_BASE}/export`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({ results: currentResults })
-        });
-        
-        if (!response.ok) {
-            throw new Error(`Server error: ${response.status}`);
-        }
-        
-        const data = await response.json();
-        
-        if (data.success) {
-            // Download CSV
-            const blob = new Blob([data.csv], { type: 'text/csv' });
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = data.filename;
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            window.URL.revokeObjectURL(url);
-            
-            alert(`Exported ${currentResults.length} candidates to ${data.filename}`);
-        } else {
-            alert(`Error: ${data.error}`);
-        }
-    } catch (error) {
-        console.error('Export error:', error);
-        alert(`Error exporting: ${error.message}`);
-    }
+    // The server streams the CSV from the stored results (with the current filters)
+    const a = document.createElement('a');
+    a.href = `${API_BASE}/results/${currentSession.id}/export?${resultQuery()}`;
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
 }
 
 // Analytics Functions
 function showAnalytics() {
-    if (currentResults.length === 0) {
+    if (!currentSession || currentSession.totalMatched === 0) {
         alert('No results to analyze');
         return;
     }
@@ -634,27 +784,13 @@ function showAnalytics() {
     const modal = document.getElementById('analyticsModal');
     const body = document.getElementById('analyticsBody');
     
-    // Calculate analytics
-    const scores = currentResults.map(r => r.match_score);
-    const avgScore = scores.reduce((a, b) => a + b, 0) / scores.length;
-    const maxScore = Math.max(...scores);
-    const minScore = Math.min(...scores);
-    
-    // Score distribution
-    const excellent = scores.filter(s => s >= 80).length;
-    const good = scores.filter(s => s >= 60 && s < 80).length;
-    const fair = scores.filter(s => s >= 40 && s < 60).length;
-    const poor = scores.filter(s => s < 40).length;
-    
-    // Skills analysis
-    const allSkills = currentResults.flatMap(r => r.skills || []);
-    const skillCounts = {};
-    allSkills.forEach(skill => {
-        skillCounts[skill] = (skillCounts[skill] || 0) + 1;
-    });
-    const topSkills = Object.entries(skillCounts)
-        .sort((a, b) => b[1] - a[1])
-        .slice(0, 10);
+    // Analytics over all results of the session (computed server-side)
+    const stats = currentSession.stats;
+    const avgScore = stats.average_score;
+    const maxScore = stats.top_score;
+    const minScore = stats.lowest_score;
+    const { excellent, good, fair, poor } = stats.distribution;
+    const topSkills = stats.top_skills;
     
     body.innerHTML = `
         <div class="analytics-grid">
@@ -701,7 +837,7 @@ function showAnalytics() {
                 ${topSkills.map(([skill, count]) => `
                     <div class="chart-bar">
                         <div class="chart-label">${skill}</div>
-                        <div class="chart-bar-fill" style="width: ${(count / currentResults.length) * 100}%;">${count}</div>
+                        <div class="chart-bar-fill" style="width: ${(count / stats.total) * 100}%;">${count}</div>
                     </div>
                 `).join('')}
             </div>
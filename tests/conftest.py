@@ -0,0 +1,139 @@
+"""Shared fixtures: a small resume corpus and a job description."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+RESUMES = {
+    'alice': """Alice Johnson
+alice.johnson@example.com | (555) 123-4567
+
+SUMMARY
+Backend engineer who enjoys building reliable services.
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp (2016 - 2023)
+Built REST APIs in Python and Django, deployed with Docker on AWS.
+Maintained PostgreSQL databases and Kubernetes clusters.
+
+EDUCATION
+Master of Science in Computer Science, State University
+
+SKILLS
+Python, Django, SQL, PostgreSQL, Docker, AWS, Kubernetes, Git
+""",
+    'bob': """Bob Smith
+bob.smith@example.com
+555-987-6543
+
+EXPERIENCE
+Frontend Developer, Webshop (2019 - 2023)
+Built single page apps in JavaScript, React and TypeScript.
+
+EDUCATION
+Bachelor of Science in Design
+
+SKILLS
+JavaScript, React, TypeScript, HTML, CSS
+""",
+    'carol': """Carol Diaz
+carol@example.org
+(555) 222-3333
+
+EXPERIENCE
+Accountant, Numbers LLP (2012 - 2022)
+Prepared financial statements and managed payroll in digital ledgers.
+
+EDUCATION
+Bachelor of Arts in Accounting
+""",
+    'dave': """Dave Lee
+dave.lee@example.com
+555.444.1212
+
+EXPERIENCE
+Data Engineer, Streamly (2018 - 2023)
+Python and SQL pipelines on AWS; some Docker. 5 years of experience.
+
+EDUCATION
+Bachelor of Science in Mathematics
+
+SKILLS
+Python, SQL, AWS, Docker, Linux
+""",
+    'erin': """Erin Walsh
+erin.walsh@example.com
+(555) 777-8888
+
+EXPERIENCE
+DevOps Engineer, Cloudworks (2017 - 2023)
+Ran Kubernetes and Docker on AWS, wrote Python tooling and CI/CD pipelines.
+
+EDUCATION
+Bachelor of Science in Computer Science
+
+SKILLS
+Kubernetes, Docker, AWS, Python, Linux, CI/CD
+""",
+}
+
+JOB_DESCRIPTION = """Senior Python Developer
+We need 5+ years of experience building backend services with Python, Django and SQL.
+Experience with Docker, AWS and Kubernetes is required. Bachelor's degree in Computer Science.
+"""
+
+
+def write_resumes(directory, resumes=RESUMES):
+    """Write resumes as .txt files; returns their paths in name order."""
+    paths = []
+    for name in sorted(resumes):
+        path = os.path.join(str(directory), f'{name}.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(resumes[name])
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def resume_paths(tmp_path):
+    directory = tmp_path / 'resumes'
+    directory.mkdir()
+    return write_resumes(directory)
+
+
+@pytest.fixture
+def matcher():
+    from resume_matcher import ResumeMatcher
+    matcher = ResumeMatcher()
+    yield matcher
+    matcher.close()
+
+
+@pytest.fixture
+def candidates(matcher, resume_paths):
+    return matcher.parse_resumes(resume_paths)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Flask test client with uploads, caches and lazy singletons under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    import app as webapp
+    uploads = tmp_path / 'uploads'
+    uploads.mkdir(exist_ok=True)
+    monkeypatch.setitem(webapp.app.config, 'UPLOAD_FOLDER', str(uploads))
+    monkeypatch.setattr(webapp, 'PARSE_CACHE_PATH', str(tmp_path / 'cache' / 'parse.sqlite'))
+    monkeypatch.setattr(webapp, 'JOB_PROFILE_DIR', str(tmp_path / 'cache' / 'job_profiles'))
+    for name in ('matcher', 'screening_jobs', 'upload_store', 'parse_pipeline', 'result_sessions'):
+        monkeypatch.setattr(webapp, name, None)
+    webapp.app.config['TESTING'] = True
+    yield webapp.app.test_client()
+    if webapp.screening_jobs is not None:
+        webapp.screening_jobs.shutdown()
+    if webapp.parse_pipeline is not None:
+        webapp.parse_pipeline.shutdown()
+    if webapp.matcher is not None:
+        webapp.matcher.close()
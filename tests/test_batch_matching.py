@@ -0,0 +1,21 @@
+"""Multi-job batch matching against one candidate pool."""
+
+from conftest import JOB_DESCRIPTION
+
+
+def ranking(matches):
+    return [(m['name'], m['match_score'], m['skills_match']) for m in matches]
+
+
+def test_rank_jobs_equals_ranking_each_job(matcher, candidates):
+    matcher.fit_corpus([c['raw_text'] for c in candidates])
+    frontend = 'Frontend developer with React, TypeScript and CSS experience.'
+    profiles = [matcher.compile_job(JOB_DESCRIPTION), matcher.compile_job(frontend)]
+
+    batch = matcher.rank_jobs(profiles, candidates, top_n=3, jobs_per_candidate=1)
+
+    for profile, job in zip(profiles, batch['jobs']):
+        assert ranking(job['matches']) == ranking(matcher.rank_candidates(profile, candidates, top_n=3))
+    best = {c['name']: c['best_jobs'][0]['job_index'] for c in batch['candidates']}
+    assert best['Alice Johnson'] == 0
+    assert best['Bob Smith'] == 1
@@ -0,0 +1,136 @@
+"""Bulk upload: streamed multipart parts, content-hash dedup, archive limits."""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+from bulk_upload import MAX_SKIPPED_LISTED, BulkIngestor, ContentStore
+
+BOUNDARY = 'test-boundary'
+
+
+def multipart(parts):
+    """Encode (filename, content) pairs as a multipart/form-data body."""
+    body = io.BytesIO()
+    for filename, content in parts:
+        body.write(
+            f'--{BOUNDARY}\r\n'
+            f'Content-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'.encode('latin-1')
+        )
+        body.write(content + b'\r\n')
+    body.write(f'--{BOUNDARY}--\r\n'.encode('latin-1'))
+    body.seek(0)
+    return body
+
+
+def zip_bytes(members, compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as zf:
+        for name, content in members:
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def folder(tmp_path):
+    return str(tmp_path / 'uploads')
+
+
+def ingestor(folder, stored=None, **limits):
+    return BulkIngestor(
+        ContentStore(folder),
+        {'pdf', 'docx', 'txt'},
+        max_file_size=limits.pop('max_file_size', 1000),
+        on_stored=stored.append if stored is not None else None,
+        **limits
+    )
+
+
+def test_identical_content_is_stored_once(folder):
+    stored = []
+    body = multipart([
+        ('alice.txt', b'Alice Johnson resume'),
+        ('alice-copy.txt', b'Alice Johnson resume'),
+        ('bob.txt', b'Bob Smith resume'),
+    ])
+
+    report = ingestor(folder, stored).ingest_multipart(body, BOUNDARY)
+
+    assert [f['duplicate'] for f in report['files']] == [False, True, False]
+    assert report['files'][0]['filename'] == report['files'][1]['filename']
+    assert len(stored) == 2
+    # Only the two distinct files are on disk; no temporary parts are left
+    assert sorted(os.listdir(folder)) == sorted(f['filename'] for f in report['files'][::2])
+
+    again = ingestor(folder, stored).ingest_multipart(multipart([('a.txt', b'Bob Smith resume')]), BOUNDARY)
+    assert again['files'][0]['duplicate'] and len(stored) == 2
+
+
+def test_unsupported_and_oversized_parts_are_skipped(folder):
+    body = multipart([('setup.exe', b'MZ'), ('big.txt', b'x' * 2000), ('ok.txt', b'fine')])
+
+    report = ingestor(folder).ingest_multipart(body, BOUNDARY)
+
+    assert [f['original_name'] for f in report['files']] == ['ok.txt']
+    assert [s['name'] for s in report['skipped']] == ['setup.exe', 'big.txt']
+    assert report['skipped_count'] == 2
+
+
+def test_archive_members_are_extracted(folder):
+    archive = zip_bytes([
+        ('resumes/a.txt', b'resume a'),
+        ('resumes/b.txt', b'resume b'),
+        ('__MACOSX/._a.txt', b'fork'),
+        ('notes.md', b'skip me'),
+    ])
+
+    report = ingestor(folder).ingest_multipart(multipart([('batch.zip', archive)]), BOUNDARY)
+
+    assert sorted(f['original_name'] for f in report['files']) == ['a.txt', 'b.txt']
+    assert [s['name'] for s in report['skipped']] == ['notes.md']
+
+
+def test_archive_extraction_is_capped(folder, tmp_path):
+    members = [(f'r{i}.txt', b'%d' % i + b'0' * 900) for i in range(50)]
+    path = str(tmp_path / 'bomb.zip')
+    with open(path, 'wb') as f:
+        f.write(zip_bytes(members + [('huge.txt', b'0' * 10 ** 6)]))
+
+    bulk = ingestor(folder, max_archive_bytes=2000)
+    bulk.ingest_archive(path, 'bomb.zip')
+    # Stops at the first member past the per-archive cap, skipping the rest
+    assert len(bulk.files) == 2
+    assert bulk.skipped_count == 1 and bulk.skipped[0]['name'] == 'bomb.zip'
+
+    bulk = ingestor(folder, max_extracted_bytes=3000)
+    bulk.ingest_archive(path, 'first.zip')
+    bulk.ingest_archive(path, 'second.zip')
+    assert bulk._extracted <= 3000
+    assert [s['name'] for s in bulk.skipped] == ['first.zip', 'second.zip']
+
+
+def test_oversized_member_is_skipped_before_extraction(folder, tmp_path):
+    path = str(tmp_path / 'big.zip')
+    with open(path, 'wb') as f:
+        f.write(zip_bytes([('big.txt', b'0' * 10 ** 6), ('ok.txt', b'fine')]))
+
+    bulk = ingestor(folder)
+    bulk.ingest_archive(path, 'big.zip')
+
+    assert [f['original_name'] for f in bulk.files] == ['ok.txt']
+    assert bulk._extracted == len(b'fine')
+
+
+def test_skipped_list_is_truncated(folder, tmp_path):
+    path = str(tmp_path / 'many.zip')
+    with open(path, 'wb') as f:
+        f.write(zip_bytes([(f'f{i}.exe', b'x') for i in range(MAX_SKIPPED_LISTED + 50)]))
+
+    bulk = ingestor(folder)
+    bulk.ingest_archive(path, 'many.zip')
+
+    assert len(bulk.skipped) == MAX_SKIPPED_LISTED
+    assert bulk.skipped_count == MAX_SKIPPED_LISTED + 50
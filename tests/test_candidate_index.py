@@ -0,0 +1,53 @@
+"""Inverted candidate index: postings, retrieval and persistence."""
+
+from conftest import JOB_DESCRIPTION
+from candidate_index import CandidateIndex
+
+
+def build_index(candidates):
+    index = CandidateIndex()
+    for i, candidate in enumerate(candidates):
+        index.add(i, candidate)
+    return index
+
+
+def test_postings_list_candidates_by_skill(candidates):
+    index = build_index(candidates)
+
+    # alice, dave and erin list Python; bob and carol do not
+    assert sorted(index.candidates_with_skill('Python')) == [0, 3, 4]
+    assert index.candidates_with_skill('cobol') == []
+
+
+def test_retrieve_ranks_by_overlap_and_respects_the_limit(matcher, candidates):
+    index = build_index(candidates)
+    job = matcher.compile_job(JOB_DESCRIPTION).job_data
+
+    retrieved = index.retrieve(job, limit=3)
+
+    assert len(retrieved) == 3
+    assert retrieved[0] == 0
+    assert set(retrieved) == {0, 3, 4}
+    assert index.retrieve({'raw_text': 'zzz', 'required_skills': ['cobol']}) == []
+
+
+def test_remove_and_remap(candidates):
+    index = build_index(candidates)
+
+    index.remove(0)
+    index.remove(0)
+    assert 0 not in index and len(index) == 4
+
+    index.remap({3: 0, 4: 1})
+    assert len(index) == 2
+    assert sorted(index.candidates_with_skill('python')) == [0, 1]
+
+
+def test_saved_index_retrieves_the_same_candidates(matcher, candidates, tmp_path):
+    index = build_index(candidates)
+    job = matcher.compile_job(JOB_DESCRIPTION).job_data
+    index.save(str(tmp_path / 'index'))
+
+    loaded = CandidateIndex.load(str(tmp_path / 'index'))
+
+    assert loaded.retrieve(job) == index.retrieve(job)
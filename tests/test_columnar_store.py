@@ -0,0 +1,56 @@
+"""Memory-mapped columnar candidate store."""
+
+import pytest
+
+from columnar_store import CandidateStore
+from conftest import JOB_DESCRIPTION, RESUMES
+
+
+def stored_record(candidate):
+    return {k: (str(v) if k == 'file_path' else v) for k, v in candidate.items()}
+
+
+@pytest.fixture
+def store(tmp_path, candidates):
+    store = CandidateStore(str(tmp_path / 'store'))
+    store.extend(candidates)
+    yield store
+    store.close()
+
+
+def test_records_round_trip(store, candidates, tmp_path):
+    reopened = CandidateStore(str(tmp_path / 'store'))
+    try:
+        assert len(reopened) == len(candidates)
+        for i, candidate in enumerate(candidates):
+            assert reopened[i].to_dict() == stored_record(candidate)
+        assert reopened[0]['skills'] == candidates[0]['skills']
+        assert reopened[0]['experience_years'] == candidates[0]['experience_years']
+    finally:
+        reopened.close()
+
+
+def test_match_store_equals_matching_parsed_candidates(matcher, store, candidates):
+    profile = matcher.compile_job(JOB_DESCRIPTION)
+
+    expected = matcher.rank_candidates(profile, candidates, top_n=5)
+    matched = matcher.match_store(profile, store, top_n=5, chunk_size=2)
+
+    assert [(m['file_path'], m['match_score']) for m in matched] == \
+        [(str(m['file_path']), m['match_score']) for m in expected]
+
+
+def test_delete_and_compact(matcher, store):
+    top = matcher.match_store(JOB_DESCRIPTION, store, top_n=1)[0]['file_path']
+    row = next(view.index for view in store if view['file_path'] == top)
+    remaining = [view['file_path'] for view in store if view.index != row]
+
+    store.delete(row)
+    assert top not in [m['file_path'] for m in matcher.match_store(JOB_DESCRIPTION, store, top_n=5)]
+
+    mapping = store.compact()
+    assert len(store) == len(mapping) == len(RESUMES) - 1
+    assert row not in mapping
+    # Survivors keep their order
+    assert [store[i]['file_path'] for i in range(len(store))] == remaining
+
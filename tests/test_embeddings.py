@@ -0,0 +1,181 @@
+"""Dense semantic scoring: encoders, the embedding index and its persistence."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+import main
+from conftest import JOB_DESCRIPTION, RESUMES
+from embeddings import EmbeddingIndex, EmbeddingScorer, LsaEncoder, create_encoder, text_key
+from resume_index import ResumeIndex
+from resume_matcher import ResumeMatcher
+from upload_pipeline import ParsePipeline
+
+
+class CountingEncoder:
+    """Wraps an encoder, recording every text it encodes."""
+
+    def __init__(self, encoder):
+        self.encoder = encoder
+        self.name = encoder.name
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return self.encoder.encode(texts)
+
+
+@pytest.fixture(scope='module')
+def lsa():
+    return LsaEncoder(dimensions=3).fit(list(RESUMES.values()))
+
+
+def unit_vectors(count, dimensions=8, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(count, dimensions))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_lsa_encoder_round_trips_through_create_encoder(lsa, tmp_path):
+    path = str(tmp_path / 'lsa.pkl')
+    lsa.save(path)
+
+    loaded = create_encoder(f'lsa:{path}')
+
+    assert loaded.name == lsa.name != 'lsa:unfitted'
+    assert np.allclose(loaded.encode([JOB_DESCRIPTION]), lsa.encode([JOB_DESCRIPTION]))
+    with pytest.raises(ValueError):
+        LsaEncoder().encode(['text'])
+
+
+@pytest.mark.parametrize('quantize', [False, True])
+def test_index_dot_products_and_persistence(quantize, tmp_path):
+    vectors = unit_vectors(5)
+    index = EmbeddingIndex(8, quantize=quantize)
+    index.add([f'k{i}' for i in range(5)], vectors)
+
+    exact = vectors @ vectors[0]
+    assert np.allclose(index.dot(vectors[0]), exact, atol=0.02 if quantize else 1e-6)
+
+    index.save(str(tmp_path / 'embeddings'))
+    loaded = EmbeddingIndex.load(str(tmp_path / 'embeddings'))
+    assert np.allclose(loaded.dot(vectors[0], loaded.rows(['k3', 'k1'])), index.dot(vectors[0])[[3, 1]])
+    # Writing to a loaded (memory-mapped) index copies it first
+    loaded.add(['k5'], unit_vectors(1, seed=1))
+    assert len(loaded) == 6 and len(EmbeddingIndex.load(str(tmp_path / 'embeddings'))) == 5
+
+
+def test_retain_keeps_the_order_of_the_rest():
+    vectors = unit_vectors(4)
+    index = EmbeddingIndex(8)
+    index.add(['a', 'b', 'c', 'd'], vectors)
+
+    index.retain(['d', 'b'])
+
+    assert index.keys == ['b', 'd']
+    assert np.allclose(index.dot(vectors[3]), vectors[[1, 3]] @ vectors[3])
+
+
+def test_texts_are_encoded_once(lsa):
+    encoder = CountingEncoder(lsa)
+    scorer = EmbeddingScorer(encoder)
+    texts = list(RESUMES.values())
+
+    assert scorer.precompute(texts + texts[:1]) == len(texts)
+    similarities = scorer.similarities(JOB_DESCRIPTION, texts)
+
+    assert encoder.encoded == texts + [JOB_DESCRIPTION]
+    expected = np.clip(lsa.encode(texts) @ lsa.encode([JOB_DESCRIPTION])[0], 0, 1)
+    assert np.allclose(similarities, expected, atol=1e-6)
+
+
+def test_bounded_scorer_evicts_the_oldest_unused_embeddings(lsa):
+    scorer = EmbeddingScorer(lsa, max_entries=3)
+    texts = [RESUMES[name] for name in sorted(RESUMES)]
+    scorer.precompute(texts[:3])
+
+    scorer.similarities(JOB_DESCRIPTION, [texts[0], texts[3]])
+
+    # texts[0] is needed by the call, so texts[1] (the oldest other) goes
+    assert scorer.index.keys == [text_key(texts[0]), text_key(texts[2]), text_key(texts[3])]
+
+
+def test_matcher_scores_with_embeddings(lsa, resume_paths):
+    matcher = ResumeMatcher(semantic_scorer=EmbeddingScorer(CountingEncoder(lsa)))
+    try:
+        candidates = matcher.parse_resumes(resume_paths)
+        # Embedded at parse time
+        assert len(matcher.semantic_scorer.index) == len(candidates)
+        encoded = len(matcher.semantic_scorer.encoder.encoded)
+
+        matches = matcher.rank_candidates(
+            matcher.compile_job(JOB_DESCRIPTION), candidates, top_n=5, weights={'semantic': 1.0}
+        )
+    finally:
+        matcher.close()
+
+    assert len(matches) == 5
+    # Only the job was encoded while matching
+    assert len(matcher.semantic_scorer.encoder.encoded) == encoded + 1
+
+
+def test_uploads_are_embedded_when_parsed(lsa, matcher, resume_paths):
+    scorer = EmbeddingScorer(lsa)
+    pipeline = ParsePipeline(
+        matcher.parser, on_parsed=lambda records: scorer.precompute(r['raw_text'] for r in records)
+    )
+    try:
+        pipeline.submit(resume_paths[0]).result()
+        pipeline.records(resume_paths[1:3])
+    finally:
+        pipeline.shutdown()
+
+    assert len(scorer.index) == 3
+
+
+def index_run(lsa, directory, paths):
+    """One CLI-like run: a fresh matcher and scorer over a persistent index."""
+    encoder = CountingEncoder(lsa)
+    matcher = ResumeMatcher(semantic_scorer=EmbeddingScorer(encoder))
+    index = ResumeIndex(directory, matcher)
+    index.update(paths)
+    matches = matcher.match_store(JOB_DESCRIPTION, index.store, top_n=5)
+    return encoder.encoded, matches, index
+
+
+def test_index_saves_embeddings_between_runs(lsa, resume_paths, tmp_path):
+    directory = str(tmp_path / 'index')
+    encoded, first, _ = index_run(lsa, directory, resume_paths)
+    assert len(encoded) == len(resume_paths) + 1
+
+    encoded, second, _ = index_run(lsa, directory, resume_paths)
+    assert encoded == [JOB_DESCRIPTION]
+    assert [m['match_score'] for m in second] == [m['match_score'] for m in first]
+
+    with open(resume_paths[0], 'a', encoding='utf-8') as f:
+        f.write('\nGraphQL\n')
+    encoded, _, index = index_run(lsa, directory, resume_paths[:-1])
+    assert len(encoded) == 2
+    # The changed and the deleted resume's old embeddings are dropped
+    assert len(index.matcher.semantic_scorer.index) == len(resume_paths) - 1
+
+
+def test_cli_fits_an_lsa_encoder_for_later_runs(resume_paths, tmp_path, monkeypatch, capsys):
+    resumes = os.path.dirname(resume_paths[0])
+    lsa_path = str(tmp_path / 'lsa.pkl')
+    index = str(tmp_path / 'index')
+
+    monkeypatch.setattr(sys, 'argv', [
+        'main.py', '--job', JOB_DESCRIPTION, '--resumes', resumes, '--index', index, '--fit-lsa', lsa_path
+    ])
+    main.main()
+    assert 'Saved LSA encoder fitted on 5 resume(s)' in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, 'argv', [
+        'main.py', '--job', JOB_DESCRIPTION, '--resumes', resumes, '--index', index,
+        '--semantic-encoder', f'lsa:{lsa_path}'
+    ])
+    main.main()
+    assert 'Alice Johnson' in capsys.readouterr().out
+    assert os.path.exists(os.path.join(index, 'embeddings', 'vectors.npy'))
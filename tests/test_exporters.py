@@ -0,0 +1,137 @@
+"""Streaming exports: column selection, formats, the CLI and the web endpoint."""
+
+import csv
+import io
+import json
+import os
+import sys
+
+import pytest
+
+import exporters
+import main
+from conftest import JOB_DESCRIPTION, RESUMES
+from exporters import COLUMNS, DEFAULT_COLUMNS, iter_csv, iter_export, parse_columns, write_export
+
+# One result as ResumeMatcher returns it, one as the web app formats it
+RESULTS = [
+    {'name': 'Alice Johnson', 'email': 'alice@example.com', 'match_score': 91.0, 'skills_match': 1.0,
+     'file_path': '/resumes/alice.txt',
+     'candidate_data': {'skills': ['python', 'django'], 'experience': 'x' * 500, 'raw_text': 'Alice'}},
+    {'rank': 2, 'name': 'Dave Lee', 'email': 'dave@example.com', 'match_score': 55.0, 'skills_match': 0.5,
+     'filename': 'dave.txt', 'skills': ['python', 'sql', 'aws'], 'experience': 'Data Engineer'},
+]
+
+
+def test_parse_columns():
+    assert parse_columns(None) == list(DEFAULT_COLUMNS)
+    assert parse_columns('all') == list(COLUMNS)
+    assert parse_columns(' rank, name ,') == ['rank', 'name']
+    with pytest.raises(ValueError, match='salary'):
+        parse_columns('name,salary')
+
+
+def test_heavy_fields_are_left_out_by_default():
+    rows = [json.loads(line) for line in iter_export(RESULTS, 'jsonl')]
+
+    assert [list(row) for row in rows] == [list(DEFAULT_COLUMNS)] * 2
+    assert rows[0]['skills'] == ['python', 'django']
+    assert rows[1]['file_path'] == ''
+
+
+def test_columns_are_looked_up_on_the_result_then_its_candidate_data():
+    rows = list(exporters.iter_rows(RESULTS, ['rank', 'filename', 'skills_count', 'experience_preview']))
+
+    assert rows[0] == {'rank': 1, 'filename': 'alice.txt', 'skills_count': 2, 'experience_preview': 'x' * 100}
+    assert rows[1] == {'rank': 2, 'filename': 'dave.txt', 'skills_count': 3,
+                       'experience_preview': 'Data Engineer'}
+
+
+def test_csv_is_streamed_a_row_at_a_time():
+    chunks = list(iter_csv(RESULTS, ['name', 'skills'], labels={'name': 'Name'}))
+
+    assert len(chunks) == 3
+    assert list(csv.reader(io.StringIO(''.join(chunks)))) == [
+        ['Name', 'skills'], ['Alice Johnson', 'python, django'], ['Dave Lee', 'python, sql, aws']
+    ]
+
+
+def test_json_array_is_valid_when_empty_or_not():
+    assert json.loads(''.join(iter_export([], 'json'))) == []
+    assert [row['name'] for row in json.loads(''.join(iter_export(RESULTS, 'json')))] == \
+        ['Alice Johnson', 'Dave Lee']
+    with pytest.raises(ValueError):
+        iter_export(RESULTS, 'parquet')
+
+
+def test_write_export_consumes_a_generator_once(tmp_path):
+    path = str(tmp_path / 'out.ndjson')
+
+    count = write_export((result for result in RESULTS), path, columns=['name'])
+
+    assert count == 2
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == '{"name": "Alice Johnson"}\n{"name": "Dave Lee"}\n'
+    assert exporters.format_for_path('out.CSV') == 'csv'
+    assert exporters.format_for_path('out.txt') == 'json'
+
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'out.parquet')
+
+    write_export(RESULTS, path, columns=['rank', 'name', 'skills'])
+
+    assert pq.read_table(path).to_pylist()[1] == {'rank': 2, 'name': 'Dave Lee', 'skills': ['python', 'sql', 'aws']}
+
+
+def test_cli_writes_the_selected_columns(resume_paths, tmp_path, monkeypatch, capsys):
+    output = str(tmp_path / 'matches.csv')
+    monkeypatch.setattr(sys, 'argv', [
+        'main.py', '--job', JOB_DESCRIPTION, '--resumes', os.path.dirname(resume_paths[0]),
+        '--top', '2', '--output', output, '--columns', 'rank,name,skills_count'
+    ])
+
+    main.main()
+
+    assert f'Saved 2 result(s) to {output} (csv)' in capsys.readouterr().out
+    with open(output, encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['rank', 'name', 'skills_count']
+    assert rows[1][:2] == ['1', 'Alice Johnson']
+
+
+def test_cli_rejects_unknown_columns(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--job', JOB_DESCRIPTION, '--resumes', '.', '--columns', 'salary'])
+
+    with pytest.raises(SystemExit):
+        main.main()
+    assert 'Unknown column(s): salary' in capsys.readouterr().err
+
+
+def match_uploads(client):
+    filenames = []
+    for name in sorted(RESUMES):
+        data = {'file': (io.BytesIO(RESUMES[name].encode('utf-8')), f'{name}.txt')}
+        filenames.append(client.post('/api/upload', data=data).get_json()['filename'])
+    response = client.post('/api/match', json={'job_description': JOB_DESCRIPTION, 'filenames': filenames})
+    return response.get_json()['result_session_id']
+
+
+def test_session_export_endpoint(client):
+    session_id = match_uploads(client)
+
+    response = client.get(f'/api/results/{session_id}/export')
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert response.mimetype == 'text/csv'
+    assert 'attachment' in response.headers['Content-Disposition']
+    assert rows[0][:3] == ['Rank', 'Name', 'Email'] and len(rows) == len(RESUMES) + 1
+
+    response = client.get(f'/api/results/{session_id}/export?format=jsonl&columns=rank,name&q=kubernetes')
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert response.mimetype == 'application/x-ndjson'
+    assert [row['name'] for row in rows] == ['Alice Johnson', 'Erin Walsh']
+
+    assert client.get('/api/results/unknown/export').status_code == 404
+    assert client.get(f'/api/results/{session_id}/export?format=parquet').status_code == 400
+    assert client.get(f'/api/results/{session_id}/export?columns=salary').status_code == 400
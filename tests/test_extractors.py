@@ -0,0 +1,104 @@
+"""Format sniffing, backend fallback and plain-text decoding."""
+
+import codecs
+import zipfile
+
+import pytest
+
+import extractors
+from extractors import ExtractionBackend, ExtractionError, TextStream, detect_format
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def read_text(path):
+    return ''.join(TextStream(path))
+
+
+def test_contents_win_over_the_extension(tmp_path):
+    assert detect_format(write(tmp_path / 'a.doc', b'{\\rtf1\\ansi Hello}')) == 'rtf'
+    assert detect_format(write(tmp_path / 'b.txt', b'junk\n%PDF-1.7\n')) == 'pdf'
+    assert detect_format(write(tmp_path / 'c.doc', extractors.OLE_MAGIC + b'\0' * 8)) == 'doc'
+    assert detect_format(write(tmp_path / 'd.txt', b'\xef\xbb\xbf<!DOCTYPE html><p>Hi')) == 'html'
+    docx = write_zip(tmp_path / 'e.doc', {'word/document.xml': '<w:document/>'})
+    assert detect_format(docx) == 'docx'
+    odt = write_zip(tmp_path / 'f.zip', {'mimetype': extractors.ODT_MIMETYPE})
+    assert detect_format(odt) == 'odt'
+
+
+def test_extension_is_the_fallback(tmp_path):
+    assert detect_format(write(tmp_path / 'plain.txt', b'Alice Johnson\n')) == 'txt'
+    with pytest.raises(ValueError):
+        detect_format(write(tmp_path / 'notes.md', b'# Alice\n'))
+
+
+def failing(file_path, max_pages=None):
+    raise ValueError('cannot open')
+    yield
+
+
+def reading(file_path, max_pages=None):
+    yield 'from the fallback\n'
+
+
+def test_next_backend_is_tried_when_one_cannot_open_the_file(tmp_path, monkeypatch):
+    monkeypatch.setitem(extractors.BACKENDS, 'txt', [
+        ExtractionBackend('broken', 'txt', failing),
+        ExtractionBackend('fallback', 'txt', reading),
+    ])
+    stream = TextStream(write(tmp_path / 'a.txt', b'ignored'))
+
+    assert ''.join(stream) == 'from the fallback\n'
+    assert stream.backend == 'fallback'
+
+
+def test_error_names_every_backend_that_failed(tmp_path, monkeypatch):
+    monkeypatch.setitem(extractors.BACKENDS, 'txt', [
+        ExtractionBackend('missing', 'txt', reading, modules=['no_such_module_here']),
+        ExtractionBackend('broken', 'txt', failing),
+    ])
+
+    with pytest.raises(ExtractionError) as error:
+        read_text(write(tmp_path / 'a.txt', b'ignored'))
+    assert 'missing is not installed' in str(error.value)
+    assert 'broken: cannot open' in str(error.value)
+
+
+def test_txt_is_read_as_utf8(tmp_path):
+    path = write(tmp_path / 'a.txt', 'José Núñez\nPython\n'.encode('utf-8'))
+
+    assert read_text(path) == 'José Núñez\nPython\n'
+
+
+def test_txt_falls_back_to_cp1252(tmp_path):
+    path = write(tmp_path / 'a.txt', 'José Núñez – “Python”\n'.encode('cp1252'))
+
+    assert read_text(path) == 'José Núñez – “Python”\n'
+
+
+def test_txt_with_a_bom(tmp_path):
+    utf16 = write(tmp_path / 'a.txt', codecs.BOM_UTF16_LE + 'Zoë\n'.encode('utf-16-le'))
+    utf8 = write(tmp_path / 'b.txt', codecs.BOM_UTF8 + 'Zoë\n'.encode('utf-8'))
+
+    assert read_text(utf16) == 'Zoë\n'
+    assert read_text(utf8) == 'Zoë\n'
+
+
+def test_txt_replaces_bytes_it_cannot_decode(tmp_path):
+    # UTF-8 at the top, a stray Latin-1 byte well past the sniffed head
+    data = 'Zoë\n'.encode('utf-8') + b'x' * extractors.BLOCK_SIZE + b'caf\xe9\n'
+    path = write(tmp_path / 'a.txt', data)
+
+    text = read_text(path)
+    assert text.startswith('Zoë\n')
+    assert text.endswith('caf�\n')
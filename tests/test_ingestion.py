@@ -0,0 +1,79 @@
+"""Parallel ingestion: ordered results and the per-file time limit."""
+
+import signal
+import time
+from concurrent.futures import Future
+
+import pytest
+
+import extractors
+import ingestion
+from ingestion import ParallelIngestor
+from parse_cache import ParseCache
+
+
+class InlineExecutor:
+    """Runs submitted chunks in this process."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture
+def slow_txt_backend(monkeypatch):
+    """Replace the TXT backend with one that stalls after its first chunk."""
+    def slow(file_path, max_pages=None):
+        yield 'Slow Candidate\nslow@example.com\n'
+        time.sleep(5)
+        yield 'never reached\n'
+
+    backend = extractors.ExtractionBackend('slow-text', 'txt', slow)
+    monkeypatch.setitem(extractors.BACKENDS, 'txt', [backend])
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """Run the worker initializer in this process, restoring SIGALRM afterwards."""
+    previous = signal.getsignal(signal.SIGALRM)
+    monkeypatch.setattr(ingestion, '_worker_parser', None)
+    monkeypatch.setattr(ingestion, '_worker_timeout', None)
+    yield ingestion._init_worker
+    signal.setitimer(signal.ITIMER_REAL, 0)
+    signal.signal(signal.SIGALRM, previous)
+
+
+def test_parallel_parse_keeps_input_order(resume_paths, tmp_path):
+    missing = str(tmp_path / 'missing.txt')
+    with ParallelIngestor(workers=2, chunk_size=2) as ingestor:
+        parsed = ingestor.parse(resume_paths[:3] + [missing] + resume_paths[3:])
+
+    names = [p['name'] if p else None for p in parsed]
+    assert names == ['Alice Johnson', 'Bob Smith', 'Carol Diaz', None, 'Dave Lee', 'Erin Walsh']
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGALRM'), reason='needs SIGALRM')
+def test_slow_file_times_out_instead_of_returning_partial_text(worker, slow_txt_backend, resume_paths):
+    worker({}, 0.5)
+
+    start = time.perf_counter()
+    [(ok, value)] = ingestion._parse_chunk([resume_paths[0]])
+
+    assert time.perf_counter() - start < 3
+    assert not ok
+    assert value == 'timed out after 0.5s'
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGALRM'), reason='needs SIGALRM')
+def test_timed_out_parse_is_not_cached(worker, slow_txt_backend, resume_paths, tmp_path, monkeypatch):
+    worker({}, 0.5)
+    cache = ParseCache(str(tmp_path / 'parse.sqlite'))
+    ingestor = ParallelIngestor(workers=1, cache=cache, version='test')
+    # Run the chunk in this process (where the slow backend is installed)
+    monkeypatch.setattr(ingestor, '_get_executor', InlineExecutor)
+    try:
+        assert ingestor.parse([resume_paths[0]]) == [None]
+        assert len(cache) == 0
+    finally:
+        cache.close()
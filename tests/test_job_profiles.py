@@ -0,0 +1,61 @@
+"""Compiled job profiles: IDs, caching and persistence."""
+
+from conftest import JOB_DESCRIPTION
+from job_profiles import JobProfileStore, profile_id_for
+from resume_matcher import ResumeMatcher
+
+
+def test_profile_id_ignores_case_whitespace_and_default_weights():
+    base = profile_id_for(JOB_DESCRIPTION, 'v1')
+
+    assert profile_id_for('  ' + JOB_DESCRIPTION.upper().replace(' ', '\n'), 'v1') == base
+    assert profile_id_for(JOB_DESCRIPTION, 'v1', {'skills': 0.4}) == base
+    assert profile_id_for(JOB_DESCRIPTION, 'v2') != base
+    assert profile_id_for(JOB_DESCRIPTION, 'v1', {'skills': 0.9}) != base
+
+
+def test_compiled_job_is_analyzed_once(matcher, monkeypatch):
+    profile = matcher.compile_job(JOB_DESCRIPTION)
+
+    def no_analysis(text):
+        raise AssertionError('job analyzed again')
+
+    monkeypatch.setattr(matcher.job_analyzer, 'analyze_job', no_analysis)
+    assert matcher.compile_job(' '.join(JOB_DESCRIPTION.split())) is profile
+    assert matcher.get_job_profile(profile.id) is profile
+    assert {'python', 'django', 'docker'} <= set(profile.summary()['required_skills'])
+
+
+def test_weighted_profiles_are_cached_separately(matcher):
+    plain = matcher.compile_job(JOB_DESCRIPTION)
+    weighted = matcher.compile_job(JOB_DESCRIPTION, weights={'skills': 0.9})
+
+    assert weighted.id != plain.id
+    assert matcher.compile_job(JOB_DESCRIPTION) is plain
+    assert plain.weights == {}
+    assert weighted.summary()['weights']['skills'] == 0.9
+
+
+def test_profiles_persist_with_their_vector(candidates, tmp_path):
+    directory = str(tmp_path / 'profiles')
+    first = ResumeMatcher(job_profiles=JobProfileStore(directory))
+    first.fit_corpus([c['raw_text'] for c in candidates])
+    profile = first.compile_job(JOB_DESCRIPTION)
+
+    loaded = JobProfileStore(directory).get(profile.id)
+
+    assert loaded.requirements == profile.requirements
+    vector = loaded.vector_for(first.vectorizer_id)
+    assert (vector != profile.vector_for(first.vectorizer_id)).nnz == 0
+    assert loaded.vector_for('another-vectorizer') is None
+
+
+def test_store_keeps_a_bounded_lru(matcher):
+    store = JobProfileStore(memory_entries=2)
+    profiles = [matcher.compile_job(f'Job {i}: Python developer') for i in range(3)]
+    for profile in profiles:
+        store.put(profile)
+
+    assert len(store) == 2
+    assert store.get(profiles[0].id) is None
+    assert store.get('../../etc/passwd') is None
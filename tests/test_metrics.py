@@ -0,0 +1,64 @@
+"""Stage timers, counters and the Prometheus metrics endpoint."""
+
+import pytest
+
+import metrics
+from metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = MetricsRegistry()
+    monkeypatch.setattr(metrics, 'REGISTRY', registry)
+    return registry
+
+
+def test_counters_and_histograms_render_as_prometheus(registry):
+    metrics.inc('resume_matcher_parsed_total', format='pdf')
+    metrics.inc('resume_matcher_parsed_total', 2, format='pdf')
+    metrics.record_stage('nlp', 0.02)
+    metrics.record_stage('nlp', 3.0)
+
+    text = registry.render_prometheus()
+
+    assert registry.counter_value('resume_matcher_parsed_total', format='pdf') == 3
+    assert '# TYPE resume_matcher_parsed_total counter' in text
+    assert 'resume_matcher_parsed_total{format="pdf"} 3' in text
+    # Buckets are cumulative
+    assert 'resume_matcher_stage_seconds_bucket{stage="nlp",le="0.025"} 1' in text
+    assert 'resume_matcher_stage_seconds_bucket{stage="nlp",le="5.0"} 2' in text
+    assert 'resume_matcher_stage_seconds_bucket{stage="nlp",le="+Inf"} 2' in text
+    assert 'resume_matcher_stage_seconds_count{stage="nlp"} 2' in text
+
+
+def test_label_values_are_escaped(registry):
+    metrics.inc('errors_total', path='a "quoted"\\path\n')
+
+    assert 'errors_total{path="a \\"quoted\\"\\\\path\\n"} 1' in registry.render_prometheus()
+
+
+def test_request_timings_sum_each_stage(registry):
+    metrics.start_request_timing()
+    with metrics.timed('rank'):
+        pass
+    metrics.record_stage('rank', 0.5)
+    metrics.record_stage('serialize', 0.25)
+    timings = metrics.finish_request_timing()
+
+    assert set(timings) == {'rank', 'serialize'}
+    assert 0.5 <= timings['rank'] < 0.6
+    assert metrics.server_timing_header({'serialize': 0.25}) == 'serialize;dur=250.0'
+    # Outside a request only the registry records stages
+    metrics.record_stage('rank', 1.0)
+    assert metrics.finish_request_timing() == {}
+
+
+def test_metrics_endpoint_and_server_timing(client, registry):
+    assert 'Server-Timing' not in client.get('/api/health').headers
+    client.get('/api/health?timing=1')
+
+    response = client.get('/api/metrics')
+
+    assert response.mimetype == 'text/plain'
+    assert 'resume_matcher_http_request_seconds_count{endpoint="health",method="GET",status="200"} 2' \
+        in response.get_data(as_text=True)
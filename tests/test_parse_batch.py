@@ -0,0 +1,84 @@
+"""Batch parsing: one pass per document through nlp.pipe, in input order."""
+
+import pickle
+import time
+
+import pytest
+
+import metrics
+
+
+class FakeDoc:
+    """A doc without tokens or noun chunks, so only the taxonomy finds skills."""
+
+    noun_chunks = ()
+
+    def __init__(self, text):
+        self.text = text
+
+    def __iter__(self):
+        return iter(())
+
+
+class FakeNLP:
+    """Processes batch_size texts per batch, like nlp.pipe, taking 10ms per batch."""
+
+    def __init__(self):
+        self.contexts = []
+
+    def __call__(self, text):
+        return FakeDoc(text)
+
+    def pipe(self, texts, as_tuples, batch_size, n_process):
+        texts = list(texts)
+        for start in range(0, len(texts), batch_size):
+            time.sleep(0.01)
+            for text, context in texts[start:start + batch_size]:
+                self.contexts.append(context)
+                yield FakeDoc(text), context
+
+
+@pytest.fixture
+def fake_nlp(matcher, monkeypatch):
+    nlp = FakeNLP()
+    monkeypatch.setattr(matcher.parser, 'nlp', nlp)
+    return nlp
+
+
+def stage_count(stage):
+    for line in metrics.REGISTRY.render_prometheus().splitlines():
+        if line.startswith(f'{metrics.STAGE_SECONDS}_count{{stage="{stage}"}}'):
+            return int(line.rsplit(' ', 1)[1])
+    return 0
+
+
+def test_parse_resumes_keeps_input_order_and_skips_failures(matcher, resume_paths, tmp_path):
+    missing = str(tmp_path / 'missing.txt')
+    parsed = matcher.parser.parse_resumes([resume_paths[1], missing, resume_paths[0]])
+
+    assert [p['name'] if p else None for p in parsed] == ['Bob Smith', None, 'Alice Johnson']
+
+
+def test_batch_parse_matches_single_parse(matcher, resume_paths, fake_nlp):
+    batch = matcher.parser.parse_resumes(resume_paths)
+
+    assert batch == [matcher.parser.parse_resume(path) for path in resume_paths]
+
+
+def test_pipe_contexts_can_be_pickled(matcher, resume_paths, fake_nlp):
+    # nlp.pipe pickles contexts to send them to worker processes
+    matcher.parser.n_process = 2
+    matcher.parser.parse_resumes(resume_paths)
+
+    assert fake_nlp.contexts
+    assert pickle.loads(pickle.dumps(fake_nlp.contexts)) == fake_nlp.contexts
+
+
+def test_nlp_time_is_recorded_once_per_batch(matcher, resume_paths, fake_nlp):
+    matcher.parser.batch_size = 2
+    before = stage_count('nlp')
+
+    matcher.parser.parse_resumes(resume_paths)
+
+    # Five documents in batches of two
+    assert stage_count('nlp') - before == 3
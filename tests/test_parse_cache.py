@@ -0,0 +1,93 @@
+"""Content-addressed parse cache: reuse by content, invalidation on change."""
+
+import shutil
+
+import pytest
+
+from parse_cache import ParseCache
+from resume_matcher import ResumeParser
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ParseCache(str(tmp_path / 'cache' / 'parse.sqlite'))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def counting_parser(cache, monkeypatch):
+    """A cached parser that counts how often it actually extracts text."""
+    parser = ResumeParser(cache=cache)
+    calls = []
+    extract = parser._extract
+
+    def counted(file_path, *args, **kwargs):
+        calls.append(file_path)
+        return extract(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(parser, '_extract', counted)
+    parser.calls = calls
+    return parser
+
+
+def test_same_content_is_parsed_once(counting_parser, resume_paths, tmp_path):
+    copy = str(tmp_path / 'renamed.txt')
+    shutil.copy(resume_paths[0], copy)
+
+    first = counting_parser.parse_resume(resume_paths[0])
+    second = counting_parser.parse_resume(copy)
+
+    assert counting_parser.calls == [resume_paths[0]]
+    # The cached record is returned under the path it was requested with
+    assert second['file_path'] == copy
+    assert {k: v for k, v in second.items() if k != 'file_path'} == \
+        {k: v for k, v in first.items() if k != 'file_path'}
+
+
+def test_changed_content_is_reparsed(counting_parser, resume_paths):
+    path = resume_paths[0]
+    assert counting_parser.parse_resume(path)['name'] == 'Alice Johnson'
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('Zoe Quinn\nzoe@example.com\n\nSKILLS\nJava\n')
+
+    assert counting_parser.parse_resume(path)['name'] == 'Zoe Quinn'
+    assert counting_parser.calls == [path, path]
+
+
+def test_parser_version_is_part_of_the_key(cache, resume_paths):
+    path = resume_paths[0]
+    full = ResumeParser(cache=cache)
+    limited = ResumeParser(cache=cache, max_chars=40)
+
+    assert full.version != limited.version
+    assert cache.key_for_file(path, full.version) != cache.key_for_file(path, limited.version)
+    full.parse_resume(path)
+    assert cache.get(cache.key_for_file(path, limited.version)) is None
+
+
+def test_records_survive_reopening(cache, resume_paths):
+    parser = ResumeParser(cache=cache)
+    record = parser.parse_resume(resume_paths[0])
+    key = cache.key_for_file(resume_paths[0], parser.version)
+
+    reopened = ParseCache(cache.path)
+    try:
+        stored = reopened.get(key)
+    finally:
+        reopened.close()
+    assert 'file_path' not in stored
+    assert stored['skills'] == record['skills']
+
+
+def test_eviction_keeps_the_entry_bound(tmp_path):
+    cache = ParseCache(str(tmp_path / 'small.sqlite'), max_entries=3, memory_entries=1)
+    try:
+        for i in range(5):
+            cache.put(f'key-{i}', {'name': f'Candidate {i}'})
+        assert len(cache) == 3
+        assert cache.get('key-0') is None
+        assert cache.get('key-4') == {'name': 'Candidate 4'}
+    finally:
+        cache.close()
@@ -0,0 +1,93 @@
+"""Server-side result sessions: paging, filtering, statistics and expiry."""
+
+import io
+
+import pytest
+
+from conftest import JOB_DESCRIPTION, RESUMES
+from result_sessions import MAX_PAGE_SIZE, ResultSession, ResultSessionStore
+
+RESULTS = [
+    {'name': 'Alice Johnson', 'email': 'alice@example.com', 'match_score': 91.0,
+     'skills_match': 100.0, 'skills': ['python', 'django', 'aws']},
+    {'name': 'erin walsh', 'email': 'erin@example.com', 'match_score': 72.5,
+     'skills_match': 60.0, 'skills': ['python', 'kubernetes']},
+    {'name': 'Dave Lee', 'email': 'dave@example.com', 'match_score': 55.0,
+     'skills_match': 80.0, 'skills': ['python', 'sql', 'aws', 'linux']},
+    {'name': 'Bob Smith', 'email': 'bob@example.com', 'match_score': 12.0,
+     'skills_match': 0.0, 'skills': []},
+]
+
+
+def names(results):
+    return [r['name'] for r in results]
+
+
+def test_pages_cover_the_ranking_in_order():
+    session = ResultSession(RESULTS)
+
+    first = session.page(page=1, page_size=3)
+    last = session.page(page=9, page_size=3)
+
+    assert names(first['results']) == names(RESULTS[:3])
+    assert (first['pages'], first['total']) == (2, 4)
+    # Out-of-range pages are clamped
+    assert last['page'] == 2 and names(last['results']) == ['Bob Smith']
+    assert [r['rank'] for r in session.results] == [1, 2, 3, 4]
+    assert session.page(page_size=10 ** 6)['page_size'] == MAX_PAGE_SIZE
+
+
+def test_search_filter_and_sort():
+    session = ResultSession(RESULTS)
+
+    assert names(session.query(search='AWS')) == ['Alice Johnson', 'Dave Lee']
+    assert names(session.query(search='erin@')) == ['erin walsh']
+    assert names(session.query(min_score=50, sort='name')) == ['Alice Johnson', 'Dave Lee', 'erin walsh']
+    assert names(session.query(sort='skills')) == ['Dave Lee', 'Alice Johnson', 'erin walsh', 'Bob Smith']
+    assert names(session.query(sort='score', descending=False))[0] == 'Bob Smith'
+    with pytest.raises(ValueError):
+        session.query(sort='salary')
+
+
+def test_stats_describe_all_results():
+    stats = ResultSession(RESULTS).stats()
+
+    assert stats['total'] == 4
+    assert stats['average_score'] == 57.62
+    assert (stats['top_score'], stats['lowest_score']) == (91.0, 12.0)
+    assert stats['distribution'] == {'excellent': 1, 'good': 1, 'fair': 1, 'poor': 1}
+    assert stats['top_skills'][0] == ('python', 3)
+
+
+def test_sessions_expire_and_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('result_sessions.time.time', lambda: now[0])
+    store = ResultSessionStore(ttl=60, max_sessions=2)
+    old, kept = store.create(RESULTS), store.create(RESULTS)
+
+    now[0] += 30
+    assert store.get(old.id) is old
+    store.create(RESULTS)
+    # The least recently used session made room
+    assert store.get(kept.id) is None and len(store) == 2
+
+    now[0] += 61
+    assert store.get(old.id) is None and len(store) == 0
+
+
+def test_match_returns_the_first_page_and_later_pages_are_fetched(client):
+    filenames = []
+    for name in sorted(RESUMES):
+        data = {'file': (io.BytesIO(RESUMES[name].encode('utf-8')), f'{name}.txt')}
+        filenames.append(client.post('/api/upload', data=data).get_json()['filename'])
+
+    first = client.post('/api/match', json={
+        'job_description': JOB_DESCRIPTION, 'filenames': filenames, 'page_size': 2
+    }).get_json()
+    second = client.get(f"/api/results/{first['result_session_id']}?page=2&page_size=2").get_json()
+
+    assert first['total_matched'] == len(RESUMES) and len(first['results']) == 2
+    assert first['results'][0]['name'] == 'Alice Johnson'
+    assert [r['rank'] for r in second['results']] == [3, 4]
+    assert client.get('/api/results/unknown').status_code == 404
+    assert client.get(f"/api/results/{first['result_session_id']}?sort=salary").status_code == 400
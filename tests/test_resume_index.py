@@ -0,0 +1,26 @@
+"""Incremental re-indexing of a resume directory."""
+
+import os
+
+from conftest import JOB_DESCRIPTION
+from resume_index import ResumeIndex
+
+
+def test_resume_index_reparses_only_changes(matcher, resume_paths, tmp_path):
+    index = ResumeIndex(str(tmp_path / 'index'), matcher)
+    stats = index.update(resume_paths)
+    assert stats['added'] == len(resume_paths)
+
+    with open(resume_paths[0], 'a', encoding='utf-8') as f:
+        f.write('\nGraphQL\n')
+    os.remove(resume_paths[1])
+    stats = index.update(resume_paths[:1] + resume_paths[2:])
+    assert (stats['changed'], stats['removed'], stats['unchanged']) == (1, 1, len(resume_paths) - 2)
+    assert len(index) == len(index.candidates) == len(resume_paths) - 1
+
+    reopened = ResumeIndex(str(tmp_path / 'index'), matcher)
+    assert reopened.update(resume_paths[:1] + resume_paths[2:])['unchanged'] == len(resume_paths) - 1
+    matches = matcher.match_store(
+        JOB_DESCRIPTION, reopened.store, top_n=2, candidates=reopened.candidates, candidate_limit=3
+    )
+    assert matches[0]['name'] == 'Alice Johnson'
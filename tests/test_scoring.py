@@ -0,0 +1,38 @@
+"""Vectorized scoring over a candidate matrix vs the per-candidate helpers."""
+
+import pytest
+
+from conftest import JOB_DESCRIPTION
+from scoring import CandidateMatrix
+
+
+def ranking(matches):
+    return [(m['name'], m['match_score'], m['skills_match']) for m in matches]
+
+
+def test_candidate_matrix_matches_scalar_helpers(matcher, candidates):
+    job = matcher.compile_job(JOB_DESCRIPTION).job_data
+    matrix = CandidateMatrix(candidates)
+
+    skills = matrix.skills_match(job['required_skills'])
+    keywords = matrix.keyword_jaccard(job['keywords'])
+    for i, candidate in enumerate(candidates):
+        assert skills[i] == pytest.approx(
+            matcher._calculate_skills_match(job['required_skills'], candidate['skills'])
+        )
+        assert keywords[i] == pytest.approx(
+            matcher._simple_keyword_match(job['keywords'], candidate['keywords'])
+        )
+
+
+def test_vectorized_scoring_equals_per_candidate_scoring(matcher, candidates):
+    # With a corpus-fitted vectorizer both paths see the same IDF weights
+    matcher.fit_corpus([c['raw_text'] for c in candidates])
+    profile = matcher.compile_job(JOB_DESCRIPTION)
+
+    for weights in (None, {'semantic': 0.0, 'keywords': 0.2}, {'education': 0.5}):
+        batch = matcher.rank_candidates(profile, candidates, top_n=10, weights=weights)
+        legacy = matcher.rank_candidates(
+            profile, candidates, top_n=10, batch_scoring=False, weights=weights
+        )
+        assert ranking(batch) == ranking(legacy)
@@ -0,0 +1,85 @@
+"""Background screening jobs: progress, provisional and final results."""
+
+import time
+
+import pytest
+
+from conftest import JOB_DESCRIPTION
+from screening_jobs import DONE, FAILED, ScreeningJobManager
+
+
+@pytest.fixture
+def manager(matcher):
+    manager = ScreeningJobManager(lambda: matcher, chunk_size=2, synchronous=True)
+    yield manager
+    manager.shutdown()
+
+
+def names(results):
+    return [m['name'] for m in results]
+
+
+def test_job_results_equal_a_direct_ranking(matcher, manager, resume_paths, candidates):
+    job = manager.submit(JOB_DESCRIPTION, resume_paths, top_n=3)
+
+    snapshot = job.snapshot(include_results=True)
+    assert snapshot['status'] == DONE
+    assert snapshot['progress'] == {'processed': 5, 'total': 5, 'percent': 100.0}
+    direct = matcher.rank_candidates(matcher.compile_job(JOB_DESCRIPTION), candidates, top_n=3)
+    assert names(snapshot['results']) == names(direct)
+    assert snapshot['total_matched'] == 3
+    # Inputs are released once the job has finished
+    assert job.resume_paths == [] and job.job_description is None
+
+
+def test_progress_is_reported_per_chunk(matcher, resume_paths):
+    seen = []
+    manager = ScreeningJobManager(lambda: matcher, chunk_size=2, synchronous=True)
+
+    def load(paths):
+        job = next(iter(manager._jobs.values()))
+        seen.append((job.processed, len(job.partial_results)))
+        return matcher.parse_resumes(paths)
+
+    manager.load_candidates = load
+    manager.submit(JOB_DESCRIPTION, resume_paths, top_n=2)
+    manager.shutdown()
+
+    # Three chunks of at most two resumes; provisional results capped at top_n
+    assert seen == [(0, 0), (2, 2), (4, 2)]
+
+
+def test_failed_job_reports_its_error(manager, resume_paths):
+    def broken(paths):
+        raise RuntimeError('disk on fire')
+
+    manager.load_candidates = broken
+    job = manager.submit(JOB_DESCRIPTION, resume_paths)
+
+    snapshot = job.snapshot()
+    assert snapshot['status'] == FAILED
+    assert snapshot['error'] == 'disk on fire'
+
+
+def test_background_job_can_be_polled(matcher, resume_paths):
+    manager = ScreeningJobManager(lambda: matcher, workers=1)
+    try:
+        job = manager.submit(JOB_DESCRIPTION, resume_paths, top_n=2)
+        deadline = time.time() + 30
+        while not manager.get(job.id).finished and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        manager.shutdown()
+
+    assert manager.get(job.id).status == DONE
+    assert names(job.results)[0] == 'Alice Johnson'
+
+
+def test_oldest_finished_jobs_are_forgotten(matcher, resume_paths):
+    manager = ScreeningJobManager(lambda: matcher, max_jobs=2, synchronous=True)
+    jobs = [manager.submit(JOB_DESCRIPTION, resume_paths[:1]) for _ in range(4)]
+    manager.shutdown()
+
+    assert len(manager._jobs) == 2
+    assert manager.get(jobs[0].id) is None
+    assert manager.get(jobs[-1].id) is jobs[-1]
@@ -0,0 +1,34 @@
+"""Section segmentation and field extraction with precompiled patterns."""
+
+from conftest import RESUMES
+from resume_matcher import ResumeSections
+
+
+def test_sections_locate_headers_in_one_pass():
+    sections = ResumeSections(RESUMES['alice'])
+
+    assert set(sections.headers) == {'experience', 'education', 'skills'}
+    experience = sections.section('experience', 10)
+    assert experience[0] == 'EXPERIENCE'
+    assert 'Senior Software Engineer, Acme Corp (2016 - 2023)' in experience
+    # A section ends at the next header
+    assert 'EDUCATION' not in experience
+    assert sections.section('certifications', 10) is None
+
+
+def test_contact_text_is_the_block_before_the_first_section():
+    contact = ResumeSections(RESUMES['alice']).contact_text()
+
+    assert contact.startswith('Alice Johnson\nalice.johnson@example.com')
+    assert 'Acme Corp' not in contact
+
+
+def test_parse_resume_extracts_contact_and_features(matcher, resume_paths):
+    alice = matcher.parser.parse_resume(resume_paths[0])
+
+    assert alice['name'] == 'Alice Johnson'
+    assert alice['email'] == 'alice.johnson@example.com'
+    assert alice['phone'] == '(555) 123-4567'
+    assert {'python', 'django', 'docker', 'aws', 'kubernetes'} <= set(alice['skills'])
+    assert alice['experience_years'] == 7.0
+    assert alice['education_level'] == 3
@@ -0,0 +1,36 @@
+"""Skill taxonomy: whole-word, alias-aware matching in one pass."""
+
+from skill_taxonomy import SkillTaxonomy, default_taxonomy
+
+
+def test_taxonomy_matches_whole_skills_only():
+    taxonomy = SkillTaxonomy({
+        'java': [],
+        'javascript': ['ecmascript'],
+        'git': [],
+        'c++': [],
+        'node.js': ['nodejs'],
+        'machine learning': []
+    })
+
+    found = taxonomy.find('Digital JavaScript, ECMAScript, C++ with NodeJS and Machine   Learning; java.')
+
+    # "git" is not found inside "digital", nor "java" inside "javascript"
+    assert found == ['javascript', 'c++', 'node.js', 'machine learning', 'java']
+    assert taxonomy.find('javascripting in c++11') == []
+    assert taxonomy.normalize('NodeJS') == 'node.js'
+
+
+def test_bare_node_is_not_node_js():
+    taxonomy = default_taxonomy()
+
+    assert taxonomy.find('Balanced binary trees: insert a node, then rotate') == []
+    assert taxonomy.find('Node.js and nodejs services') == ['node.js']
+
+
+def test_taxonomy_fingerprint_tracks_contents():
+    base = SkillTaxonomy({'python': ['python3']})
+
+    assert base.fingerprint == SkillTaxonomy({'python': ['python3']}).fingerprint
+    assert base.fingerprint != SkillTaxonomy({'python': []}).fingerprint
+    assert 'Python3' in default_taxonomy()
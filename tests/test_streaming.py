@@ -0,0 +1,38 @@
+"""Heap-based top-N selection and streaming scoring."""
+
+import numpy as np
+
+from conftest import JOB_DESCRIPTION, RESUMES, write_resumes
+from scoring import top_indices
+
+
+def ranking(matches):
+    return [(m['name'], m['match_score'], m['skills_match']) for m in matches]
+
+
+def test_top_indices_keeps_ties_in_input_order():
+    scores = np.array([50.0, 80.0, 80.0, 10.0, 80.0])
+
+    assert list(top_indices(scores, 2, 0)) == [1, 2]
+    assert list(top_indices(scores, 10, 40)) == [1, 2, 4, 0]
+    assert list(top_indices(scores, 0, 0)) == []
+
+
+def test_streaming_keeps_only_the_top_n(matcher, candidates, resume_paths):
+    matcher.fit_corpus([c['raw_text'] for c in candidates])
+    full = matcher.match_candidates(JOB_DESCRIPTION, resume_paths, top_n=10)
+
+    for top_n in (1, 2, 5):
+        streamed = matcher.match_candidates(
+            JOB_DESCRIPTION, iter(resume_paths), top_n=top_n, streaming=True, chunk_size=2
+        )
+        assert ranking(streamed) == ranking(full[:top_n])
+    assert matcher.match_streaming(JOB_DESCRIPTION, resume_paths, top_n=0) == []
+
+
+def test_streaming_ties_favour_earlier_resumes(matcher, tmp_path):
+    paths = write_resumes(tmp_path, {'a': RESUMES['dave'], 'b': RESUMES['dave'], 'c': RESUMES['dave']})
+
+    streamed = matcher.match_streaming(JOB_DESCRIPTION, paths, top_n=2, chunk_size=1)
+
+    assert [m['file_path'] for m in streamed] == paths[:2]
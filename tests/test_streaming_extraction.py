@@ -0,0 +1,31 @@
+"""Streaming extraction: reading stops as soon as the budget is met."""
+
+import extractors
+from extractors import ExtractionBackend
+
+
+def test_parse_contact_reads_only_the_header(matcher, resume_paths):
+    contact = matcher.parser.parse_contact(resume_paths[1])
+
+    assert contact['name'] == 'Bob Smith'
+    assert contact['email'] == 'bob.smith@example.com'
+    assert contact['phone'] == '555-987-6543'
+
+
+def test_extraction_stops_at_the_character_budget(matcher, tmp_path, monkeypatch):
+    pages = []
+
+    def paged(file_path, max_pages=None):
+        for i in range(100):
+            pages.append(i)
+            yield f'page {i}\n'
+
+    monkeypatch.setitem(extractors.BACKENDS, 'txt', [ExtractionBackend('paged', 'txt', paged)])
+    path = tmp_path / 'long.txt'
+    path.write_text('ignored')
+
+    text = matcher.parser.extract_text(str(path), max_chars=20)
+
+    assert text == 'page 0\npage 1\npage 2'
+    # Only the pages needed were generated
+    assert pages == [0, 1, 2]
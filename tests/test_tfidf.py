@@ -0,0 +1,65 @@
+"""Corpus-level TF-IDF: one fit shared by every candidate and job."""
+
+import json
+import os
+import sys
+
+import main
+from conftest import JOB_DESCRIPTION
+from resume_matcher import ResumeMatcher
+
+
+def ranking(matches):
+    return [(m['name'], m['match_score'], m['skills_match']) for m in matches]
+
+
+def test_ranking_on_fixture_corpus(matcher, candidates):
+    profile = matcher.compile_job(JOB_DESCRIPTION)
+    names = [m['name'] for m in matcher.rank_candidates(profile, candidates, top_n=5)]
+
+    assert names[0] == 'Alice Johnson'
+    assert set(names[:3]) == {'Alice Johnson', 'Dave Lee', 'Erin Walsh'}
+    assert set(names[3:]) == {'Bob Smith', 'Carol Diaz'}
+
+
+def test_fit_corpus_is_reused_without_refitting(matcher, candidates, resume_paths, monkeypatch):
+    matcher.fit_corpus([c['raw_text'] for c in candidates])
+    expected = matcher.match_candidates(JOB_DESCRIPTION, resume_paths, top_n=5)
+
+    def no_refit():
+        raise AssertionError('vectorizer refitted')
+
+    monkeypatch.setattr(matcher, '_build_vectorizer', no_refit)
+    assert ranking(matcher.match_candidates(JOB_DESCRIPTION, resume_paths, top_n=5)) == ranking(expected)
+    assert matcher.compile_job(JOB_DESCRIPTION).vector_for(matcher.vectorizer_id) is not None
+
+
+def test_saved_vectorizer_gives_the_same_scores(matcher, candidates, tmp_path):
+    matcher.fit_corpus([c['raw_text'] for c in candidates])
+    path = str(tmp_path / 'vectorizer.pkl')
+    matcher.save_vectorizer(path)
+    loaded = ResumeMatcher()
+    loaded.load_vectorizer(path)
+
+    assert loaded.vectorizer_id == matcher.vectorizer_id
+    assert ranking(loaded.rank_candidates(loaded.compile_job(JOB_DESCRIPTION), candidates)) == \
+        ranking(matcher.rank_candidates(matcher.compile_job(JOB_DESCRIPTION), candidates))
+
+
+def test_cli_fits_then_reuses_a_saved_vectorizer(resume_paths, tmp_path, monkeypatch, capsys):
+    vectorizer = str(tmp_path / 'vectorizer.pkl')
+    resumes = os.path.dirname(resume_paths[0])
+    outputs = []
+    for option in ('--fit-vectorizer', '--vectorizer'):
+        output = str(tmp_path / f'{len(outputs)}.json')
+        monkeypatch.setattr(sys, 'argv', [
+            'main.py', '--job', JOB_DESCRIPTION, '--resumes', resumes,
+            option, vectorizer, '--output', output
+        ])
+        main.main()
+        with open(output, encoding='utf-8') as f:
+            outputs.append(json.load(f))
+
+    assert 'Saved TF-IDF vectorizer fitted on 5 resume(s)' in capsys.readouterr().out
+    assert outputs[0] == outputs[1]
+    assert outputs[0][0]['name'] == 'Alice Johnson'
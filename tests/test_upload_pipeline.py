@@ -0,0 +1,115 @@
+"""Parse-on-upload: records persisted beside uploads, failures never reparsed."""
+
+import io
+import os
+
+import pytest
+
+from conftest import JOB_DESCRIPTION, RESUMES
+from upload_pipeline import ParsePipeline, record_path
+
+
+class CountingParser:
+    """Wraps a ResumeParser, counting parses and failing on request."""
+
+    def __init__(self, parser, failing=()):
+        self.parser = parser
+        self.failing = set(failing)
+        self.parsed = []
+
+    @property
+    def version(self):
+        return self.parser.version
+
+    def parse_resume(self, file_path):
+        self.parsed.append(file_path)
+        if file_path in self.failing:
+            raise ValueError('unreadable')
+        return self.parser.parse_resume(file_path)
+
+    def parse_resumes(self, file_paths):
+        self.parsed.extend(file_paths)
+        return [
+            None if path in self.failing else self.parser.parse_resume(path)
+            for path in file_paths
+        ]
+
+
+@pytest.fixture
+def make_pipeline(matcher):
+    pipelines = []
+
+    def make(failing=(), background=True):
+        pipeline = ParsePipeline(CountingParser(matcher.parser, failing), background=background)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield make
+    for pipeline in pipelines:
+        pipeline.shutdown()
+
+
+def test_uploads_are_parsed_once_in_the_background(make_pipeline, resume_paths):
+    pipeline = make_pipeline()
+    for path in resume_paths:
+        pipeline.submit(path)
+
+    records = pipeline.records(resume_paths)
+
+    assert [r['name'] for r in records][:2] == ['Alice Johnson', 'Bob Smith']
+    assert sorted(pipeline.parser.parsed) == resume_paths
+    assert all(os.path.exists(record_path(path)) for path in resume_paths)
+    # A new pipeline (e.g. after a restart) reads the persisted records
+    restarted = make_pipeline()
+    assert restarted.records(resume_paths) == records
+    assert restarted.parser.parsed == []
+
+
+def test_failed_upload_is_reported_and_not_parsed_again(make_pipeline, resume_paths):
+    broken = resume_paths[1]
+    pipeline = make_pipeline(failing=[broken])
+    pipeline.submit(broken).result()
+
+    assert pipeline.records([broken, broken]) == [None, None]
+    assert pipeline.get(broken) is None
+    assert pipeline.parser.parsed == [broken]
+    assert pipeline.error(broken) == 'unreadable'
+
+
+def test_unparsed_files_are_parsed_in_one_batch_on_demand(make_pipeline, resume_paths):
+    broken = resume_paths[2]
+    pipeline = make_pipeline(failing=[broken], background=False)
+    assert pipeline.submit(resume_paths[0]) is None
+
+    first = pipeline.records(resume_paths)
+    second = pipeline.records(resume_paths)
+
+    assert first[2] is None and second[2] is None
+    assert second == first
+    assert pipeline.parser.parsed == resume_paths
+    assert pipeline.error(broken) == 'Could not parse resume'
+
+
+def test_records_from_another_parser_version_are_ignored(make_pipeline, resume_paths, monkeypatch):
+    pipeline = make_pipeline(background=False)
+    pipeline.records(resume_paths[:1])
+
+    monkeypatch.setattr(CountingParser, 'version', 'newer')
+
+    assert pipeline.load(resume_paths[0]) is None
+    assert pipeline.records(resume_paths[:1])[0]['name'] == 'Alice Johnson'
+    assert pipeline.parser.parsed == resume_paths[:1] * 2
+
+
+def test_match_reports_resumes_that_could_not_be_parsed(client):
+    filenames = []
+    uploads = (('alice.txt', RESUMES['alice'].encode('utf-8')), ('scan.pdf', b'%PDF-1.4 garbage'))
+    for name, content in uploads:
+        response = client.post('/api/upload', data={'file': (io.BytesIO(content), name)})
+        filenames.append(response.get_json()['filename'])
+
+    response = client.post('/api/match', json={'job_description': JOB_DESCRIPTION, 'filenames': filenames})
+
+    data = response.get_json()
+    assert [m['name'] for m in data['results']] == ['Alice Johnson']
+    assert data['unparsed'] == [filenames[1]]
@@ -0,0 +1,46 @@
+"""Cold start: heavy libraries load lazily, warm-up loads them up front."""
+
+import os
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('sklearn', 'scipy', 'numpy', 'spacy', 'pypdfium2', 'PyPDF2', 'pdfplumber', 'docx')
+
+
+def loaded_after(statement, cwd):
+    """Heavy modules present in sys.modules after running statement in a fresh interpreter."""
+    code = (
+        f"import sys; sys.path.insert(0, {REPO!r})\n"
+        f"{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=str(cwd), capture_output=True, text=True, check=True
+    ).stdout
+    return set(filter(None, output.strip().split(',')))
+
+
+def test_importing_the_app_loads_no_heavy_libraries(tmp_path):
+    assert loaded_after('import app', tmp_path) == set()
+    assert loaded_after('import resume_matcher', tmp_path) == set()
+
+
+def test_module_warmup_imports_the_backends(tmp_path):
+    loaded = loaded_after('import resume_matcher; resume_matcher.warmup()', tmp_path)
+
+    assert 'sklearn' in loaded
+
+
+def test_matcher_warmup_runs_a_first_match(matcher):
+    timings = matcher.warmup()
+
+    assert {'document_backends', 'sklearn', 'spacy', 'first_match'} <= set(timings)
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_warmup_endpoint(client):
+    response = client.post('/api/warmup')
+
+    assert response.status_code == 200
+    assert 'first_match' in response.get_json()['timings_ms']
@@ -0,0 +1,124 @@
+"""Score components: parse-time features, registered scorers and weights."""
+
+import io
+
+import numpy as np
+import pytest
+
+import main
+import scoring
+from conftest import JOB_DESCRIPTION, RESUMES
+from scoring import CandidateMatrix, FeatureScorer, resolve_weights
+
+ONLY = {name: 0 for name in scoring.SCORERS}
+
+
+def ranking(matches):
+    return [(m['name'], m['match_score'], m['skills_match']) for m in matches]
+
+
+class SkillCountScorer(FeatureScorer):
+    """Number of listed skills out of ten, counting how often it encodes."""
+
+    name = 'skill_count'
+
+    def __init__(self):
+        self.encoded = 0
+
+    def encode(self, candidates):
+        self.encoded += 1
+        return np.array([len(c.get('skills', [])) for c in candidates], dtype=np.float64)
+
+    def score(self, matrix, job):
+        return np.minimum(matrix.features[self.name] / 10, 1.0)
+
+
+def test_features_are_extracted_at_parse_time(candidates):
+    by_name = {c['name']: c for c in candidates}
+
+    # 2016 - 2023, and "5 years of experience" matching 2018 - 2023
+    assert by_name['Alice Johnson']['experience_years'] == 7
+    assert by_name['Dave Lee']['experience_years'] == 5
+    # Master's over bachelor's
+    assert by_name['Alice Johnson']['education_level'] > by_name['Dave Lee']['education_level'] > 0
+
+
+def test_experience_is_scored_against_the_job_requirement(matcher, candidates):
+    job = matcher.compile_job(JOB_DESCRIPTION).job_data
+    scores = scoring.SCORERS['experience'].score(CandidateMatrix(candidates), job)
+
+    assert job['experience_required'] == 5
+    # Bob has four of the five years, everyone else at least five
+    assert list(scores) == [1.0, 0.8, 1.0, 1.0, 1.0]
+    assert list(scoring.SCORERS['experience'].score(CandidateMatrix(candidates), {})) == [1.0] * 5
+
+
+def test_call_weights_do_not_change_the_profile(matcher, candidates):
+    profile = matcher.compile_job(JOB_DESCRIPTION)
+    before = ranking(matcher.rank_candidates(profile, candidates, top_n=5))
+
+    skills_only = matcher.rank_candidates(profile, candidates, top_n=5, weights=dict(ONLY, skills=1))
+
+    assert [m['match_score'] for m in skills_only] == [round(m['skills_match'] * 100, 2) for m in skills_only]
+    assert profile.weights == {}
+    assert ranking(matcher.rank_candidates(profile, candidates, top_n=5)) == before
+
+
+def test_zero_semantic_weight_skips_text_similarity(matcher, candidates, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('semantic similarity computed')
+
+    monkeypatch.setattr(matcher, '_calculate_similarities', fail)
+
+    matches = matcher.rank_candidates(
+        matcher.compile_job(JOB_DESCRIPTION), candidates, top_n=5, weights={'semantic': 0}
+    )
+    assert len(matches) == 5
+
+
+def test_registered_scorer_is_encoded_once_per_pool(matcher, candidates, monkeypatch):
+    scorer = SkillCountScorer()
+    monkeypatch.setitem(scoring.SCORERS, scorer.name, scorer)
+    monkeypatch.setitem(scoring.DEFAULT_WEIGHTS, scorer.name, 0.0)
+
+    matches = matcher.rank_candidates(
+        matcher.compile_job(JOB_DESCRIPTION), candidates, top_n=5, weights=dict(ONLY, skill_count=1)
+    )
+
+    assert scorer.encoded == 1
+    expected = sorted(((min(len(c['skills']) / 10, 1.0) * 100, c['name']) for c in candidates), reverse=True)
+    assert [m['match_score'] for m in matches] == pytest.approx([score for score, _ in expected])
+    assert matches[-1]['name'] == 'Carol Diaz' and matches[-1]['match_score'] == 0.0
+
+
+def test_invalid_weights_are_rejected():
+    with pytest.raises(ValueError):
+        resolve_weights({'charisma': 1.0})
+    with pytest.raises(ValueError):
+        resolve_weights({'skills': -1})
+    with pytest.raises(ValueError):
+        resolve_weights(ONLY)
+
+
+def test_cli_weights():
+    assert main.parse_weights('skills=0.5, semantic=0,') == {'skills': 0.5, 'semantic': 0.0}
+    with pytest.raises(ValueError, match='expected name=number'):
+        main.parse_weights('skills')
+    with pytest.raises(ValueError, match='charisma'):
+        main.parse_weights('charisma=1')
+
+
+def test_api_weights(client):
+    data = {'file': (io.BytesIO(RESUMES['alice'].encode('utf-8')), 'alice.txt')}
+    filename = client.post('/api/upload', data=data).get_json()['filename']
+
+    def match(weights):
+        return client.post('/api/match', json={
+            'job_description': JOB_DESCRIPTION, 'filenames': [filename], 'weights': weights
+        })
+
+    result = match(dict(ONLY, skills=1)).get_json()['results'][0]
+    assert result['match_score'] == result['skills_match'] == 100.0
+    assert match({'skills': -1}).status_code == 400
+    assert match({'skills': True}).status_code == 400
+    assert match(ONLY).status_code == 400
@@ -0,0 +1,189 @@
+"""
+Parse-on-upload pipeline.
+
+Uploaded resumes are parsed on a local worker pool as soon as they are
+stored, and the structured record is persisted next to the file as
+".<filename>.parsed.json". Matching then only reads these precomputed
+records, so the user's "match" click costs scoring time only. A file that
+fails to parse gets a failure record instead, so it is reported rather than
+parsed again; anything without a record (uploaded with parsing disabled, or
+parsed by an older parser version) is parsed on demand.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Callable, Dict, List, Optional
+
+RECORD_SUFFIX = '.parsed.json'
+
+
+def record_path(file_path: str) -> str:
+    """Where the parsed record of an uploaded file is stored."""
+    directory, name = os.path.split(file_path)
+    return os.path.join(directory, f".{name}{RECORD_SUFFIX}")
+
+
+class ParsePipeline:
+    """Background parsing of uploads with records persisted beside the files."""
+
+    def __init__(
+        self,
+        parser,
+        workers: int = 2,
+        background: bool = True,
+        on_parsed: Optional[Callable[[List[Dict]], None]] = None
+    ):
+        """
+        Args:
+            parser: ResumeParser used for every upload
+            workers: Threads parsing uploads concurrently
+            background: Parse on submit; when False (e.g. serverless hosts
+                that freeze after responding) files are parsed on demand
+            on_parsed: Called with newly parsed records (e.g. to embed them)
+        """
+        self.parser = parser
+        self.background = background
+        self.on_parsed = on_parsed
+        self._pending: Dict[str, Future] = {}
+        # Re-entrant: a future that is already done runs its callback inline
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='upload-parse')
+
+    def submit(self, file_path: str) -> Optional[Future]:
+        """Queue a newly uploaded file for parsing."""
+        if not self.background:
+            return None
+        with self._lock:
+            future = self._pending.get(file_path)
+            if future is None:
+                future = self._executor.submit(self._parse, file_path)
+                self._pending[file_path] = future
+                future.add_done_callback(lambda _, path=file_path: self._done(path))
+            return future
+
+    def load(self, file_path: str) -> Optional[Dict]:
+        """The persisted record for a file, if parsed by this parser version."""
+        stored = self._load_stored(file_path)
+        if stored is None or 'record' not in stored:
+            return None
+        record = stored['record']
+        record['file_path'] = file_path
+        return record
+
+    def error(self, file_path: str) -> Optional[str]:
+        """Why a file could not be parsed, if it failed under this parser version."""
+        stored = self._load_stored(file_path)
+        return stored.get('error') if stored is not None else None
+
+    def get(self, file_path: str, timeout: Optional[float] = 30.0) -> Optional[Dict]:
+        """Parsed record for one file, waiting for or running its parse if needed."""
+        return self.records([file_path], timeout=timeout)[0]
+
+    def records(self, file_paths: List[str], timeout: Optional[float] = 30.0) -> List[Optional[Dict]]:
+        """
+        Parsed records for uploaded files, in order (None where parsing failed).
+
+        Files still being parsed are waited for (up to timeout each) and
+        precomputed records are read from disk. Files that already failed,
+        or whose parse is still running after the timeout, are None rather
+        than parsed a second time; the rest are parsed in one batch.
+        """
+        results: List[Optional[Dict]] = [None] * len(file_paths)
+        missing = []
+        for i, path in enumerate(file_paths):
+            with self._lock:
+                future = self._pending.get(path)
+            if future is not None:
+                try:
+                    results[i] = future.result(timeout=timeout)
+                except FutureTimeout:
+                    print(f"Timed out waiting for {path} to be parsed")
+                continue
+            # A background parse is persisted before it leaves _pending
+            stored = self._load_stored(path)
+            if stored is None:
+                missing.append(i)
+            elif 'record' in stored:
+                results[i] = stored['record']
+                results[i]['file_path'] = path
+
+        if missing:
+            parsed = self.parser.parse_resumes([file_paths[i] for i in missing])
+            for i, record in zip(missing, parsed):
+                if record is None:
+                    self._persist_failure(file_paths[i], 'Could not parse resume')
+                else:
+                    self._persist(file_paths[i], record)
+                results[i] = record
+            self._notify([record for record in parsed if record is not None])
+        return results
+
+    def discard(self, file_path: str) -> None:
+        """Remove the persisted record of a deleted upload."""
+        try:
+            os.remove(record_path(file_path))
+        except FileNotFoundError:
+            pass
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _parse(self, file_path: str) -> Optional[Dict]:
+        try:
+            record = self.parser.parse_resume(file_path)
+        except Exception as e:
+            print(f"Error parsing {file_path}: {e}")
+            self._persist_failure(file_path, str(e))
+            return None
+        self._persist(file_path, record)
+        self._notify([record])
+        return record
+
+    def _notify(self, records: List[Dict]) -> None:
+        if self.on_parsed is None or not records:
+            return
+        try:
+            self.on_parsed(records)
+        except Exception as e:
+            print(f"Error processing parsed records: {e}")
+
+    def _load_stored(self, file_path: str) -> Optional[Dict]:
+        """The record or failure stored for a file by this parser version."""
+        path = record_path(file_path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Error reading parsed record {path}: {e}")
+            return None
+        if stored.get('parser_version') != self.parser.version:
+            return None
+        return stored
+
+    def _persist(self, file_path: str, record: Dict) -> None:
+        self._write(file_path, {
+            'parser_version': self.parser.version,
+            'record': {k: v for k, v in record.items() if k != 'file_path'}
+        })
+
+    def _persist_failure(self, file_path: str, error: str) -> None:
+        self._write(file_path, {'parser_version': self.parser.version, 'error': error})
+
+    def _write(self, file_path: str, data: Dict) -> None:
+        path = record_path(file_path)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving parsed record {path}: {e}")
+
+    def _done(self, file_path: str) -> None:
+        with self._lock:
+            self._pending.pop(file_path, None)